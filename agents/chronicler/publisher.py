@@ -7,8 +7,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from shared.config_loader import get_integrations_config
-
 
 async def publish(
     generated_paths: dict[str, Path],
@@ -22,18 +20,19 @@ async def publish(
         if path.exists():
             published.append(str(path))
 
+    # Keep the Recommender's knowledge index current without waiting for its rescan.
+    from agents.triage.kb_index import get_index
+    get_index().update_paths(p for p in generated_paths.values() if p.suffix == ".md")
+
     notified = False
     if notify and published:
         try:
-            from integrations.teams import is_configured, send_message
-            if is_configured():
-                file_list = ", ".join(p.suffix for p in generated_paths.values() if p.exists())
-                msg = (
-                    f"📄 New runbook generated for **{cluster_key}**\n"
-                    f"Formats: {file_list}\n"
-                    f"Location: knowledge/generated/"
-                )
-                notified = await send_message(msg)
+            from agents.notify import digest
+            file_list = ", ".join(p.suffix for p in generated_paths.values() if p.exists())
+            notified = await digest.submit(
+                "knowledge", "📄 New runbook generated", cluster_key, "info",
+                f"Formats: {file_list}. Location: knowledge/generated/",
+            )
         except Exception:
             pass
 
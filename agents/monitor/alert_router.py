@@ -6,30 +6,17 @@ import csv
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
-from shared.config_loader import CONFIG_TABLES_DIR, DATA_DIR
+from shared.config_loader import DATA_DIR
+from agents.monitor.maintenance import in_maintenance
 
-MAINTENANCE_WINDOWS_PATH = CONFIG_TABLES_DIR / "maintenance_windows.csv"
 INCIDENTS_CSV = DATA_DIR / "incidents" / "incidents.csv"
 
 REOPEN_WINDOW_HOURS = 24
 
 
 def _in_maintenance_window(service: str) -> bool:
-    if not MAINTENANCE_WINDOWS_PATH.exists():
-        return False
-    now = datetime.now(timezone.utc)
-    with open(MAINTENANCE_WINDOWS_PATH, "r", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            if row.get("service") != service:
-                continue
-            try:
-                start = datetime.fromisoformat(row["start_utc"].replace("Z", "+00:00"))
-                end = datetime.fromisoformat(row["end_utc"].replace("Z", "+00:00"))
-                if start <= now <= end:
-                    return True
-            except (KeyError, ValueError):
-                continue
-    return False
+    """Interval index over maintenance_windows.csv (one-off and cron windows); see maintenance.py."""
+    return in_maintenance(service)
 
 
 def _find_recently_closed(service: str, metric: str) -> dict | None:
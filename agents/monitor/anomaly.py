@@ -0,0 +1,228 @@
+"""
+Streaming anomaly detection (1.1) for alert rules with operator "anomaly".
+Per (service, metric) series: EWMA mean/variance, a fixed-size ring buffer with running sums for a
+rolling z-score, and an EWMA of the step change for rate-of-change spikes. Each update is O(1);
+series are kept in an LRU capped at max_series. State snapshots to data/anomaly/state.json so a
+restart does not lose the learned baselines. Settings: agents.yaml (sentinel.anomaly).
+"""
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from shared.config_loader import DATA_DIR, get_agents_config
+
+SNAPSHOT_PATH = DATA_DIR / "anomaly" / "state.json"
+DEFAULTS = {
+    "alpha": 0.1,
+    "window": 60,
+    "min_samples": 20,
+    "max_series": 10000,
+    "snapshot_seconds": 60,
+}
+# Smallest standard deviation, relative to the mean (absolute below 1): keeps z finite and in
+# proportion to the change on flat series such as `up` or a fixed emitted value.
+SD_FLOOR = 0.01
+
+
+@dataclass
+class AnomalyResult:
+    ewma_z: float
+    rolling_z: float
+    rate_z: float
+    samples: int
+
+    def is_anomaly(self, z: float) -> bool:
+        """Level shift (EWMA and rolling window agree) or an abrupt step."""
+        level = abs(self.ewma_z) >= z and abs(self.rolling_z) >= z
+        return level or abs(self.rate_z) >= z
+
+    def describe(self) -> str:
+        return f"ewma_z={self.ewma_z:.2f} rolling_z={self.rolling_z:.2f} rate_z={self.rate_z:.2f} n={self.samples}"
+
+
+class SeriesState:
+    __slots__ = ("n", "mean", "var", "ring", "pos", "filled", "sum", "sumsq",
+                 "last_value", "last_ts", "rate_mean", "rate_var")
+
+    def __init__(self, window: int):
+        self.n = 0
+        self.mean = 0.0
+        self.var = 0.0
+        self.ring = array("d", [0.0]) * window
+        self.pos = 0
+        self.filled = 0
+        self.sum = 0.0
+        self.sumsq = 0.0
+        self.last_value: Optional[float] = None
+        self.last_ts: Optional[float] = None
+        self.rate_mean = 0.0
+        self.rate_var = 0.0
+
+    def to_dict(self) -> dict:
+        d = {k: getattr(self, k) for k in self.__slots__}
+        d["ring"] = d["ring"].tolist()
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict, window: int) -> "SeriesState":
+        s = cls(window)
+        for k in cls.__slots__:
+            if k in d:
+                setattr(s, k, array("d", d[k]) if k == "ring" else d[k])
+        if len(s.ring) != window:  # window changed in config: restart the rolling part
+            s.ring, s.pos, s.filled, s.sum, s.sumsq = array("d", [0.0]) * window, 0, 0, 0.0, 0.0
+        return s
+
+
+def _z(x: float, mean: float, var: float) -> float:
+    sd = max(math.sqrt(var) if var > 0 else 0.0, SD_FLOOR * max(1.0, abs(mean)))
+    return (x - mean) / sd
+
+
+def _parse_ts(ts: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError, TypeError):
+        return None
+
+
+class AnomalyDetector:
+    def __init__(
+        self,
+        alpha: float = DEFAULTS["alpha"],
+        window: int = DEFAULTS["window"],
+        min_samples: int = DEFAULTS["min_samples"],
+        max_series: int = DEFAULTS["max_series"],
+        snapshot_path: Optional[Path] = SNAPSHOT_PATH,
+        snapshot_seconds: float = DEFAULTS["snapshot_seconds"],
+    ):
+        self.alpha = alpha
+        self.window = max(2, int(window))
+        self.min_samples = max(2, int(min_samples))
+        self.max_series = max(1, int(max_series))
+        self.snapshot_path = snapshot_path
+        self.snapshot_seconds = snapshot_seconds
+        self._series: OrderedDict[tuple[str, str], SeriesState] = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_snapshot = time.monotonic()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def _state(self, key: tuple[str, str]) -> SeriesState:
+        s = self._series.get(key)
+        if s is None:
+            s = self._series[key] = SeriesState(self.window)
+            while len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+        else:
+            self._series.move_to_end(key)
+        return s
+
+    def update(self, service: str, metric: str, value: float, timestamp: str = "") -> AnomalyResult:
+        """Score value against the series baseline, then fold it in. Scores are 0 during warm-up."""
+        x = float(value)
+        ts = _parse_ts(timestamp) or time.time()
+        with self._lock:
+            s = self._state((service, metric))
+            warm = s.n >= self.min_samples
+            ewma_z = rolling_z = rate_z = 0.0
+            rate = None
+            if s.last_value is not None:
+                dt = max(ts - (s.last_ts or ts), 1.0)
+                rate = (x - s.last_value) / dt
+            if warm:
+                ewma_z = _z(x, s.mean, s.var)
+                k = s.filled
+                r_mean = s.sum / k
+                r_var = max(s.sumsq / k - r_mean * r_mean, 0.0)
+                rolling_z = _z(x, r_mean, r_var)
+                if rate is not None:
+                    rate_z = _z(rate, s.rate_mean, s.rate_var)
+            # EWMA mean/variance (West's incremental form)
+            if s.n == 0:
+                s.mean = x
+            else:
+                diff = x - s.mean
+                incr = self.alpha * diff
+                s.mean += incr
+                s.var = (1 - self.alpha) * (s.var + diff * incr)
+            if rate is not None:
+                rdiff = rate - s.rate_mean
+                rincr = self.alpha * rdiff
+                s.rate_mean += rincr
+                s.rate_var = (1 - self.alpha) * (s.rate_var + rdiff * rincr)
+            # Ring buffer with running sums
+            old = s.ring[s.pos]
+            if s.filled == self.window:
+                s.sum -= old
+                s.sumsq -= old * old
+            else:
+                s.filled += 1
+            s.ring[s.pos] = x
+            s.sum += x
+            s.sumsq += x * x
+            s.pos = (s.pos + 1) % self.window
+            s.n += 1
+            s.last_value, s.last_ts = x, ts
+        self.maybe_snapshot()
+        return AnomalyResult(round(ewma_z, 3), round(rolling_z, 3), round(rate_z, 3), s.n)
+
+    # ── persistence ───────────────────────────────────────────────────
+
+    def snapshot(self) -> None:
+        if not self.snapshot_path:
+            return
+        with self._lock:
+            data = {
+                "window": self.window,
+                "series": [[svc, metric, st.to_dict()] for (svc, metric), st in self._series.items()],
+            }
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(self.snapshot_path)
+        self._last_snapshot = time.monotonic()
+
+    def maybe_snapshot(self) -> None:
+        if self.snapshot_path and time.monotonic() - self._last_snapshot >= self.snapshot_seconds:
+            self.snapshot()
+
+    def load(self) -> int:
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return 0
+        try:
+            data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return 0
+        for svc, metric, st in data.get("series", [])[-self.max_series:]:
+            self._series[(svc, metric)] = SeriesState.from_dict(st, self.window)
+        return len(self._series)
+
+
+_detector: Optional[AnomalyDetector] = None
+
+
+def get_detector() -> AnomalyDetector:
+    """Process-wide detector; restores the last snapshot on first use."""
+    global _detector
+    if _detector is None:
+        cfg = {**DEFAULTS, **(get_agents_config().get("agents", {}).get("sentinel", {}).get("anomaly") or {})}
+        _detector = AnomalyDetector(
+            alpha=float(cfg["alpha"]),
+            window=int(cfg["window"]),
+            min_samples=int(cfg["min_samples"]),
+            max_series=int(cfg["max_series"]),
+            snapshot_seconds=float(cfg["snapshot_seconds"]),
+        )
+    return _detector
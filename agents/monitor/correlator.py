@@ -1,6 +1,9 @@
 """
 Correlator (5.C): detect similar open incidents and group under a parent (master) ticket.
-Similarity: same service + overlapping metric type within a configurable time window.
+Similarity: same service + MinHash/LSH Jaccard over summary (and context metric) within a
+configurable time window. Threshold, num_perm and bands in agents.yaml (sentinel.correlation_*).
+Topology (shared/topology.py): open incidents on upstream/downstream services in the window are
+grouped too, with the most upstream incident as the master.
 When >= 2 similar open incidents exist without a parent, create a parent incident in SNOW.
 """
 from __future__ import annotations
@@ -10,11 +13,16 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
 
-from shared.config_loader import DATA_DIR
+from shared.config_loader import DATA_DIR, get_agents_config
+from shared.minhash import LSHIndex, MinHasher, shingles
+from shared.topology import get_topology
 from shared import audit
 
 INCIDENTS_CSV = DATA_DIR / "incidents" / "incidents.csv"
 CORRELATION_WINDOW_MINUTES = 30
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
 
 
 def _load_open_incidents() -> list[dict]:
@@ -24,8 +32,87 @@ def _load_open_incidents() -> list[dict]:
         return [r for r in csv.DictReader(f) if (r.get("status") or "open").lower() != "closed"]
 
 
+def _features(summary: str, context: Optional[dict] = None) -> set[str]:
+    metric = (context or {}).get("metric")
+    return shingles(summary, [f"metric={metric}"] if metric else [])
+
+
+class OpenIncidentIndex:
+    """LSH index over open incidents. Kept in sync with incidents.csv by mtime: only rows that
+    appeared, changed summary or closed are re-hashed, so a lookup never scans every incident."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.lsh = LSHIndex(num_perm, bands)
+        self.rows: dict[str, dict] = {}
+        self.by_service: dict[str, list[str]] = {}
+        self._contexts: dict[str, dict] = {}
+        self._mtime_ns = -1
+
+    def sync(self) -> None:
+        mtime_ns = INCIDENTS_CSV.stat().st_mtime_ns if INCIDENTS_CSV.exists() else 0
+        if mtime_ns == self._mtime_ns:
+            return
+        self._mtime_ns = mtime_ns
+        current = {r["incident_id"]: r for r in _load_open_incidents() if r.get("incident_id")}
+        for inc_id in set(self.rows) - set(current):
+            self.lsh.remove(inc_id)
+            self._contexts.pop(inc_id, None)
+        for inc_id, row in current.items():
+            old = self.rows.get(inc_id)
+            if old is None or old.get("summary") != row.get("summary"):
+                self.lsh.add(inc_id, self.hasher.signature(_features(row.get("summary", ""), self._contexts.get(inc_id))))
+        self.rows = current
+        self.by_service = {}
+        for inc_id, row in current.items():
+            self.by_service.setdefault(row.get("service", "").lower(), []).append(inc_id)
+
+    def index(self, incident_id: str, summary: str, context: Optional[dict] = None) -> None:
+        """(Re)hash one incident with its context (the CSV row carries no metric)."""
+        if context:
+            self._contexts[incident_id] = context
+        self.lsh.add(incident_id, self.hasher.signature(_features(summary, context)))
+
+    def similar(self, service: str, summary: str, context: Optional[dict] = None, exclude_id: str = "") -> list[tuple[dict, float]]:
+        """Open incidents on the same service at or above the Jaccard threshold, best first."""
+        self.sync()
+        sig = self.lsh.signature_of(exclude_id) if exclude_id and context is None else None
+        if sig is None:
+            sig = self.hasher.signature(_features(summary, context))
+        out = []
+        for inc_id, score in self.lsh.query(sig, self.threshold):
+            row = self.rows.get(inc_id)
+            if inc_id == exclude_id or row is None:
+                continue
+            if row.get("service", "").lower() != service.lower():
+                continue
+            out.append((row, score))
+        return out
+
+    def on_services(self, services, exclude_id: str = "") -> list[dict]:
+        """Open incidents on any of the given services (no text similarity)."""
+        self.sync()
+        return [self.rows[i] for s in services for i in self.by_service.get(s, ()) if i != exclude_id]
+
+
+_index: Optional[OpenIncidentIndex] = None
+
+
+def get_open_index() -> OpenIncidentIndex:
+    global _index
+    if _index is None:
+        cfg = get_agents_config().get("agents", {}).get("sentinel", {})
+        _index = OpenIncidentIndex(
+            threshold=float(cfg.get("correlation_threshold", DEFAULT_THRESHOLD)),
+            num_perm=int(cfg.get("correlation_num_perm", DEFAULT_NUM_PERM)),
+            bands=int(cfg.get("correlation_bands", DEFAULT_BANDS)),
+        )
+    return _index
+
+
 def _extract_metric_type(summary: str) -> str:
-    """Extract a rough metric keyword from the summary for grouping."""
+    """Rough metric keyword from the summary; only used to label parent tickets."""
     s = summary.lower()
     for kw in ("cpu", "memory", "error", "latency", "down", "unavailable"):
         if kw in s:
@@ -45,38 +132,48 @@ def find_similar_open(
     service: str,
     summary: str,
     exclude_id: str = "",
+    context: Optional[dict] = None,
 ) -> list[dict]:
-    """Find open incidents with the same service and overlapping theme within the time window."""
-    target_metric = _extract_metric_type(summary)
-    matches = []
-    for inc in _load_open_incidents():
-        if inc.get("incident_id") == exclude_id:
-            continue
-        if inc.get("service", "").lower() != service.lower():
-            continue
-        inc_metric = _extract_metric_type(inc.get("summary", ""))
-        if inc_metric != target_metric:
-            continue
-        if not _is_recent(inc.get("timestamp", "")):
-            continue
-        matches.append(inc)
-    return matches
-
-
-def get_existing_parent(service: str, summary: str) -> Optional[dict]:
-    """Check if any open incident is already a parent for this service + theme."""
-    target_metric = _extract_metric_type(summary)
-    for inc in _load_open_incidents():
-        if inc.get("service", "").lower() != service.lower():
-            continue
-        if _extract_metric_type(inc.get("summary", "")) != target_metric:
-            continue
-        pid = (inc.get("parent_incident_id") or "").strip()
-        if pid == "SELF":
+    """Find open incidents on the same service with similar summaries within the time window."""
+    return [
+        inc for inc, _ in get_open_index().similar(service, summary, context, exclude_id)
+        if _is_recent(inc.get("timestamp", ""))
+    ]
+
+
+def find_related_open(service: str, exclude_id: str = "") -> list[dict]:
+    """Open incidents on upstream/downstream services (per topology) within the time window."""
+    related = get_topology().related_services(service)
+    if not related:
+        return []
+    return [
+        inc for inc in get_open_index().on_services(related, exclude_id)
+        if _is_recent(inc.get("timestamp", ""))
+    ]
+
+
+def get_existing_parent(service: str, summary: str, context: Optional[dict] = None, exclude_id: str = "") -> Optional[dict]:
+    """Check if any similar open incident on this service, or any recent open incident on a
+    dependent/dependency service, is already a parent."""
+    for inc, _ in get_open_index().similar(service, summary, context, exclude_id):
+        if (inc.get("parent_incident_id") or "").strip() == "SELF":
+            return inc
+    for inc in find_related_open(service, exclude_id):
+        if (inc.get("parent_incident_id") or "").strip() == "SELF":
             return inc
     return None
 
 
+def _most_upstream(members: list[dict]) -> dict:
+    """First member whose service depends on no other member's service."""
+    topo = get_topology()
+    services = {(m.get("service") or "").lower() for m in members}
+    for m in members:
+        if not (topo.upstream(m.get("service") or "") & services):
+            return m
+    return members[0]
+
+
 def mark_as_parent(incident_id: str) -> None:
     """Set parent_incident_id=SELF on an incident row to mark it as a master ticket."""
     _update_field(incident_id, "parent_incident_id", "SELF")
@@ -129,10 +226,14 @@ async def correlate_and_group(
     service: str,
     summary: str,
     severity: str,
+    context: Optional[dict] = None,
 ) -> Optional[dict]:
     """Main entry: check for similar incidents. If enough exist, create or find a parent.
     Returns {parent_incident_id, parent_ticket_number, created_new_parent} or None."""
-    existing_parent = get_existing_parent(service, summary)
+    index = get_open_index()
+    index.sync()
+    index.index(incident_id, summary, context)
+    existing_parent = get_existing_parent(service, summary, context, exclude_id=incident_id)
     if existing_parent:
         parent_id = existing_parent.get("incident_id", "")
         parent_ticket = existing_parent.get("ticket_number", "")
@@ -143,19 +244,24 @@ async def correlate_and_group(
             "created_new_parent": False,
         }
 
-    similar = find_similar_open(service, summary, exclude_id=incident_id)
+    similar = find_similar_open(service, summary, exclude_id=incident_id, context=context)
+    seen = {s["incident_id"] for s in similar}
+    similar += [r for r in find_related_open(service, exclude_id=incident_id) if r["incident_id"] not in seen]
     if len(similar) < 1:
         return None
 
     from integrations import servicenow
     parent_ticket_number = ""
     parent_sys_id = ""
+    members = similar + [{"incident_id": incident_id, "service": service}]
+    root = _most_upstream(members)
+    services = ", ".join(dict.fromkeys((m.get("service") or "") for m in [root, *members]))
 
     if servicenow.is_configured():
         theme = _extract_metric_type(summary)
-        parent_desc = f"Multiple related incidents for {service}: {theme}"
+        parent_desc = f"Multiple related incidents for {services}: {theme}"
         result = await servicenow.create_incident(
-            short_description=f"[PARENT] Multiple incidents: {theme} on {service}",
+            short_description=f"[PARENT] Multiple incidents: {theme} on {services}",
             description=parent_desc,
             urgency="1",
             impact="1",
@@ -166,20 +272,16 @@ async def correlate_and_group(
             parent_sys_id = result.get("sys_id", "")
             parent_ticket_number = result.get("number", "")
 
-    parent_inc_id = f"parent_{incident_id}"
-    if similar:
-        first_similar = similar[0]
-        mark_as_parent(first_similar["incident_id"])
-        parent_inc_id = first_similar["incident_id"]
-        if parent_ticket_number:
-            _update_field(parent_inc_id, "parent_ticket_number", parent_ticket_number)
-            _update_field(parent_inc_id, "ticket_number", parent_ticket_number)
-            _update_field(parent_inc_id, "ticket_id", parent_sys_id)
-
-    set_parent(incident_id, parent_inc_id, parent_ticket_number)
-    for s in similar:
-        if s.get("incident_id") != parent_inc_id:
-            set_parent(s["incident_id"], parent_inc_id, parent_ticket_number)
+    parent_inc_id = root["incident_id"]
+    mark_as_parent(parent_inc_id)
+    if parent_ticket_number:
+        _update_field(parent_inc_id, "parent_ticket_number", parent_ticket_number)
+        _update_field(parent_inc_id, "ticket_number", parent_ticket_number)
+        _update_field(parent_inc_id, "ticket_id", parent_sys_id)
+
+    for m in members:
+        if m["incident_id"] != parent_inc_id:
+            set_parent(m["incident_id"], parent_inc_id, parent_ticket_number)
 
     audit.log_simple("correlator", "parent_created", parent_ticket_number or parent_inc_id, "success")
 
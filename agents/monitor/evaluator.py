@@ -1,14 +1,124 @@
 """
 Evaluator (Phase 1.1): apply threshold rules from config/tables/alert_rules.csv.
+Operator "anomaly" uses the streaming detector (anomaly.py); threshold is then the z-score.
+Optional columns make a breach count only when it persists:
+- for_seconds: the condition has held continuously for N seconds
+- min_breaches / window_samples: at least M of the last K samples breached
+- rate_window_seconds: compare the rate of change (per second) over the window instead of the value
+Rules are compiled once and recompiled when the CSV changes; per-series state is O(1) per sample.
 Output: "alert" or "no alert".
 """
 import csv
+import operator
+import time
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Optional
 
 from shared.schema import MonitoringEvent
 from shared.config_loader import CONFIG_TABLES_DIR
+from agents.monitor.anomaly import _parse_ts, get_detector
 
 ALERT_RULES_PATH = CONFIG_TABLES_DIR / "alert_rules.csv"
+MAX_SERIES = 10000
+
+_OPS: dict[str, tuple[Callable[[float, float], bool], str]] = {
+    "gt": (operator.gt, ">"),
+    "gte": (operator.ge, ">="),
+    "lt": (operator.lt, "<"),
+    "lte": (operator.le, "<="),
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    rule_id: str
+    service: str
+    metric: str
+    op: str
+    threshold: float
+    for_seconds: float = 0.0
+    min_breaches: int = 0
+    window_samples: int = 0
+    rate_window_seconds: float = 0.0
+
+    @property
+    def stateful(self) -> bool:
+        return bool(self.for_seconds or self.window_samples or self.rate_window_seconds)
+
+
+class _SeriesState:
+    """Sliding-window state for one (rule, service, metric)."""
+    __slots__ = ("breach_since", "bits", "pos", "count", "seen", "samples")
+
+    def __init__(self, window_samples: int):
+        self.breach_since: Optional[float] = None
+        self.bits = array("b", [0]) * max(window_samples, 1)
+        self.pos = 0
+        self.count = 0
+        self.seen = 0
+        self.samples: deque = deque()  # (ts, value) within rate_window_seconds
+
+    def push_breach(self, breached: bool) -> None:
+        self.count += int(breached) - self.bits[self.pos]
+        self.bits[self.pos] = int(breached)
+        self.pos = (self.pos + 1) % len(self.bits)
+        self.seen = min(self.seen + 1, len(self.bits))
+
+
+def _num(row: dict, key: str, cast=float, default=0):
+    raw = (row.get(key) or "").strip()
+    try:
+        return cast(float(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def _compile(rows: list[dict]) -> dict[tuple[str, str], list[Rule]]:
+    compiled: dict[tuple[str, str], list[Rule]] = {}
+    for i, row in enumerate(rows):
+        if (row.get("enabled") or "true").strip().lower() != "true":
+            continue
+        op = (row.get("operator") or "gt").strip().lower()
+        if op not in _OPS and op != "anomaly":
+            continue
+        try:
+            threshold = float(row["threshold"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        window = _num(row, "window_samples", int)
+        rule = Rule(
+            rule_id=row.get("rule_id") or f"row_{i}",
+            service=row.get("service") or "",
+            metric=row.get("metric") or "",
+            op=op,
+            threshold=threshold,
+            for_seconds=_num(row, "for_seconds"),
+            min_breaches=min(_num(row, "min_breaches", int), window) if window else 0,
+            window_samples=window,
+            rate_window_seconds=_num(row, "rate_window_seconds"),
+        )
+        compiled.setdefault((rule.service, rule.metric), []).append(rule)
+    return compiled
+
+
+class _Rules:
+    def __init__(self):
+        self._mtime_ns = -1
+        self._by_series: dict[tuple[str, str], list[Rule]] = {}
+
+    def for_series(self, service: str, metric: str) -> list[Rule]:
+        mtime_ns = ALERT_RULES_PATH.stat().st_mtime_ns if ALERT_RULES_PATH.exists() else 0
+        if mtime_ns != self._mtime_ns:
+            self._by_series = _compile(_load_rules())
+            self._mtime_ns = mtime_ns
+        return self._by_series.get((service, metric), [])
+
+
+_rules = _Rules()
+_state: OrderedDict[tuple[str, str, str], _SeriesState] = OrderedDict()
 
 
 def _load_rules() -> list[dict]:
@@ -18,25 +128,80 @@ def _load_rules() -> list[dict]:
         return list(csv.DictReader(f))
 
 
+def _series_state(rule: Rule) -> _SeriesState:
+    key = (rule.rule_id, rule.service, rule.metric)
+    st = _state.get(key)
+    if st is None:
+        st = _state[key] = _SeriesState(rule.window_samples)
+        while len(_state) > MAX_SERIES:
+            _state.popitem(last=False)
+    else:
+        _state.move_to_end(key)
+    return st
+
+
+def _check(rule: Rule, event: MonitoringEvent, ts: float) -> tuple[bool, str]:
+    """(alert, reason). Reason is also set for a breach that is not yet persistent."""
+    cmp, sym = _OPS[rule.op]
+    value, label = event.value, f"{event.metric} {event.value}"
+    if not rule.stateful:
+        fired = cmp(value, rule.threshold)
+        return fired, f"{label} {sym} {rule.threshold}" if fired else ""
+
+    st = _series_state(rule)
+    if rule.rate_window_seconds:
+        st.samples.append((ts, value))
+        while len(st.samples) > 1 and ts - st.samples[0][0] > rule.rate_window_seconds:
+            st.samples.popleft()
+        t0, v0 = st.samples[0]
+        if ts - t0 <= 0:
+            return False, ""
+        value = (value - v0) / (ts - t0)
+        label = f"{event.metric} rate {value:.4g}/s over {ts - t0:.0f}s"
+    breached = cmp(value, rule.threshold)
+
+    if breached and st.breach_since is None:
+        st.breach_since = ts
+    elif not breached:
+        st.breach_since = None
+    if rule.window_samples:
+        st.push_breach(breached)
+    if not breached:
+        return False, ""
+
+    reason = f"{label} {sym} {rule.threshold}"
+    held = ts - st.breach_since
+    if rule.for_seconds and held < rule.for_seconds:
+        return False, f"{reason} — pending: held {held:.0f}s of {rule.for_seconds:g}s ({rule.rule_id})"
+    if rule.window_samples and st.count < (rule.min_breaches or rule.window_samples):
+        return False, (f"{reason} — pending: {st.count} of last {st.seen} samples breached, "
+                       f"need {rule.min_breaches or rule.window_samples} of {rule.window_samples} ({rule.rule_id})")
+    if rule.for_seconds:
+        reason += f" for {held:.0f}s"
+    if rule.window_samples:
+        reason += f" ({st.count} of last {rule.window_samples} samples)"
+    return True, reason
+
+
 def evaluate(event: MonitoringEvent) -> tuple[str, str | None]:
     """
-    Apply rules. Return ("alert", reason) or ("no_alert", None).
+    Apply rules. Return ("alert", reason) or ("no_alert", None / reason for a pending breach).
+    Every matching rule sees every sample so sliding-window state stays current.
     """
-    rules = _load_rules()
-    for row in rules:
-        if row.get("enabled", "true").lower() != "true":
-            continue
-        if row.get("service") != event.service or row.get("metric") != event.metric:
-            continue
-        try:
-            threshold = float(row["threshold"])
-        except (KeyError, ValueError):
+    ts = _parse_ts(event.timestamp) or time.time()
+    alert_reason: Optional[str] = None
+    pending: Optional[str] = None
+    for rule in _rules.for_series(event.service, event.metric):
+        if rule.op == "anomaly":
+            result = get_detector().update(event.service, event.metric, event.value, event.timestamp)
+            if result.is_anomaly(rule.threshold) and alert_reason is None:
+                alert_reason = f"{event.metric} {event.value} anomalous (|z| >= {rule.threshold}): {result.describe()}"
             continue
-        op = row.get("operator", "gt").strip().lower()
-        if op == "gt" and event.value > threshold:
-            return "alert", f"{event.metric} {event.value} > {threshold}"
-        if op == "gte" and event.value >= threshold:
-            return "alert", f"{event.metric} {event.value} >= {threshold}"
-        if op == "lt" and event.value < threshold:
-            return "alert", f"{event.metric} {event.value} < {threshold}"
-    return "no_alert", None
+        fired, reason = _check(rule, event, ts)
+        if fired and alert_reason is None:
+            alert_reason = reason
+        elif reason and not fired and pending is None:
+            pending = reason
+    if alert_reason:
+        return "alert", alert_reason
+    return "no_alert", pending
@@ -12,6 +12,8 @@ from shared import audit
 
 INCIDENTS_DIR = DATA_DIR / "incidents"
 INCIDENTS_CSV = INCIDENTS_DIR / "incidents.csv"
+# incident_id -> run_id of the pipeline run that created it (read API run links; no trace scan)
+INCIDENT_RUNS_CSV = INCIDENTS_DIR / "incident_runs.csv"
 
 
 def _ensure_incidents_dir():
@@ -56,8 +58,9 @@ def create_incident(
     severity: str | None = None,
     metric: str = "",
     value: float = 0,
+    run_id: str = "",
 ) -> Incident:
-    """Create incident and append to incidents CSV."""
+    """Create incident and append to incidents CSV (and to the incident -> run index when run_id is given)."""
     _ensure_incidents_dir()
     incident_id = f"inc_{uuid.uuid4().hex[:12]}"
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -88,6 +91,13 @@ def create_incident(
         if not file_exists:
             w.writeheader()
         w.writerow(row)
+    if run_id:
+        runs_exist = INCIDENT_RUNS_CSV.exists()
+        with open(INCIDENT_RUNS_CSV, "a", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            if not runs_exist:
+                w.writerow(["incident_id", "run_id"])
+            w.writerow([incident_id, run_id])
     audit.log_simple("sentinel", "incident_created", incident_id, "success")
     return incident
 
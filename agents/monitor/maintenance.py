@@ -0,0 +1,214 @@
+"""
+Maintenance windows (1.2): per-service sorted interval index over config/tables/maintenance_windows.csv.
+One-off rows use start_utc/end_utc. Recurring rows set cron (5-field, UTC) + duration_minutes;
+start_utc/end_utc then optionally bound when the schedule is active. service "*" applies to all.
+Recurring windows are expanded lazily for a rolling horizon around the query time. The CSV is
+re-read only when its mtime changes; a membership check is a bisect over merged intervals.
+The orchestrator validates the table strictly at startup; at runtime an invalid row (e.g. mid-edit)
+is skipped and audited rather than failing every alert that checks maintenance.
+"""
+from __future__ import annotations
+
+import bisect
+import csv
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from shared import audit
+from shared.config_loader import CONFIG_TABLES_DIR
+
+MAINTENANCE_WINDOWS_PATH = CONFIG_TABLES_DIR / "maintenance_windows.csv"
+WILDCARD = "*"
+HORIZON_SECONDS = 24 * 3600
+RELOAD_CHECK_SECONDS = 1.0
+_CRON_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_iso(s: str) -> Optional[float]:
+    s = (s or "").strip()
+    if not s:
+        return None
+    return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
+
+
+def _cron_field(spec: str, lo: int, hi: int) -> frozenset:
+    values: set[int] = set()
+    for part in spec.split(","):
+        step = 1
+        if "/" in part:
+            part, step_s = part.split("/", 1)
+            step = int(step_s)
+        if part == "*":
+            a, b = lo, hi
+        elif "-" in part:
+            a, b = (int(x) for x in part.split("-", 1))
+        else:
+            a = b = int(part)
+        if a < lo or b > hi or a > b or step < 1:
+            raise ValueError(f"cron field '{spec}' out of range {lo}-{hi}")
+        values.update(range(a, b + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """minute hour day-of-month month day-of-week (0 or 7 = Sunday), UTC."""
+
+    def __init__(self, expr: str):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron '{expr}' must have 5 fields")
+        self.minutes, self.hours, self.days, self.months, dows = (
+            _cron_field(spec, lo, hi) for spec, (lo, hi) in zip(parts, _CRON_RANGES)
+        )
+        self.dows = frozenset(d % 7 for d in dows)
+        self._dom_any = parts[2] == "*"
+        self._dow_any = parts[4] == "*"
+
+    def _day_matches(self, d: datetime) -> bool:
+        if d.month not in self.months:
+            return False
+        dom_ok = d.day in self.days
+        dow_ok = (d.isoweekday() % 7) in self.dows
+        if self._dom_any or self._dow_any:
+            return dom_ok and dow_ok
+        return dom_ok or dow_ok  # standard cron: either restriction may match
+
+    def starts_between(self, start: float, end: float) -> list[float]:
+        """Occurrence start times in [start, end)."""
+        out = []
+        day = datetime.fromtimestamp(start, timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        while day.timestamp() < end:
+            if self._day_matches(day):
+                for h in sorted(self.hours):
+                    for m in sorted(self.minutes):
+                        t = day.timestamp() + h * 3600 + m * 60
+                        if start <= t < end:
+                            out.append(t)
+            day += timedelta(days=1)
+        return out
+
+
+class _Recurring:
+    __slots__ = ("service", "schedule", "duration", "active_from", "active_until")
+
+    def __init__(self, service, schedule, duration, active_from, active_until):
+        self.service, self.schedule, self.duration = service, schedule, duration
+        self.active_from, self.active_until = active_from, active_until
+
+
+def _merge(intervals: list[tuple[float, float]]) -> tuple[list[float], list[float]]:
+    starts: list[float] = []
+    ends: list[float] = []
+    for s, e in sorted(intervals):
+        if starts and s <= ends[-1]:
+            ends[-1] = max(ends[-1], e)
+        else:
+            starts.append(s)
+            ends.append(e)
+    return starts, ends
+
+
+def load_windows(
+    path=MAINTENANCE_WINDOWS_PATH, skipped: Optional[list[str]] = None,
+) -> tuple[dict[str, list[tuple[float, float]]], list[_Recurring]]:
+    """Parse and validate the table. Raises ValueError naming the bad row, or, given a skipped
+    list, appends the error there and leaves the row out."""
+    fixed: dict[str, list[tuple[float, float]]] = {}
+    recurring: list[_Recurring] = []
+    if not path.exists():
+        return fixed, recurring
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            wid = row.get("window_id") or "?"
+            service = (row.get("service") or "").strip()
+            if not service:
+                continue
+            try:
+                start, end = _parse_iso(row.get("start_utc")), _parse_iso(row.get("end_utc"))
+                cron = (row.get("cron") or "").strip()
+                if cron:
+                    duration = float(row.get("duration_minutes") or 0) * 60
+                    if duration <= 0:
+                        raise ValueError("duration_minutes must be > 0 for a cron window")
+                    recurring.append(_Recurring(service, CronSchedule(cron), duration, start, end))
+                elif start is not None and end is not None:
+                    fixed.setdefault(service, []).append((start, end))
+            except (TypeError, ValueError) as e:
+                if skipped is None:
+                    raise ValueError(f"maintenance window '{wid}': {e}") from e
+                skipped.append(f"maintenance window '{wid}': {e}")
+    return fixed, recurring
+
+
+class MaintenanceIndex:
+    def __init__(self):
+        self._mtime_ns = -1
+        self._fixed: dict[str, list[tuple[float, float]]] = {}
+        self._recurring: list[_Recurring] = []
+        self._index: dict[str, tuple[list[float], list[float]]] = {}
+        self._horizon = (0.0, 0.0)
+        self._dirty = True
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def _reload_if_changed(self) -> None:
+        now = time.monotonic()
+        if self._mtime_ns != -1 and now - self._checked < RELOAD_CHECK_SECONDS:
+            return
+        self._checked = now
+        mtime_ns = MAINTENANCE_WINDOWS_PATH.stat().st_mtime_ns if MAINTENANCE_WINDOWS_PATH.exists() else 0
+        if mtime_ns == self._mtime_ns:
+            return
+        skipped: list[str] = []
+        self._fixed, self._recurring = load_windows(skipped=skipped)
+        for error in skipped:
+            audit.log_comprehensive("sentinel", "maintenance_window_skipped", MAINTENANCE_WINDOWS_PATH.name,
+                                    "invalid", error_message=error)
+        self._mtime_ns = mtime_ns
+        self._dirty = True
+
+    def _rebuild(self, at: float) -> None:
+        """Expand recurring windows over [at - longest duration, at + HORIZON_SECONDS)."""
+        lookback = max((r.duration for r in self._recurring), default=0.0)
+        lo, hi = at - lookback, at + HORIZON_SECONDS
+        per_service = {svc: list(iv) for svc, iv in self._fixed.items()}
+        for r in self._recurring:
+            for s in r.schedule.starts_between(lo, hi):
+                if (r.active_from is None or s >= r.active_from) and (r.active_until is None or s < r.active_until):
+                    per_service.setdefault(r.service, []).append((s, s + r.duration))
+        self._index = {svc: _merge(iv) for svc, iv in per_service.items()}
+        self._horizon = (at, hi)
+        self._dirty = False
+
+    def contains(self, service: str, at: Optional[float] = None) -> bool:
+        at = time.time() if at is None else at
+        with self._lock:
+            self._reload_if_changed()
+            if self._dirty or (self._recurring and not (self._horizon[0] <= at < self._horizon[1])):
+                self._rebuild(at)
+            index = self._index
+        for key in (service, WILDCARD):
+            entry = index.get(key)
+            if not entry:
+                continue
+            starts, ends = entry
+            i = bisect.bisect_right(starts, at) - 1
+            if i >= 0 and at <= ends[i]:
+                return True
+        return False
+
+
+_index: Optional[MaintenanceIndex] = None
+
+
+def get_maintenance_index() -> MaintenanceIndex:
+    global _index
+    if _index is None:
+        _index = MaintenanceIndex()
+    return _index
+
+
+def in_maintenance(service: str, at: Optional[float] = None) -> bool:
+    return get_maintenance_index().contains(service, at)
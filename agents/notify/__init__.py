@@ -1,3 +1,4 @@
 from agents.notify.notifier import notify_incident
+from agents.notify.dispatcher import dispatch
 
-__all__ = ["notify_incident"]
+__all__ = ["notify_incident", "dispatch"]
@@ -0,0 +1,192 @@
+"""
+Notification digest (1.4): buffer Teams messages per channel over a configurable window and
+send them as one Adaptive Card built from teams/cards/notification.json.
+Critical severity bypasses the buffer. Window/size from services.yaml (teams.digest_*).
+A buffered message reports QUEUED, not sent. Pending timers are tied to the loop that made them;
+a timer from a finished loop (the UI's per-action asyncio.run) is replaced on the next submit,
+and a timer cancelled by its loop shutting down flushes its buffer before it exits.
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import Awaitable, Callable, Optional
+
+from integrations import teams
+from shared import audit
+from shared.config_loader import get_services_config
+
+BYPASS_SEVERITIES = ("critical", "p1", "1")
+DEFAULT_WINDOW_SECONDS = 30.0
+DEFAULT_MAX_ITEMS = 20
+QUEUED = "queued"
+
+Sender = Callable[[str, dict], Awaitable[bool]]
+
+
+def _item_values(item: dict) -> dict:
+    return {
+        "incident_id": item.get("incident_id", ""),
+        "service": item.get("service", ""),
+        "severity": item.get("severity", ""),
+        "summary": item.get("summary", ""),
+    }
+
+
+def render_card(items: list[dict]) -> dict:
+    """One item: the notification template as-is (title overridden). Several: header + one
+    titled FactSet per item, each filled from the template's FactSet."""
+    template = teams.load_card("notification")
+    body = template.get("body") or []
+    header = next((b for b in body if b.get("type") == "TextBlock"), None)
+    factset = next((b for b in body if b.get("type") == "FactSet"), None)
+
+    if len(items) == 1:
+        card = teams.fill_placeholders(template, _item_values(items[0]))
+        for block in card.get("body") or []:
+            if block.get("type") == "TextBlock" and items[0].get("title"):
+                block["text"] = items[0]["title"]
+                break
+        return card
+
+    card = {k: v for k, v in template.items() if k != "body"}
+    new_body: list[dict] = []
+    if header:
+        head = copy.deepcopy(header)
+        head["text"] = f"{len(items)} notifications"
+        new_body.append(head)
+    for item in items:
+        container: list[dict] = [{
+            "type": "TextBlock",
+            "text": item.get("title") or "Notification",
+            "weight": "bolder",
+            "wrap": True,
+        }]
+        if factset:
+            container.append(teams.fill_placeholders(factset, _item_values(item)))
+        new_body.append({"type": "Container", "separator": True, "items": container})
+    card["body"] = new_body
+    return card
+
+
+def _item_text(item: dict) -> str:
+    sev = item.get("severity") or "info"
+    return f"[{sev}] {item.get('service', '')}: {item.get('summary', '')}"
+
+
+async def _teams_sender(text: str, card: dict) -> bool:
+    return await teams.send_message(text, card=card)
+
+
+class NotificationDigest:
+    """Per-channel buffers; the first message in a window schedules the flush."""
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        sender: Sender = _teams_sender,
+    ):
+        self.window_seconds = window_seconds
+        self.max_items = max(1, max_items)
+        self.sender = sender
+        self._buffers: dict[str, list[dict]] = {}
+        self._timers: dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = asyncio.Lock()
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        for channel, timer in list(self._timers.items()):
+            if timer.done() or timer.get_loop() is not loop:
+                del self._timers[channel]
+
+    async def submit(self, channel: str, item: dict) -> bool | str:
+        """Queue one message (dict with title, incident_id, service, severity, summary).
+        Returns QUEUED when buffered, or the send result (bool) when sent now."""
+        sev = (item.get("severity") or "").strip().lower()
+        if sev in BYPASS_SEVERITIES or self.window_seconds <= 0:
+            return await self._send(channel, [item])
+        self._bind_loop()
+        async with self._lock:
+            buf = self._buffers.setdefault(channel, [])
+            buf.append(item)
+            if len(buf) >= self.max_items:
+                items = self._take(channel)
+            else:
+                items = None
+                if channel not in self._timers:
+                    self._timers[channel] = asyncio.create_task(self._flush_later(channel))
+        if items:
+            return await self._send(channel, items)
+        return QUEUED
+
+    def pending(self, channel: Optional[str] = None) -> int:
+        if channel is not None:
+            return len(self._buffers.get(channel, []))
+        return sum(len(b) for b in self._buffers.values())
+
+    async def flush(self, channel: str) -> bool:
+        self._bind_loop()
+        async with self._lock:
+            items = self._take(channel)
+        return await self._send(channel, items) if items else True
+
+    async def flush_all(self) -> None:
+        for channel in list(self._buffers):
+            await self.flush(channel)
+
+    def _take(self, channel: str) -> list[dict]:
+        timer = self._timers.pop(channel, None)
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+        return self._buffers.pop(channel, [])
+
+    async def _flush_later(self, channel: str) -> None:
+        try:
+            await asyncio.sleep(self.window_seconds)
+        except asyncio.CancelledError:
+            # _take() pops the timer before cancelling it; still registered means the loop is closing.
+            if self._timers.get(channel) is not asyncio.current_task():
+                return
+        await self.flush(channel)
+
+    async def _send(self, channel: str, items: list[dict]) -> bool:
+        text = _item_text(items[0]) if len(items) == 1 else f"{len(items)} notifications ({channel})"
+        try:
+            ok = await self.sender(text, render_card(items))
+        except Exception:
+            ok = False
+        audit.log_simple("notifier", "teams_digest_sent", f"{channel}:{len(items)}", "success" if ok else "failed")
+        return ok
+
+
+_digest: Optional[NotificationDigest] = None
+
+
+def get_digest() -> NotificationDigest:
+    """Process-wide digest, configured from services.yaml teams.digest_window_seconds / digest_max_items."""
+    global _digest
+    if _digest is None:
+        cfg = get_services_config().get("teams", {})
+        _digest = NotificationDigest(
+            window_seconds=float(cfg.get("digest_window_seconds", DEFAULT_WINDOW_SECONDS)),
+            max_items=int(cfg.get("digest_max_items", DEFAULT_MAX_ITEMS)),
+        )
+    return _digest
+
+
+async def submit(channel: str, title: str, service: str, severity: str, summary: str, incident_id: str = "") -> bool | str:
+    """Queue a Teams notification on the shared digest: QUEUED, or the send result. False if Teams is not configured."""
+    if not teams.is_configured():
+        return False
+    return await get_digest().submit(channel, {
+        "title": title,
+        "incident_id": incident_id,
+        "service": service,
+        "severity": severity,
+        "summary": summary,
+    })
@@ -0,0 +1,107 @@
+"""
+Notification dispatcher (1.4): fan out one notification to every channel configured for a
+severity (Teams, email, SMS) concurrently, each under its own timeout.
+Routing and timeouts from services.yaml (notify.*). Returns per-channel results.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from agents.notify.digest import QUEUED
+from integrations import smtp, teams, twilio
+from shared import audit
+from shared.config_loader import get_services_config
+
+CHANNELS = ("teams", "email", "sms")
+DEFAULT_ROUTING = {
+    "critical": ["teams", "email", "sms"],
+    "high": ["teams", "email"],
+    "medium": ["teams"],
+    "low": ["teams"],
+    "approval": ["teams", "email"],
+}
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+_CONFIGURED: dict[str, Callable[[], bool]] = {
+    "teams": teams.is_configured,
+    "email": smtp.is_configured,
+    "sms": twilio.is_configured,
+}
+
+
+def channels_for(severity: str) -> list[str]:
+    """Channels configured for a severity (or routing key such as "approval")."""
+    cfg = get_services_config().get("notify", {})
+    routing = cfg.get("channels_by_severity") or DEFAULT_ROUTING
+    sev = (severity or "").strip().lower()
+    chans = routing.get(sev) or routing.get("default") or DEFAULT_ROUTING.get(sev) or ["teams"]
+    return [c for c in chans if c in CHANNELS]
+
+
+def channel_timeout(channel: str) -> float:
+    cfg = get_services_config().get("notify", {})
+    per_channel = cfg.get("timeouts") or {}
+    return float(per_channel.get(channel, cfg.get("channel_timeout_seconds", DEFAULT_TIMEOUT_SECONDS)))
+
+
+async def _timed(channel: str, send: Awaitable[bool], timeout: float) -> dict:
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(send, timeout=timeout)
+        ok = result is True or (result != QUEUED and bool(result))
+        status, error = ("sent" if ok else QUEUED if result == QUEUED else "failed"), ""
+    except asyncio.TimeoutError:
+        ok, status, error = False, "timeout", f"no response within {timeout:g}s"
+    except Exception as e:
+        ok, status, error = False, "failed", str(e)[:200]
+    return {
+        "ok": ok,
+        "status": status,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+        "error": error,
+    }
+
+
+async def dispatch(
+    severity: str,
+    subject: str,
+    text: str,
+    teams_send: Optional[Callable[[], Awaitable[bool]]] = None,
+    channels: Optional[list[str]] = None,
+    entity_id: str = "",
+) -> dict[str, dict]:
+    """Send to all channels for `severity` at once. `teams_send` overrides the default Teams
+    call (e.g. digest or card). Returns {channel: {ok, status, duration_ms, error}}; a message
+    buffered by the digest has status "queued" and ok False until it is actually sent."""
+    wanted = channels if channels is not None else channels_for(severity)
+    results: dict[str, dict] = {}
+    tasks: dict[str, Awaitable[dict]] = {}
+    for ch in wanted:
+        if not _CONFIGURED[ch]():
+            results[ch] = {"ok": False, "status": "skipped", "duration_ms": 0.0, "error": "not configured"}
+            continue
+        if ch == "teams":
+            coro = teams_send() if teams_send else teams.send_message(text)
+        elif ch == "email":
+            coro = smtp.send_email(smtp.default_recipients(), subject, text)
+        else:
+            coro = twilio.send_sms(twilio.default_recipients(), f"{subject}: {text}")
+        tasks[ch] = _timed(ch, coro, channel_timeout(ch))
+    if tasks:
+        done = await asyncio.gather(*tasks.values())
+        results.update(zip(tasks.keys(), done))
+    summary = ", ".join(f"{ch}={r['status']}" for ch, r in results.items()) or "no channels"
+    audit.log_comprehensive(
+        "notifier", "dispatch", entity_id or subject,
+        "success" if any(r["ok"] for r in results.values())
+        else QUEUED if any(r["status"] == QUEUED for r in results.values()) else "no_channel",
+        duration_ms=int(max((r["duration_ms"] for r in results.values()), default=0)),
+        payload_summary=f"severity={severity}; {summary}",
+    )
+    return results
+
+
+def any_sent(results: dict[str, dict]) -> bool:
+    return any(r.get("ok") for r in results.values())
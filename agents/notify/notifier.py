@@ -1,16 +1,19 @@
 """
-Notifier (1.4): on new incident, send one notification (Teams or email). Config-driven.
+Notifier (1.4): on new incident, notify every channel configured for its severity (Teams, email, SMS)
+concurrently via the dispatcher. Teams messages go through the digest (agents/notify/digest.py);
+critical is sent immediately.
 """
-from integrations.teams import is_configured as teams_configured, send_message as teams_send
-from integrations.smtp import is_configured as smtp_configured, send_email as smtp_send
+from agents.notify import digest
+from agents.notify.dispatcher import dispatch
 
 
-async def notify_incident(incident_id: str, service: str, summary: str, severity: str) -> bool:
-    """Send one notification (Teams preferred, else email if configured)."""
+async def notify_incident(incident_id: str, service: str, summary: str, severity: str) -> dict[str, dict]:
+    """Fan out one notification. Returns per-channel results {channel: {ok, status, duration_ms, error}}."""
     text = f"[{severity}] {service}: {summary} (incident_id={incident_id})"
-    if teams_configured():
-        return await teams_send(text)
-    if smtp_configured():
-        # Would need configured "to" address from config
-        return await smtp_send("ops@example.com", f"Incident: {incident_id}", text)
-    return False
+    return await dispatch(
+        severity,
+        f"Incident: {incident_id}",
+        text,
+        teams_send=lambda: digest.submit("incidents", "New incident", service, severity, summary, incident_id),
+        entity_id=incident_id,
+    )
@@ -4,6 +4,7 @@ Persists ticket_id and ticket_system back to the incident row in incidents.csv.
 Includes category/subcategory lookup and assignment group routing.
 """
 import csv
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -17,66 +18,147 @@ ASSIGNMENT_ROUTING_PATH = CONFIG_TABLES_DIR / "assignment_routing.csv"
 INCIDENTS_CSV = DATA_DIR / "incidents" / "incidents.csv"
 
 
+WILDCARD_SERVICES = ("", "*")
+_DEFAULT_JIRA_PRIORITY = "Medium"
+_DEFAULT_SNOW_FIELDS = ("2", "2", "2")
+_DEFAULT_CATEGORY = ("Inquiry", "General")
+RELOAD_CHECK_SECONDS = 1.0
+
+
+def _read_table(path: Path, required: tuple[str, ...]) -> list[dict]:
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in required if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{path.name}: missing column(s) {', '.join(missing)}")
+        return [{k: (v or "").strip() for k, v in row.items() if k} for row in reader]
+
+
+def _keyed(path: Path, rows: list[dict], key_cols: tuple[str, str]) -> dict[tuple[str, str], dict]:
+    """(key, service) -> row; blank or '*' service is the wildcard. Duplicate keys are an error."""
+    out: dict[tuple[str, str], dict] = {}
+    for n, row in enumerate(rows, start=2):
+        key = row[key_cols[0]].lower()
+        svc = row.get(key_cols[1], "").lower()
+        svc = "*" if svc in WILDCARD_SERVICES else svc
+        if not key:
+            raise ValueError(f"{path.name} line {n}: empty {key_cols[0]}")
+        if (key, svc) in out:
+            raise ValueError(f"{path.name} line {n}: duplicate {key_cols[0]}={key} service={svc}")
+        out[(key, svc)] = row
+    return out
+
+
+class TicketMappings:
+    """Severity, category and assignment tables compiled into direct lookup maps.
+    Service-specific rows take precedence over wildcard (blank or '*') rows."""
+
+    def __init__(self):
+        sev_rows = _read_table(SEVERITY_PRIORITY_PATH, ("severity", "jira_priority", "servicenow_urgency",
+                                                         "servicenow_impact", "servicenow_severity"))
+        self.severity: dict[str, dict] = {}
+        for n, row in enumerate(sev_rows, start=2):
+            sev = row["severity"].lower()
+            if not sev or sev in self.severity:
+                raise ValueError(f"{SEVERITY_PRIORITY_PATH.name} line {n}: empty or duplicate severity '{sev}'")
+            for col in ("servicenow_urgency", "servicenow_impact", "servicenow_severity"):
+                if not row[col].isdigit():
+                    raise ValueError(f"{SEVERITY_PRIORITY_PATH.name} line {n}: {col} must be a number, got '{row[col]}'")
+            self.severity[sev] = row
+        cat_rows = _read_table(CATEGORY_MAPPING_PATH, ("metric", "service", "category", "subcategory"))
+        self.category = _keyed(CATEGORY_MAPPING_PATH, cat_rows, ("metric", "service"))
+        for (metric, _), row in self.category.items():
+            if not row["category"]:
+                raise ValueError(f"{CATEGORY_MAPPING_PATH.name}: metric {metric} has no category")
+        asg_rows = _read_table(ASSIGNMENT_ROUTING_PATH, ("category", "service", "assignment_group_name"))
+        self.assignment = _keyed(ASSIGNMENT_ROUTING_PATH, asg_rows, ("category", "service"))
+        # Metric families: a row for "latency" also covers "latency_p99_ms" (longest match wins).
+        self._metric_keys = sorted({m for m, _ in self.category}, key=len, reverse=True)
+        self._family: dict[str, str] = {}
+
+    @staticmethod
+    def _lookup(table: dict, key: str, service: str) -> Optional[dict]:
+        return table.get((key, service)) or table.get((key, "*"))
+
+    def priority(self, severity: str) -> str:
+        row = self.severity.get(severity.lower())
+        return (row or {}).get("jira_priority") or _DEFAULT_JIRA_PRIORITY
+
+    def snow_fields(self, severity: str) -> tuple[str, str, str]:
+        row = self.severity.get(severity.lower())
+        if not row:
+            return _DEFAULT_SNOW_FIELDS
+        return row["servicenow_urgency"], row["servicenow_impact"], row["servicenow_severity"]
+
+    def category_for(self, metric: str, service: str) -> tuple[str, str]:
+        metric_l = metric.lower().strip()
+        family = self._family.get(metric_l)
+        if family is None:
+            family = next((k for k in self._metric_keys if k in metric_l), "")
+            self._family[metric_l] = family
+        row = self._lookup(self.category, family, service.lower().strip()) if family else None
+        return (row["category"], row["subcategory"] or _DEFAULT_CATEGORY[1]) if row else _DEFAULT_CATEGORY
+
+    def assignment_group(self, category: str, service: str) -> str:
+        row = self._lookup(self.assignment, category.lower().strip(), service.lower().strip())
+        return row["assignment_group_name"] if row else ""
+
+
+class _MappingCache:
+    def __init__(self):
+        self._stamp: Optional[tuple] = None
+        self._mappings: Optional[TicketMappings] = None
+        self._checked = 0.0
+
+    def get(self) -> TicketMappings:
+        now = time.monotonic()
+        if self._mappings is not None and now - self._checked < RELOAD_CHECK_SECONDS:
+            return self._mappings
+        self._checked = now
+        stamp = tuple(p.stat().st_mtime_ns if p.exists() else 0
+                      for p in (SEVERITY_PRIORITY_PATH, CATEGORY_MAPPING_PATH, ASSIGNMENT_ROUTING_PATH))
+        if stamp != self._stamp:
+            try:
+                self._mappings = TicketMappings()
+            except ValueError as e:
+                if self._mappings is None:
+                    raise
+                # Keep serving the last good tables; surface the bad edit in the audit log.
+                audit.log_comprehensive("ticket_writer", "mapping_reload", "tables", "failed", error_message=str(e))
+            self._stamp = stamp
+        return self._mappings
+
+
+_cache = _MappingCache()
+
+
+def get_mappings() -> TicketMappings:
+    """Compiled mapping tables; re-read only when a CSV changes. Raises ValueError if invalid on first load."""
+    return _cache.get()
+
+
 def _priority_for_severity(severity: str, system: str) -> str:
-    """Read severity -> jira_priority from config/tables/severity_priority.csv."""
-    if not SEVERITY_PRIORITY_PATH.exists():
-        return "Medium" if system == "jira" else "3"
-    with open(SEVERITY_PRIORITY_PATH, "r", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            if row.get("severity") == severity:
-                if system == "jira":
-                    return row.get("jira_priority", "Medium")
-    return "Medium" if system == "jira" else "3"
+    """severity -> jira_priority (severity_priority.csv)."""
+    if system != "jira":
+        return "3"
+    return get_mappings().priority(severity)
 
 
 def _snow_fields_for_severity(severity: str) -> tuple[str, str, str]:
-    """Read severity -> (urgency, impact, snow_severity) for ServiceNow from CSV.
-    Defaults to (2, 2, 2) if not found."""
-    if not SEVERITY_PRIORITY_PATH.exists():
-        return "2", "2", "2"
-    with open(SEVERITY_PRIORITY_PATH, "r", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            if row.get("severity") == severity:
-                return (
-                    row.get("servicenow_urgency", "2"),
-                    row.get("servicenow_impact", "2"),
-                    row.get("servicenow_severity", "2"),
-                )
-    return "2", "2", "2"
+    """severity -> (urgency, impact, snow_severity) for ServiceNow. Defaults to (2, 2, 2) if not found."""
+    return get_mappings().snow_fields(severity)
 
 
 def _category_for_metric(metric: str, service: str) -> tuple[str, str]:
-    """Look up (category, subcategory) from category_mapping.csv.
-    Falls back to ('Inquiry', 'General') when no match."""
-    if not CATEGORY_MAPPING_PATH.exists():
-        return "Inquiry", "General"
-    metric_l = metric.lower().strip()
-    service_l = service.lower().strip()
-    with open(CATEGORY_MAPPING_PATH, "r", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            row_metric = (row.get("metric") or "").lower().strip()
-            row_service = (row.get("service") or "").lower().strip()
-            if row_metric and row_metric in metric_l:
-                if not row_service or row_service in service_l:
-                    return row.get("category", "Inquiry"), row.get("subcategory", "General")
-    return "Inquiry", "General"
+    """(category, subcategory) from category_mapping.csv. Falls back to ('Inquiry', 'General')."""
+    return get_mappings().category_for(metric, service)
 
 
 def _assignment_group_for_category(category: str, service: str) -> str:
-    """Look up assignment_group_name from assignment_routing.csv.
-    Returns empty string if no match (SNOW will use its default)."""
-    if not ASSIGNMENT_ROUTING_PATH.exists():
-        return ""
-    cat_l = category.lower().strip()
-    svc_l = service.lower().strip()
-    with open(ASSIGNMENT_ROUTING_PATH, "r", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            row_cat = (row.get("category") or "").lower().strip()
-            row_svc = (row.get("service") or "").lower().strip()
-            if row_cat and row_cat in cat_l:
-                if not row_svc or row_svc in svc_l:
-                    return (row.get("assignment_group_name") or "").strip()
-    return ""
+    """assignment_group_name from assignment_routing.csv. Empty if no match (SNOW uses its default)."""
+    return get_mappings().assignment_group(category, service)
 
 
 def _update_incident_ticket(
@@ -1,4 +1,4 @@
-from agents.triage.rca import run_rca, Hypothesis
+from agents.triage.rca import run_rca, run_rca_llm, Hypothesis
 from agents.triage.enricher import enrich_ticket
 from agents.triage.recommender import suggest_runbooks
 from agents.triage.solicitor import request_approval
@@ -6,6 +6,6 @@ from agents.triage.executor import execute_approved_action
 from agents.triage.closer import close_incident_and_ticket
 
 __all__ = [
-    "run_rca", "Hypothesis", "enrich_ticket", "suggest_runbooks",
+    "run_rca", "run_rca_llm", "Hypothesis", "enrich_ticket", "suggest_runbooks",
     "request_approval", "execute_approved_action", "close_incident_and_ticket",
 ]
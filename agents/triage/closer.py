@@ -5,6 +5,8 @@ Uses ticket_id (sys_id for ServiceNow) for API calls; logs entity_id as ticket_n
 from integrations import jira, servicenow
 from shared import audit
 
+JIRA_DONE_TRANSITION = "Done"
+
 
 async def close_incident_and_ticket(
     incident_id: str,
@@ -17,7 +19,8 @@ async def close_incident_and_ticket(
     ts = (ticket_system or "").strip().lower()
 
     if ts == "jira":
-        ok = await jira.transition(ticket_id, "Done")
+        # Name is resolved to the workflow's transition id via the cached lookup.
+        ok = await jira.transition(ticket_id, JIRA_DONE_TRANSITION)
         outcome = "success" if ok else "no_ticket"
     elif ts == "servicenow":
         if not (ticket_id and ticket_id.strip()):
@@ -1,5 +1,6 @@
 """
 Enricher (2.3): take RCA output; update ticket in Jira/ServiceNow (description, runbook link).
+Jira notes are batched into a single comment per enrichment.
 """
 from agents.triage.rca import Hypothesis
 from integrations import jira, servicenow
@@ -7,11 +8,11 @@ from integrations import jira, servicenow
 
 async def enrich_ticket(ticket_id: str, ticket_system: str, hypotheses: list[Hypothesis], runbook_link: str = "") -> bool:
     """Update ticket with RCA summary and optional runbook link."""
-    body = "\n".join(f"- {h.text} (confidence: {h.confidence})" for h in hypotheses)
+    notes = [f"- {h.text} (confidence: {h.confidence})" for h in hypotheses]
     if runbook_link:
-        body += f"\nRunbook: {runbook_link}"
+        notes.append(f"Runbook: {runbook_link}")
     if ticket_system == "jira":
-        return await jira.add_comment(ticket_id, body)
+        return await jira.add_comments(ticket_id, notes)
     if ticket_system == "servicenow":
-        return await servicenow.update_work_notes(ticket_id, body)
+        return await servicenow.update_work_notes(ticket_id, "\n".join(notes))
     return False
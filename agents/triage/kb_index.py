@@ -0,0 +1,176 @@
+"""
+Knowledge base index (2.4): in-memory inverted index with BM25 scoring over
+knowledge/runbooks, sops and generated markdown. Title, headings and body are weighted
+fields (BM25F-style term frequencies). Built once, then updated per file on change.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from shared.config_loader import PROJECT_ROOT
+from shared.text import tokenize
+
+KNOWLEDGE_DIRS = (
+    PROJECT_ROOT / "knowledge" / "runbooks",
+    PROJECT_ROOT / "knowledge" / "sops",
+    PROJECT_ROOT / "knowledge" / "generated",
+)
+FIELD_WEIGHTS = {"title": 3.0, "headings": 2.0, "body": 1.0}
+K1 = 1.2
+B = 0.75
+REFRESH_INTERVAL_SECONDS = 30.0
+
+
+@dataclass
+class _Doc:
+    path: str
+    name: str
+    mtime_ns: int
+    length: float
+    tf: dict[str, float] = field(default_factory=dict)
+
+
+def _fields(path: Path) -> dict[str, str]:
+    """Split a markdown file into title (stem + H1), headings (H2+) and body text."""
+    text = path.read_text(encoding="utf-8", errors="replace")
+    title = [path.stem.replace("_", " ").replace("-", " ")]
+    headings: list[str] = []
+    body: list[str] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            title.append(stripped[2:])
+        elif stripped.startswith("#"):
+            headings.append(stripped.lstrip("#"))
+        else:
+            body.append(stripped)
+    return {"title": " ".join(title), "headings": " ".join(headings), "body": " ".join(body)}
+
+
+class KnowledgeIndex:
+    def __init__(self, dirs: Iterable[Path] = KNOWLEDGE_DIRS):
+        self.dirs = tuple(dirs)
+        self._docs: dict[int, _Doc] = {}
+        self._by_path: dict[str, int] = {}
+        self._postings: dict[str, dict[int, float]] = {}
+        self._total_length = 0.0
+        self._next_id = 0
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ── maintenance ───────────────────────────────────────────────────
+
+    def _remove(self, path: str) -> None:
+        doc_id = self._by_path.pop(path, None)
+        if doc_id is None:
+            return
+        doc = self._docs.pop(doc_id)
+        self._total_length -= doc.length
+        for term in doc.tf:
+            plist = self._postings.get(term)
+            if plist is not None:
+                plist.pop(doc_id, None)
+                if not plist:
+                    del self._postings[term]
+
+    def _add(self, path: Path, mtime_ns: int) -> None:
+        tf: Counter = Counter()
+        for name, text in _fields(path).items():
+            w = FIELD_WEIGHTS[name]
+            for tok in tokenize(text):
+                tf[tok] += w
+        doc_id = self._next_id
+        self._next_id += 1
+        doc = _Doc(path=str(path), name=path.stem, mtime_ns=mtime_ns, length=sum(tf.values()), tf=dict(tf))
+        self._docs[doc_id] = doc
+        self._by_path[doc.path] = doc_id
+        self._total_length += doc.length
+        for term, freq in tf.items():
+            self._postings.setdefault(term, {})[doc_id] = freq
+
+    def update_paths(self, paths: Iterable[Path | str]) -> int:
+        """Re-index the given files (added, changed or deleted). Returns number of files touched."""
+        touched = 0
+        with self._lock:
+            for p in paths:
+                p = Path(p)
+                if p.suffix.lower() != ".md":
+                    continue
+                key = str(p)
+                if not p.exists():
+                    if key in self._by_path:
+                        self._remove(key)
+                        touched += 1
+                    continue
+                mtime_ns = p.stat().st_mtime_ns
+                current = self._by_path.get(key)
+                if current is not None and self._docs[current].mtime_ns == mtime_ns:
+                    continue
+                self._remove(key)
+                self._add(p, mtime_ns)
+                touched += 1
+        return touched
+
+    def refresh(self) -> int:
+        """Stat every knowledge file; index new/changed ones and drop deleted ones."""
+        seen = [f for base in self.dirs if base.exists() for f in sorted(base.glob("*.md"))]
+        gone = set(self._by_path) - {str(f) for f in seen}
+        self._last_refresh = time.monotonic()
+        return self.update_paths([*seen, *gone])
+
+    def maybe_refresh(self, interval: float = REFRESH_INTERVAL_SECONDS) -> None:
+        if time.monotonic() - self._last_refresh >= interval:
+            self.refresh()
+
+    # ── query ─────────────────────────────────────────────────────────
+
+    def search(self, query: str, k: int = 5) -> list[dict]:
+        """Top-k documents by BM25: [{path, name, score, matched}] sorted by score desc."""
+        n = len(self._docs)
+        terms = set(tokenize(query))
+        if not n or not terms:
+            return []
+        avgdl = self._total_length / n or 1.0
+        scores: dict[int, float] = {}
+        matched: dict[int, list[str]] = {}
+        for term in terms:
+            plist = self._postings.get(term)
+            if not plist:
+                continue
+            idf = math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+            for doc_id, freq in plist.items():
+                dl = self._docs[doc_id].length
+                s = idf * freq * (K1 + 1) / (freq + K1 * (1 - B + B * dl / avgdl))
+                scores[doc_id] = scores.get(doc_id, 0.0) + s
+                matched.setdefault(doc_id, []).append(term)
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:k]
+        return [
+            {
+                "path": self._docs[d].path,
+                "name": self._docs[d].name,
+                "score": round(s, 4),
+                "matched": sorted(matched[d]),
+            }
+            for d, s in ranked
+        ]
+
+
+_index: Optional[KnowledgeIndex] = None
+
+
+def get_index() -> KnowledgeIndex:
+    """Process-wide index; built on first use (the orchestrator warms it at startup)."""
+    global _index
+    if _index is None:
+        _index = KnowledgeIndex()
+        _index.refresh()
+    return _index
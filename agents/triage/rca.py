@@ -1,9 +1,20 @@
 """
-RCA Agent (2.2): hypotheses + confidence + evidence. LLM config-only; use rules/templates until wired.
+RCA Agent (2.2): hypotheses + confidence + evidence. Rules/templates always run; when llm.enabled,
+run_rca_llm adds an LLM hypothesis using the prompt template in config/agents/rca.md.
+Adds a knowledge-base hypothesis from local retrieval (shared/retrieval.py) when enabled.
+rca_mode (agents.yaml triage): templates | history (nearest closed incidents, rca_history.py) | hybrid.
+An open incident on an upstream dependency (shared/topology.py) is reported first.
 """
-from typing import List
+import re
+from pathlib import Path
+from typing import List, Optional
 from dataclasses import dataclass
 
+from agents.triage.rca_history import history_hypotheses
+from shared import llm_client, retrieval
+from shared.config_loader import CONFIG_DIR, get_agents_config
+from shared.topology import get_topology
+
 
 @dataclass
 class Hypothesis:
@@ -35,16 +46,36 @@ _RCA_TEMPLATES = {
         ("Check database or downstream service health", 0.55, "dependency"),
     ],
 }
+MAX_HYPOTHESES = 3
 
 
 def run_rca(incident_id: str, service: str, summary: str, time_window: dict = None, context: dict = None) -> List[Hypothesis]:
-    """Return 1–3 hypotheses. Rule-based: map metric + service to template hypotheses."""
+    """Return 1–3 hypotheses. History mode: resolutions of the most similar closed incidents.
+    Template mode: map metric + service to template hypotheses. Hybrid: history first, then templates.
+    A knowledge-base match always keeps the last slot."""
+    return _keep_reserved(*_rca(incident_id, service, summary, context))
+
+
+def _keep_reserved(hypotheses: List[Hypothesis], reserved: Optional[Hypothesis]) -> List[Hypothesis]:
+    """First MAX_HYPOTHESES, with the last one given to `reserved` when there is one."""
+    if reserved is None:
+        return hypotheses[:MAX_HYPOTHESES]
+    return hypotheses[:MAX_HYPOTHESES - 1] + [reserved]
+
+
+def _rca(incident_id: str, service: str, summary: str, context: dict = None) -> tuple[List[Hypothesis], Optional[Hypothesis]]:
+    """(ranked hypotheses, knowledge-base hypothesis or None)."""
     context = context or {}
     metric = context.get("metric", "")
     value = context.get("value")
+    mode = (get_agents_config().get("agents", {}).get("triage", {}).get("rca_mode") or "templates").lower()
     hypotheses = []
+    if mode in ("history", "hybrid"):
+        hypotheses = [Hypothesis(t, c, e) for t, c, e in history_hypotheses(service, summary, context)]
     # Match by exact metric or by prefix (e.g. latency_*)
     for key, template_list in _RCA_TEMPLATES.items():
+        if mode == "history" and hypotheses:
+            break
         if key == metric or (metric and metric.startswith(key)):
             for text, conf, evidence in template_list[:2]:
                 hypotheses.append(Hypothesis(text=text, confidence=conf, evidence_snippet=evidence))
@@ -57,4 +88,79 @@ def run_rca(incident_id: str, service: str, summary: str, time_window: dict = No
                 f"service={service}, metric={metric}",
             ),
         ]
-    return hypotheses[:3]
+    upstream = _upstream_hypothesis(incident_id, service)
+    if upstream:
+        hypotheses.insert(0, upstream)
+    known = None
+    for hit in retrieval.retrieve(f"{summary} {service} {metric}", k=1):
+        known = Hypothesis(
+            f"Known pattern: see '{hit['heading']}' in {Path(hit['path']).name}",
+            round(min(hit["score"], 0.9), 2),
+            hit["text"][:160].replace("\n", " "),
+        )
+    return hypotheses, known
+
+
+def _upstream_hypothesis(incident_id: str, service: str) -> Optional[Hypothesis]:
+    """Open incident on a service this one depends on (same correlation window)."""
+    from agents.monitor.correlator import find_related_open
+    upstream = get_topology().upstream(service)
+    for inc in find_related_open(service, exclude_id=incident_id):
+        svc = (inc.get("service") or "").lower()
+        if svc in upstream:
+            ref = inc.get("ticket_number") or inc.get("incident_id", "")
+            return Hypothesis(
+                f"Upstream dependency {svc} has an open incident ({inc.get('summary', '')}); likely cause of {service} impact",
+                0.8,
+                f"topology: {service} depends on {svc}; see {ref}",
+            )
+    return None
+
+
+_PROMPT_TEMPLATE: Optional[str] = None
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+RCA_SYSTEM = "You are an SRE assistant performing root cause analysis. Answer with the single most likely hypothesis in one or two sentences."
+
+
+def _prompt_template() -> str:
+    """Fenced block under '## Prompt template' in config/agents/rca.md."""
+    global _PROMPT_TEMPLATE
+    if _PROMPT_TEMPLATE is None:
+        path = CONFIG_DIR / "agents" / "rca.md"
+        text = path.read_text(encoding="utf-8") if path.exists() else ""
+        m = re.search(r"## Prompt template.*?```\n(.*?)```", text.replace("\r\n", "\n"), re.S)
+        _PROMPT_TEMPLATE = m.group(1) if m else "Service: {{service}}\nSummary: {{incident_summary}}\n"
+    return _PROMPT_TEMPLATE
+
+
+def build_rca_prompt(service: str, summary: str, context: dict = None) -> str:
+    """Fill the template from incident content only. Lines whose placeholders are per-incident
+    (ID, window timestamps) are dropped, and a metric is given by name and severity band rather
+    than raw value, so a storm of identical incidents yields one prompt."""
+    context = context or {}
+    values = {"service": service, "incident_summary": summary}
+    lines = []
+    for line in _prompt_template().splitlines():
+        names = _PLACEHOLDER.findall(line)
+        if any(n not in values for n in names):
+            continue
+        lines.append(_PLACEHOLDER.sub(lambda m: str(values[m.group(1)]), line))
+    if context.get("metric"):
+        from agents.monitor.incident_creator import _infer_severity
+        metric = str(context["metric"])
+        try:
+            band = f" ({_infer_severity(metric, float(context.get('value')))} band)"
+        except (TypeError, ValueError):
+            band = ""
+        lines.insert(2, f"Metric: {metric}{band}")
+    return "\n".join(lines).strip()
+
+
+async def run_rca_llm(incident_id: str, service: str, summary: str, time_window: dict = None, context: dict = None) -> List[Hypothesis]:
+    """run_rca plus, when the LLM is enabled, its hypothesis first. Falls back to rules on None."""
+    hypotheses, known = _rca(incident_id, service, summary, context)
+    text = await llm_client.complete(build_rca_prompt(service, summary, context), system=RCA_SYSTEM, max_tokens=256)
+    if not text or not text.strip():
+        return _keep_reserved(hypotheses, known)
+    llm_hyp = Hypothesis(" ".join(text.split())[:300], 0.65, f"llm: {llm_client.get_client().model or 'stub'}")
+    return _keep_reserved([llm_hyp, *hypotheses], known)
@@ -0,0 +1,238 @@
+"""
+Historical RCA (2.2): nearest closed incidents by service, metric, value band and summary text.
+Feature index built once from incidents.csv + trace.csv (+ approved actions in approvals.csv),
+bucketed by metric so a lookup only scores incidents that share the metric (or service when the
+metric is unknown). Closed incidents are added incrementally by the close endpoints, which pass the
+features of the incident's own run (run_features) so a close never rescans trace.csv.
+A case's resolution is what was done about it: approved actions, and the recommended runbooks once
+the Enricher wrote them onto the ticket. Cases without one are never offered as a hypothesis.
+"""
+from __future__ import annotations
+
+import csv
+import heapq
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+from agents.monitor.incident_creator import INCIDENTS_CSV, _infer_severity
+from shared.config_loader import DATA_DIR, get_agents_config
+from shared.text import tokenize
+from shared.trace import TRACE_PATH
+
+APPROVALS_CSV = DATA_DIR / "approvals.csv"
+WEIGHTS = {"service": 0.35, "metric": 0.25, "band": 0.15, "text": 0.25}
+DEFAULT_K = 3
+DEFAULT_MIN_SIMILARITY = 0.5
+_EVAL_DETAIL = re.compile(r"metric=(\S+)\s+value=(\S+)")
+
+
+@dataclass
+class _Case:
+    incident_id: str
+    ticket_number: str
+    service: str
+    metric: str
+    band: str
+    tokens: frozenset
+    runbooks: list[str] = field(default_factory=list)
+    actions: list[str] = field(default_factory=list)
+
+    @property
+    def resolution(self) -> str:
+        parts = list(self.actions)
+        if self.runbooks:
+            parts.append("runbook " + ", ".join(self.runbooks))
+        return "; ".join(parts)
+
+
+def _band(metric: str, value, severity: str) -> str:
+    try:
+        return _infer_severity(metric, float(value)) if metric and value not in (None, "") else (severity or "")
+    except (TypeError, ValueError):
+        return severity or ""
+
+
+def _read_csv(path) -> list[dict]:
+    if not path.exists():
+        return []
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _add_step(feats: dict, row: dict) -> None:
+    """Fold one incident step into {runbooks, enriched}."""
+    agent = row.get("agent") or ""
+    detail = (row.get("detail") or "").strip()
+    if row.get("outcome") != "success":
+        return
+    if agent == "Recommender" and detail and detail != "none":
+        feats["runbooks"] = list(dict.fromkeys(r.strip() for r in detail.split(",") if r.strip()))
+    elif agent == "Enricher":
+        feats["enriched"] = True
+
+
+def _evaluated(row: dict) -> Optional[tuple[str, str]]:
+    m = _EVAL_DETAIL.search(row.get("detail") or "") if row.get("agent") == "Evaluator" else None
+    return (m.group(1), m.group(2)) if m else None
+
+
+def _finish(feats: dict) -> dict:
+    """Runbooks only count as applied once the Enricher put them on the ticket."""
+    if not feats.pop("enriched", False):
+        feats["runbooks"] = []
+    return feats
+
+
+def run_features(rows: list[dict]) -> dict:
+    """{metric, value, runbooks} from the trace rows of the run that created an incident."""
+    feats: dict = {"runbooks": []}
+    for row in rows:
+        metric = _evaluated(row)
+        if metric:
+            feats["metric"], feats["value"] = metric
+        elif row.get("incident_id"):
+            _add_step(feats, row)
+    return _finish(feats)
+
+
+def _trace_features(incident_ids: Optional[set] = None) -> dict[str, dict]:
+    """incident_id -> {metric, value, runbooks} from one pass over trace.csv.
+    Evaluator rows carry metric/value but no incident_id, so they are joined through run_id."""
+    run_metric: dict[str, tuple[str, str]] = {}
+    run_incident: dict[str, str] = {}
+    out: dict[str, dict] = {}
+    for row in _read_csv(TRACE_PATH):
+        run_id = row.get("run_id") or ""
+        inc = row.get("incident_id") or ""
+        metric = _evaluated(row)
+        if metric:
+            run_metric[run_id] = metric
+            continue
+        if not inc or (incident_ids is not None and inc not in incident_ids):
+            continue
+        run_incident.setdefault(run_id, inc)
+        _add_step(out.setdefault(inc, {"runbooks": []}), row)
+    for run_id, inc in run_incident.items():
+        if run_id in run_metric and inc in out:
+            out[inc]["metric"], out[inc]["value"] = run_metric[run_id]
+    return {inc: _finish(feats) for inc, feats in out.items()}
+
+
+def _approved_actions(incident_ids: Optional[set] = None) -> dict[str, list[str]]:
+    actions: dict[str, list[str]] = {}
+    for row in _read_csv(APPROVALS_CSV):
+        inc = row.get("incident_id") or ""
+        if row.get("status") == "approved" and (incident_ids is None or inc in incident_ids):
+            actions.setdefault(inc, []).append((row.get("action_suggestion") or "").strip())
+    return actions
+
+
+class HistoryIndex:
+    def __init__(self):
+        self._cases: dict[str, _Case] = {}
+        self._by_metric: dict[str, list[str]] = {}
+        self._by_service: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cases)
+
+    def _insert(self, row: dict, feats: dict, actions: list[str]) -> None:
+        inc = row.get("incident_id") or ""
+        if not inc or inc in self._cases:
+            return
+        metric = feats.get("metric", "")
+        case = _Case(
+            incident_id=inc,
+            ticket_number=row.get("ticket_number") or "",
+            service=row.get("service") or "",
+            metric=metric,
+            band=_band(metric, feats.get("value"), row.get("severity") or ""),
+            tokens=frozenset(tokenize(row.get("summary") or "")),
+            runbooks=feats.get("runbooks", []),
+            actions=list(dict.fromkeys(a for a in actions if a)),
+        )
+        self._cases[inc] = case
+        self._by_metric.setdefault(case.metric, []).append(inc)
+        self._by_service.setdefault(case.service, []).append(inc)
+
+    def build(self) -> int:
+        """Full rebuild from the CSVs. Returns number of closed incidents indexed."""
+        closed = [r for r in _read_csv(INCIDENTS_CSV) if (r.get("status") or "").lower() == "closed"]
+        feats = _trace_features({r["incident_id"] for r in closed})
+        actions = _approved_actions()
+        with self._lock:
+            self._cases.clear()
+            self._by_metric.clear()
+            self._by_service.clear()
+            for row in closed:
+                self._insert(row, feats.get(row["incident_id"], {}), actions.get(row["incident_id"], []))
+        return len(self._cases)
+
+    def add_closed(self, incident_id: str, feats: dict) -> bool:
+        """Index one newly closed incident (called from the close endpoints with run_features of its run)."""
+        from agents.monitor.incident_creator import get_incident_row
+        row = get_incident_row(incident_id)
+        if not row or incident_id in self._cases:
+            return False
+        actions = _approved_actions({incident_id}).get(incident_id, [])
+        with self._lock:
+            self._insert(row, feats, actions)
+        return True
+
+    def similar(self, service: str, metric: str, value=None, summary: str = "", k: int = DEFAULT_K,
+                min_similarity: float = 0.0) -> list[tuple[float, _Case]]:
+        """Top-k (similarity, case) among closed incidents, similarity in [0, 1]."""
+        band = _band(metric, value, "")
+        tokens = frozenset(tokenize(summary))
+        candidates = self._by_metric.get(metric, []) if metric else self._by_service.get(service, [])
+
+        def score(case: _Case) -> float:
+            s = WEIGHTS["service"] * (case.service == service) + WEIGHTS["metric"] * (case.metric == metric)
+            s += WEIGHTS["band"] * (bool(band) and case.band == band)
+            if tokens and case.tokens:
+                s += WEIGHTS["text"] * len(tokens & case.tokens) / len(tokens | case.tokens)
+            return s
+
+        scored = ((score(self._cases[i]), self._cases[i]) for i in candidates)
+        return [(round(s, 3), c) for s, c in heapq.nlargest(k, scored, key=lambda sc: sc[0]) if s >= min_similarity]
+
+
+def history_hypotheses(service: str, summary: str, context: dict = None) -> list[tuple[str, float, str]]:
+    """(text, confidence, evidence) per distinct past resolution among the nearest closed incidents
+    (neighbours with no recorded resolution are left out)."""
+    context = context or {}
+    cfg = get_agents_config().get("agents", {}).get("triage", {})
+    hits = get_history_index().similar(
+        service, context.get("metric", ""), context.get("value"), summary,
+        k=int(cfg.get("rca_history_k", DEFAULT_K)),
+        min_similarity=float(cfg.get("rca_history_min_similarity", DEFAULT_MIN_SIMILARITY)),
+    )
+    grouped: dict[str, list[tuple[float, _Case]]] = {}
+    for sim, case in hits:
+        if case.resolution:
+            grouped.setdefault(case.resolution, []).append((sim, case))
+    out = []
+    for resolution, group in grouped.items():
+        best_sim, best = group[0]
+        refs = ", ".join(c.ticket_number or c.incident_id for _, c in group)
+        out.append((
+            f"Similar past incident{'s' if len(group) > 1 else ''} ({refs}) resolved via {resolution}",
+            round(0.9 * best_sim, 2),
+            f"similarity={best_sim:.2f}; {best.service}/{best.metric or '?'} band={best.band or '?'}",
+        ))
+    return out
+
+
+_index: Optional[HistoryIndex] = None
+
+
+def get_history_index() -> HistoryIndex:
+    """Process-wide index; built on first use (the orchestrator warms it at startup)."""
+    global _index
+    if _index is None:
+        _index = HistoryIndex()
+        _index.build()
+    return _index
@@ -1,25 +1,42 @@
 """
 Recommender (2.4): match incident to runbooks; suggest 1–2 with link. No auto-action.
+Ranking is BM25 over titles, headings and body text of knowledge/runbooks, sops and generated
+(agents/triage/kb_index.py); remaining slots are filled from local vector retrieval when enabled.
 """
 from pathlib import Path
-from shared.config_loader import PROJECT_ROOT
 
-KNOWLEDGE = PROJECT_ROOT / "knowledge" / "runbooks"
-SOP = PROJECT_ROOT / "knowledge" / "sops"
-GENERATED = PROJECT_ROOT / "knowledge" / "generated"
+from agents.triage.kb_index import get_index
+from shared import retrieval
+
+MAX_SUGGESTIONS = 2
 
 
 def suggest_runbooks(incident_summary: str, service: str) -> list[dict]:
-    """Return list of {path, reason, name}. Keyword/tag match over knowledge/runbooks, sops, generated."""
-    results = []
-    summary_lower = (incident_summary or "").lower()
-    service_lower = (service or "").lower()
-    for base in (KNOWLEDGE, SOP, GENERATED):
-        if not base.exists():
-            continue
-        for f in sorted(base.glob("*.md")):
-            name = f.stem.lower()
-            words = name.replace("-", " ").split("_")
-            if service_lower in name or any(w in summary_lower for w in words if len(w) > 2):
-                results.append({"path": str(f), "reason": f"Match: {f.stem}", "name": f.stem})
-    return results[:2]
+    """Return list of {path, reason, name, score}, best first."""
+    index = get_index()
+    index.maybe_refresh()
+    query = f"{incident_summary or ''} {service or ''}"
+    results = [
+        {
+            "path": h["path"],
+            "reason": f"BM25 {h['score']:.2f}: {', '.join(h['matched'][:5])}",
+            "name": h["name"],
+            "score": h["score"],
+        }
+        for h in index.search(query, k=MAX_SUGGESTIONS)
+    ]
+    if len(results) < MAX_SUGGESTIONS:
+        seen = {r["path"] for r in results}
+        for hit in retrieval.retrieve(query, k=MAX_SUGGESTIONS * 2):
+            if hit["path"] in seen:
+                continue
+            seen.add(hit["path"])
+            results.append({
+                "path": hit["path"],
+                "reason": f"Semantic {hit['score']:.2f}: {hit['heading']}",
+                "name": Path(hit["path"]).stem,
+                "score": hit["score"],
+            })
+            if len(results) >= MAX_SUGGESTIONS:
+                break
+    return results
@@ -1,14 +1,23 @@
 """
-Solicitor (3.1): send approval request via Adaptive Card to Teams or email. Store decision.
+Solicitor (3.1): send approval request via Adaptive Card to Teams and email concurrently. Store decision.
 """
-from integrations.teams import send_message
-from integrations.smtp import send_email
+from agents.notify.dispatcher import any_sent, dispatch
+from integrations import teams
 
 
 async def request_approval(incident_id: str, action_suggestion: str, callback_url: str) -> bool:
-    """Send approval request (Teams card or email). Decision handled by webhook."""
+    """Send approval request (Teams card + email, per notify routing "approval"). Decision handled by webhook."""
     text = f"Approve action for incident {incident_id}: {action_suggestion}"
-    sent = await send_message(text)
-    if not sent:
-        sent = await send_email("ops@example.com", f"Approval: {incident_id}", text)
-    return sent
+
+    async def _teams_card() -> bool:
+        card = teams.load_card("approval", {"incident_id": incident_id, "action_suggestion": action_suggestion})
+        return await teams.send_message(text, card=card)
+
+    results = await dispatch(
+        "approval",
+        f"Approval: {incident_id}",
+        f"{text}\nApprove/reject: {callback_url}",
+        teams_send=_teams_card,
+        entity_id=incident_id,
+    )
+    return any_sent(results)
@@ -0,0 +1,244 @@
+"""
+Benchmarks for pipeline stages and storage primitives, against a fixed synthetic history.
+
+    python benchmarks/run.py run --incidents 10000 --out benchmarks/results/main.json
+    python benchmarks/run.py compare benchmarks/results/main.json benchmarks/results/branch.json --threshold 15
+
+`run` generates the dataset with simulator/datagen.py (fixed seed) into a temporary data tree,
+points SENTRY_DATA_DIR at it and times each stage there; the project's data/ and knowledge/ are not
+touched. ITSM and Teams calls are replaced with in-process stubs so only local work is measured.
+`compare` prints per-benchmark p50 changes and exits 1 if any slowed down by more than --threshold %.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+# Add project root for imports when run as a script
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# name -> default iterations (scaled by --scale); the slow file-rewriting stages run fewer times
+BENCHMARKS = {
+    "collect": 20000,
+    "evaluate": 20000,
+    "should_create_incident": 20000,
+    "create_incident": 500,
+    "correlate_and_group": 100,
+    "log_step": 2000,
+    "stamp_ticket_number": 5,
+    "suggest_runbooks": 2000,
+    "run_chronicler": 1,
+}
+
+
+def _stats(samples_ms: list[float]) -> dict:
+    s = sorted(samples_ms)
+    pct = lambda q: s[min(len(s) - 1, int(q / 100 * len(s)))]
+    return {
+        "n": len(s),
+        "mean_ms": round(statistics.fmean(s), 4),
+        "p50_ms": round(pct(50), 4),
+        "p95_ms": round(pct(95), 4),
+        "min_ms": round(s[0], 4),
+        "max_ms": round(s[-1], 4),
+    }
+
+
+def _time(fn: Callable[[int], Any], iterations: int, warmup: int = 1) -> dict:
+    """Call fn(i) iterations times (after warmup calls) and summarise per-call wall time."""
+    for i in range(warmup):
+        fn(-1 - i)
+    samples = []
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return _stats(samples)
+
+
+def _stub_external() -> None:
+    """Replace outbound ITSM / Teams calls with canned in-process responses."""
+    from integrations import jira, servicenow, teams
+
+    counter = {"n": 0}
+
+    async def snow_create_incident(*args, **kwargs):
+        counter["n"] += 1
+        return {"sys_id": f"{counter['n']:032x}", "number": f"INC9{counter['n']:06d}"}
+
+    async def ok(*args, **kwargs):
+        return True
+
+    servicenow.is_configured = lambda: True
+    servicenow.create_incident = snow_create_incident
+    servicenow.update_work_notes = ok
+    servicenow.close_incident = ok
+    jira.is_configured = lambda: False
+    teams.is_configured = lambda: False
+    teams.send_message = ok
+
+
+def _event(i: int) -> dict:
+    from simulator.scenarios import emit_event, list_scenarios
+    names = list_scenarios()
+    return emit_event(names[i % len(names)])
+
+
+def run_benchmarks(scale: float, only: list[str], tmp: Path) -> dict:
+    from agents.chronicler import doc_writer
+    from agents.monitor.alert_router import should_create_incident
+    from agents.monitor.collector import collect
+    from agents.monitor.correlator import correlate_and_group
+    from agents.monitor.evaluator import evaluate
+    from agents.monitor.incident_creator import create_incident
+    from agents.triage.recommender import suggest_runbooks
+    from orchestrator.chronicler_pipeline import run_chronicler
+    from shared.trace import log_step, stamp_ticket_number
+
+    _stub_external()
+    doc_writer.GENERATED = tmp / "generated"
+    loop = asyncio.new_event_loop()
+    events = [_event(i) for i in range(200)]
+    collected = [collect(e) for e in events]
+
+    def bench_correlate(i):
+        ev = collected[i % len(collected)]
+        inc = create_incident(ev.service, ev.extra.get("summary", ""), metric=ev.metric, value=ev.value)
+        t0 = time.perf_counter()
+        loop.run_until_complete(correlate_and_group(inc.incident_id, inc.service, inc.summary, inc.severity))
+        return time.perf_counter() - t0
+
+    cases: dict[str, tuple[Callable[[int], Any], int]] = {
+        "collect": (lambda i: collect(events[i % len(events)]), 0),
+        "evaluate": (lambda i: evaluate(collected[i % len(collected)]), 0),
+        "should_create_incident": (lambda i: should_create_incident(events[i % len(events)]["service"], events[i % len(events)]["metric"], set()), 0),
+        "create_incident": (lambda i: create_incident("app-svc", "High CPU on app-svc", metric="cpu_percent", value=95.0), 1),
+        "log_step": (lambda i: log_step(f"run_bench{i:06d}", "", 1, "Collector", "normalise_event", "normalised", "bench", "success"), 1),
+        "stamp_ticket_number": (lambda i: stamp_ticket_number("run_bench000000", f"INC{i:07d}"), 0),
+        "suggest_runbooks": (lambda i: suggest_runbooks(events[i % len(events)]["extra"]["summary"], events[i % len(events)]["service"]), 1),
+        "run_chronicler": (lambda i: loop.run_until_complete(run_chronicler()), 0),
+    }
+
+    results = {}
+    for name, default_n in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        n = max(1, int(default_n * scale))
+        if name == "correlate_and_group":
+            # Only the correlation call is timed; creating the incident it groups is setup.
+            bench_correlate(-1)
+            samples = [bench_correlate(i) * 1000 for i in range(n)]
+            results[name] = _stats(samples)
+        else:
+            fn, warmup = cases[name]
+            results[name] = _time(fn, n, warmup)
+        print(f"{name:<24} n={results[name]['n']:<6} p50={results[name]['p50_ms']:.4f}ms p95={results[name]['p95_ms']:.4f}ms", flush=True)
+    loop.close()
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def cmd_run(args) -> int:
+    with tempfile.TemporaryDirectory(prefix="sentry-bench-") as tmp_s:
+        tmp = Path(tmp_s)
+        data_dir = tmp / "data"
+        # Must be set before any project module resolves DATA_DIR.
+        os.environ["SENTRY_DATA_DIR"] = str(data_dir)
+        from simulator.datagen import Generator
+
+        t0 = time.perf_counter()
+        counts = Generator(data_dir, args.incidents, seed=args.seed).run()
+        print(f"dataset: {counts} ({time.perf_counter() - t0:.1f}s)", flush=True)
+        results = run_benchmarks(args.scale, args.only, tmp)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "commit": _git_commit(),
+            "label": args.label,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dataset": {"incidents": args.incidents, "seed": args.seed, "rows": counts},
+            "scale": args.scale,
+        },
+        "results": results,
+    }
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results written to {args.out}")
+    return 0
+
+
+def compare(baseline: dict, current: dict, threshold_pct: float, metric: str = "p50_ms") -> tuple[list[dict], bool]:
+    """Rows of {name, baseline, current, change_pct, regression}; True if any regression."""
+    rows, regressed = [], False
+    for name, cur in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            rows.append({"name": name, "baseline": None, "current": cur[metric], "change_pct": None, "regression": False})
+            continue
+        change = (cur[metric] - base[metric]) / base[metric] * 100 if base[metric] else 0.0
+        is_reg = change > threshold_pct
+        regressed |= is_reg
+        rows.append({"name": name, "baseline": base[metric], "current": cur[metric], "change_pct": round(change, 1), "regression": is_reg})
+    return rows, regressed
+
+
+def cmd_compare(args) -> int:
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    if baseline["meta"].get("dataset", {}).get("incidents") != current["meta"].get("dataset", {}).get("incidents"):
+        print("warning: the two runs used different dataset sizes")
+    rows, regressed = compare(baseline, current, args.threshold, args.metric)
+    print(f"{'benchmark':<24} {'baseline':>12} {'current':>12} {'change':>9}")
+    for r in rows:
+        change = f"{r['change_pct']:+.1f}%" if r["change_pct"] is not None else "new"
+        flag = "  REGRESSION" if r["regression"] else ""
+        base = f"{r['baseline']:.4f}" if r["baseline"] is not None else "-"
+        print(f"{r['name']:<24} {base:>12} {r['current']:>12.4f} {change:>9}{flag}")
+    if regressed:
+        print(f"Regressions beyond {args.threshold}% ({args.metric}).")
+    return 1 if regressed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages against a synthetic history")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="Generate the dataset and time each benchmark")
+    run.add_argument("--incidents", type=int, default=10000, help="Synthetic history size")
+    run.add_argument("--seed", type=int, default=42, help="Dataset seed (keep fixed across compared runs)")
+    run.add_argument("--scale", type=float, default=1.0, help="Multiply every benchmark's iteration count")
+    run.add_argument("--only", nargs="*", default=[], choices=list(BENCHMARKS), help="Run only these benchmarks")
+    run.add_argument("--label", default="", help="Label stored in the results (e.g. branch or release)")
+    run.add_argument("--out", type=Path, default=None, help="Write JSON results to this path")
+    cmp = sub.add_parser("compare", help="Compare two result files and flag regressions")
+    cmp.add_argument("baseline", type=Path)
+    cmp.add_argument("current", type=Path)
+    cmp.add_argument("--threshold", type=float, default=10.0, help="Percent slowdown that counts as a regression")
+    cmp.add_argument("--metric", choices=["p50_ms", "p95_ms", "mean_ms"], default="p50_ms")
+    args = parser.parse_args()
+    return cmd_run(args) if args.command == "run" else cmd_compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
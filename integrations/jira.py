@@ -1,11 +1,24 @@
 """
 Jira integration (INT.2): create issue, add comment, transition. Dev instance; auth via env.
+All calls on an event loop share one keep-alive AsyncClient (a new one is made when the loop
+changes, e.g. the UI's per-action asyncio.run). Transition ids are cached per (project, issue
+type), keyed by the type Jira reports for the issue; a caller that knows the type gets a cached
+lookup + one POST. A name missing from a cached map, or a 400 on its id, refetches the issue's own
+transitions and retries once.
 """
+import asyncio
 from typing import Optional
 
 import httpx
 from shared.config_loader import get_integrations_config, get_integration_credentials
 
+DEFAULT_ISSUE_TYPE = "Incident"
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+# (project_key, issue_type) -> {transition name (lower) -> transition id}
+_transition_cache: dict[tuple[str, str], dict[str, str]] = {}
+
 
 def is_configured() -> bool:
     cfg = get_integrations_config().get("jira", {})
@@ -17,29 +30,80 @@ def is_configured() -> bool:
     return bool(base and token)
 
 
+def _get_creds() -> tuple[str, str, str]:
+    creds = get_integration_credentials("jira")
+    return (
+        (creds.get("base_url") or "").strip().rstrip("/"),
+        (creds.get("username") or "").strip(),
+        creds.get("api_token") or "",
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Shared keep-alive client for the running loop; recreated if closed or bound to another loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # A client from a finished loop cannot be closed from this one; its connections died with it.
+        _client_loop = loop
+        _client = httpx.AsyncClient(
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={"Accept": "application/json"},
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client (orchestrator shutdown)."""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client, _client_loop = None, None
+
+
+def _adf(paragraphs: list[str]) -> dict:
+    """Atlassian Document Format body with one paragraph per entry."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": p}]} if p else {"type": "paragraph", "content": []}
+            for p in paragraphs
+        ] or [{"type": "paragraph", "content": []}],
+    }
+
+
+def _error_text(r: httpx.Response) -> str:
+    err = r.text
+    try:
+        j = r.json()
+        err = j.get("errorMessages", [])
+        if isinstance(err, list) and err:
+            err = "; ".join(str(m) for m in err)
+        elif isinstance(j.get("errors"), dict):
+            err = "; ".join(f"{k}: {v}" for k, v in j["errors"].items())
+        else:
+            err = r.text
+    except Exception:
+        pass
+    return f"HTTP {r.status_code}: {err or r.reason_phrase}"
+
+
 async def test_connection() -> tuple[bool, str]:
     """GET /rest/api/3/myself with basic auth; success if status is 2xx. Returns (success, message)."""
     cfg = get_integrations_config().get("jira", {})
     if not cfg.get("enabled"):
         return False, "Integration is disabled. Enable it in Configuration (edit mode) and save, then test again."
-    creds = get_integration_credentials("jira")
-    base = (creds.get("base_url") or "").strip()
-    username = (creds.get("username") or "").strip()
-    token = creds.get("api_token") or ""
+    base, username, token = _get_creds()
     if not base or not username or not token:
         return False, "Missing in Configuration: base URL, username (email), or API token. Enter in Integrations tab and save."
-    url = base.rstrip("/") + "/rest/api/3/myself"
-    auth = (username, token)  # Jira Cloud: email + API token
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            r = await client.get(
-                url,
-                auth=auth,
-                headers={"Accept": "application/json"},
-            )
-            ok = 200 <= r.status_code < 300
-            msg = f"HTTP {r.status_code}" + (f": {r.text[:200]}" if not ok and r.text else "")
-            return ok, msg
+        # Jira Cloud: email + API token
+        r = await _get_client().get(base + "/rest/api/3/myself", auth=(username, token))
+        ok = 200 <= r.status_code < 300
+        msg = f"HTTP {r.status_code}" + (f": {r.text[:200]}" if not ok and r.text else "")
+        return ok, msg
     except Exception as e:
         return False, str(e)
 
@@ -49,68 +113,127 @@ async def create_issue(
     summary: str,
     description: str = "",
     priority: str = "Medium",
-    issue_type: str = "Incident",
+    issue_type: str = DEFAULT_ISSUE_TYPE,
 ) -> tuple[Optional[dict], str]:
     """Create Jira issue. Returns ({"key": "PROJ-123", "id": "..."}, "") on success, (None, error_msg) on failure."""
     if not is_configured():
         return None, "Jira not configured."
-    creds = get_integration_credentials("jira")
-    base = (creds.get("base_url") or "").strip()
-    username = (creds.get("username") or "").strip()
-    token = creds.get("api_token") or ""
-    proj = (project_key or creds.get("project_key") or "").strip()
+    base, username, token = _get_creds()
+    proj = (project_key or get_integration_credentials("jira").get("project_key") or "").strip()
     if not base or not username or not token:
         return None, "Missing Jira base URL, username, or API token in Configuration."
     if not proj:
         return None, "Missing Jira project key. Set it in Configuration (Integrations → Jira → Project key)."
-    url = base.rstrip("/") + "/rest/api/3/issue"
-    desc_content = description or ""
     body = {
         "fields": {
             "project": {"key": proj},
             "summary": summary[:255] if summary else "Incident",
-            "description": {"type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text": desc_content}]}]},
+            "description": _adf([description or ""]),
             "issuetype": {"name": issue_type},
             "priority": {"name": priority},
         }
     }
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            r = await client.post(
-                url,
-                auth=(username, token),
-                headers={"Accept": "application/json", "Content-Type": "application/json"},
-                json=body,
-            )
-            if r.status_code == 201:
-                data = r.json()
-                return {"key": data.get("key"), "id": data.get("id")}, ""
-            err = r.text
-            try:
-                j = r.json()
-                err = j.get("errorMessages", [])
-                if isinstance(err, list) and err:
-                    err = "; ".join(str(m) for m in err)
-                elif isinstance(j.get("errors"), dict):
-                    err = "; ".join(f"{k}: {v}" for k, v in j["errors"].items())
-                else:
-                    err = r.text
-            except Exception:
-                pass
-            return None, f"HTTP {r.status_code}: {err or r.reason_phrase}"
+        r = await _get_client().post(base + "/rest/api/3/issue", auth=(username, token), json=body)
+        if r.status_code == 201:
+            data = r.json()
+            return {"key": data.get("key"), "id": data.get("id")}, ""
+        return None, _error_text(r)
     except Exception as e:
         return None, str(e)
 
 
-async def add_comment(issue_key: str, body: str) -> bool:
-    if not is_configured():
+async def add_comments(issue_key: str, bodies: list[str]) -> bool:
+    """Post several notes as a single comment (one paragraph each). One POST per call."""
+    notes = [b for b in bodies if b and b.strip()]
+    if not is_configured() or not issue_key or not notes:
         return False
-    # TODO: POST /rest/api/3/issue/{key}/comment
-    return False
+    base, username, token = _get_creds()
+    paragraphs: list[str] = []
+    for note in notes:
+        paragraphs.extend(note.splitlines() or [note])
+    try:
+        r = await _get_client().post(
+            base + f"/rest/api/3/issue/{issue_key}/comment",
+            auth=(username, token),
+            json={"body": _adf(paragraphs)},
+        )
+        return 200 <= r.status_code < 300
+    except Exception:
+        return False
+
+
+async def add_comment(issue_key: str, body: str) -> bool:
+    """Add one comment. POST /rest/api/3/issue/{key}/comment."""
+    return await add_comments(issue_key, [body])
 
 
-async def transition(issue_key: str, transition_id: str) -> bool:
+def _project_of(issue_key: str) -> str:
+    return issue_key.rsplit("-", 1)[0] if "-" in issue_key else issue_key
+
+
+async def get_transition_ids(issue_key: str, issue_type: Optional[str] = None, refresh: bool = False) -> dict[str, str]:
+    """Return {name (lower): id} of the transitions available on the issue.
+    Given issue_type, a cached map for (project, issue_type) is returned without a request; otherwise
+    (or with refresh) the issue is fetched with its transitions and the map cached under its real type.
+    GET /rest/api/3/issue/{key}?fields=issuetype&expand=transitions."""
+    if issue_type and not refresh and (_project_of(issue_key), issue_type) in _transition_cache:
+        return _transition_cache[(_project_of(issue_key), issue_type)]
     if not is_configured():
+        return {}
+    base, username, token = _get_creds()
+    try:
+        r = await _get_client().get(
+            base + f"/rest/api/3/issue/{issue_key}",
+            params={"fields": "issuetype", "expand": "transitions"},
+            auth=(username, token),
+        )
+        if not (200 <= r.status_code < 300):
+            return {}
+        data = r.json()
+        actual_type = (((data.get("fields") or {}).get("issuetype") or {}).get("name") or "").strip()
+        ids = {
+            (t.get("name") or "").strip().lower(): str(t.get("id"))
+            for t in data.get("transitions", [])
+            if t.get("id")
+        }
+    except Exception:
+        return {}
+    if ids and actual_type:
+        _transition_cache[(_project_of(issue_key), actual_type)] = ids
+    return ids
+
+
+async def _post_transition(issue_key: str, tid: str) -> int:
+    """POST one transition; the HTTP status, 0 when there is no id, -1 on a request error."""
+    if not tid:
+        return 0
+    base, username, token = _get_creds()
+    try:
+        r = await _get_client().post(
+            base + f"/rest/api/3/issue/{issue_key}/transitions",
+            auth=(username, token),
+            json={"transition": {"id": tid}},
+        )
+    except Exception:
+        return -1
+    return r.status_code
+
+
+async def transition(issue_key: str, transition_id: str, issue_type: Optional[str] = None) -> bool:
+    """Transition an issue. Accepts a numeric id or a transition name (e.g. "Done"), resolved through
+    the transition map (cached when issue_type is given). POST /rest/api/3/issue/{key}/transitions."""
+    if not is_configured() or not issue_key or not transition_id:
         return False
-    # TODO: POST /rest/api/3/issue/{key}/transitions
-    return False
+    name = str(transition_id).strip()
+    if name.isdigit():
+        return 200 <= await _post_transition(issue_key, name) < 300
+    cached = _transition_cache.get((_project_of(issue_key), issue_type)) if issue_type else None
+    ids = cached if cached is not None else await get_transition_ids(issue_key, refresh=True)
+    status = await _post_transition(issue_key, ids.get(name.lower(), ""))
+    if cached is not None and status in (0, 400):
+        # Stale map (workflow changed, or the issue is in another status): refetch this issue's transitions, retry once.
+        _transition_cache.pop((_project_of(issue_key), issue_type), None)
+        ids = await get_transition_ids(issue_key, refresh=True)
+        status = await _post_transition(issue_key, ids.get(name.lower(), ""))
+    return 200 <= status < 300
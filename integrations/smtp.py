@@ -1,6 +1,14 @@
 """
 SMTP notifier. Config-driven; stub if no credentials.
+One persistent connection is reused across sends (reconnects when the server drops it).
+smtplib is blocking, so sends run in a worker thread.
 """
+import asyncio
+import smtplib
+import threading
+from email.message import EmailMessage
+from typing import Optional
+
 from shared.config_loader import get_services_config, get_env
 
 
@@ -12,9 +20,96 @@ def is_configured() -> bool:
     return bool(host)
 
 
-async def send_email(to: str, subject: str, body: str) -> bool:
+def _settings() -> dict:
+    cfg = get_services_config().get("smtp", {})
+    port = get_env(cfg.get("port_env", "SMTP_PORT")) or "587"
+    return {
+        "host": get_env(cfg.get("host_env", "SMTP_HOST")) or "",
+        "port": int(port),
+        "user": get_env(cfg.get("user_env", "SMTP_USER")) or "",
+        "password": get_env(cfg.get("password_env", "SMTP_PASSWORD")) or "",
+        "from": get_env(cfg.get("from_env", "SMTP_FROM")) or get_env(cfg.get("user_env", "SMTP_USER")) or "",
+        "starttls": bool(cfg.get("starttls", True)),
+        "timeout": float(cfg.get("timeout_seconds", 10)),
+    }
+
+
+def default_recipients() -> list[str]:
+    """Addresses from the env var named by smtp.to_env (comma-separated)."""
+    cfg = get_services_config().get("smtp", {})
+    raw = get_env(cfg.get("to_env", "SMTP_TO")) or ""
+    return [a.strip() for a in raw.split(",") if a.strip()]
+
+
+class _SMTPConnection:
+    """Single pooled SMTP session guarded by a lock."""
+
+    def __init__(self):
+        self._conn: Optional[smtplib.SMTP] = None
+        self._key: tuple = ()
+        self._lock = threading.Lock()
+
+    def _open(self, s: dict) -> smtplib.SMTP:
+        if s["port"] == 465:
+            conn = smtplib.SMTP_SSL(s["host"], s["port"], timeout=s["timeout"])
+        else:
+            conn = smtplib.SMTP(s["host"], s["port"], timeout=s["timeout"])
+            if s["starttls"]:
+                conn.starttls()
+        if s["user"] and s["password"]:
+            conn.login(s["user"], s["password"])
+        return conn
+
+    def _drop(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except Exception:
+                pass
+        self._conn = None
+
+    def send(self, s: dict, msg: EmailMessage) -> None:
+        key = (s["host"], s["port"], s["user"])
+        with self._lock:
+            if self._conn is None or key != self._key:
+                self._drop()
+                self._conn, self._key = self._open(s), key
+            try:
+                self._conn.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Idle session closed by the server: reconnect once and retry.
+                self._conn = self._open(s)
+                self._conn.send_message(msg)
+
+    def close(self) -> None:
+        with self._lock:
+            self._drop()
+
+
+_connection = _SMTPConnection()
+
+
+async def send_email(to: str | list[str], subject: str, body: str) -> bool:
     """Send email. Returns True if sent."""
     if not is_configured():
         return False
-    # TODO: aiosmtplib or similar
-    return False
+    recipients = [to] if isinstance(to, str) else list(to)
+    recipients = [r for r in recipients if r] or default_recipients()
+    s = _settings()
+    if not recipients or not s["from"]:
+        return False
+    msg = EmailMessage()
+    msg["From"] = s["from"]
+    msg["To"] = ", ".join(recipients)
+    msg["Subject"] = subject
+    msg.set_content(body)
+    try:
+        await asyncio.to_thread(_connection.send, s, msg)
+        return True
+    except Exception:
+        return False
+
+
+async def aclose() -> None:
+    """Close the pooled session (orchestrator shutdown)."""
+    await asyncio.to_thread(_connection.close)
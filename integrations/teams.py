@@ -1,11 +1,16 @@
 """
 MS Teams: webhook + Adaptive Cards (T.2). Config from UI (local.integrations) or env.
 """
+import json
 import os
+import re
 from typing import Any
 
 import httpx
-from shared.config_loader import get_services_config, get_env, get_integration_credentials
+from shared.config_loader import PROJECT_ROOT, get_services_config, get_env, get_integration_credentials
+
+CARDS_DIR = PROJECT_ROOT / "teams" / "cards"
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
 
 
 def is_configured() -> bool:
@@ -31,6 +36,24 @@ def _get_webhook_url() -> str:
     return (get_env(cfg.get("webhook_url_env", "TEAMS_WEBHOOK_URL")) or "").strip()
 
 
+def load_card(name: str, values: dict[str, Any] | None = None) -> dict:
+    """Load teams/cards/{name}.json and substitute {{key}} placeholders in every string."""
+    with open(CARDS_DIR / f"{name}.json", "r", encoding="utf-8") as f:
+        card = json.load(f)
+    return fill_placeholders(card, values or {})
+
+
+def fill_placeholders(node: Any, values: dict[str, Any]) -> Any:
+    """Recursively replace {{key}} in strings of a card structure (JSON-safe: no raw text templating)."""
+    if isinstance(node, str):
+        return _PLACEHOLDER.sub(lambda m: str(values.get(m.group(1), m.group(0))), node)
+    if isinstance(node, list):
+        return [fill_placeholders(n, values) for n in node]
+    if isinstance(node, dict):
+        return {k: fill_placeholders(v, values) for k, v in node.items()}
+    return node
+
+
 async def send_message(text: str, card: dict | None = None) -> bool:
     """Send text or Adaptive Card to Teams. Returns True if sent (2xx)."""
     if not is_configured():
@@ -39,12 +62,17 @@ async def send_message(text: str, card: dict | None = None) -> bool:
     if not url:
         return False
     try:
-        payload = {"text": text}
+        payload: dict[str, Any] = {"text": text}
         if card:
-            payload["@type"] = "MessageCard"
-            payload["@context"] = "https://schema.org/extensions"
-            payload["summary"] = (text or "")[:100]
-            payload["sections"] = [{"activityTitle": "Approval", "text": text}]
+            payload = {
+                "type": "message",
+                "summary": (text or "")[:100],
+                "attachments": [{
+                    "contentType": "application/vnd.microsoft.card.adaptive",
+                    "contentUrl": None,
+                    "content": card,
+                }],
+            }
         async with httpx.AsyncClient(timeout=10.0) as client:
             r = await client.post(url, json=payload)
         return 200 <= r.status_code < 300
@@ -1,8 +1,19 @@
 """
 Twilio (SMS). Config-driven; stub if no credentials.
+Messages API over a shared keep-alive client (one per event loop).
 """
+import asyncio
+from typing import Optional
+
+import httpx
 from shared.config_loader import get_services_config, get_env
 
+DEFAULT_API_BASE = "https://api.twilio.com/2010-04-01"
+MAX_SMS_CHARS = 1600
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 def is_configured() -> bool:
     cfg = get_services_config().get("twilio", {})
@@ -12,9 +23,54 @@ def is_configured() -> bool:
     return bool(sid)
 
 
-async def send_sms(to: str, body: str) -> bool:
-    """Send SMS. Returns True if sent."""
+def default_recipients() -> list[str]:
+    """Numbers from the env var named by twilio.to_number_env (comma-separated)."""
+    cfg = get_services_config().get("twilio", {})
+    raw = get_env(cfg.get("to_number_env", "TWILIO_TO_NUMBER")) or ""
+    return [n.strip() for n in raw.split(",") if n.strip()]
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Recreated when the running loop changes (the UI runs each action in its own asyncio.run)."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client_loop = loop
+        _client = httpx.AsyncClient(timeout=10.0, limits=httpx.Limits(max_keepalive_connections=5))
+    return _client
+
+
+async def aclose() -> None:
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client, _client_loop = None, None
+
+
+async def send_sms(to: str | list[str], body: str) -> bool:
+    """Send SMS. Returns True if sent (to every recipient)."""
     if not is_configured():
         return False
-    # TODO: httpx to Twilio API
-    return False
+    cfg = get_services_config().get("twilio", {})
+    sid = get_env(cfg.get("account_sid_env", "TWILIO_ACCOUNT_SID")) or ""
+    token = get_env(cfg.get("auth_token_env", "TWILIO_AUTH_TOKEN")) or ""
+    from_number = get_env(cfg.get("from_number_env", "TWILIO_FROM_NUMBER")) or ""
+    recipients = [to] if isinstance(to, str) else list(to)
+    recipients = [r for r in recipients if r] or default_recipients()
+    if not (sid and token and from_number and recipients):
+        return False
+    url = (cfg.get("api_base") or DEFAULT_API_BASE).rstrip("/") + f"/Accounts/{sid}/Messages.json"
+
+    async def _one(number: str) -> bool:
+        try:
+            r = await _get_client().post(
+                url,
+                auth=(sid, token),
+                data={"To": number, "From": from_number, "Body": body[:MAX_SMS_CHARS]},
+            )
+            return 200 <= r.status_code < 300
+        except Exception:
+            return False
+
+    results = await asyncio.gather(*(_one(n) for n in recipients))
+    return all(results)
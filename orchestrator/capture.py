@@ -0,0 +1,106 @@
+"""
+Event capture for record-and-replay: every accepted POST /events body is appended to a rotating
+NDJSON file under data/capture/ with its arrival time and processing duration, so an incident storm
+can be replayed against a new build (simulator/replay.py) and compared with the recorded baseline.
+Off by default; enable in services.yaml (orchestrator.capture). The setting is re-checked on each
+event, so capture can be toggled by editing the YAML (or POST /config/reload) without a restart.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from shared.config_loader import PROJECT_ROOT, get_services_config
+
+DEFAULT_DIR = "data/capture"
+DEFAULT_MAX_FILE_MB = 64
+DEFAULT_MAX_FILES = 10
+FILE_PREFIX = "events-"
+
+
+class EventRecorder:
+    """Appends one JSON line per event; starts a new file past max_bytes and keeps the newest max_files."""
+
+    def __init__(self, directory: Path, max_bytes: int, max_files: int):
+        self.directory = directory
+        self.max_bytes = max(1, max_bytes)
+        self.max_files = max(1, max_files)
+        self.recorded = 0
+        self._file = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _open_new(self) -> None:
+        if self._file:
+            self._file.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        self._file = open(self.directory / f"{FILE_PREFIX}{stamp}.ndjson", "a", encoding="utf-8")
+        self._size = 0
+        for old in capture_files(self.directory)[:-self.max_files]:
+            old.unlink(missing_ok=True)
+
+    def record(self, body: dict, received_at: float, duration_ms: float, result: dict, replayed: bool) -> None:
+        line = json.dumps({
+            "received_at": round(received_at, 6),
+            "duration_ms": round(duration_ms, 3),
+            "decision": result.get("decision") or result.get("routed_to", ""),
+            "replayed": replayed,
+            "body": body,
+        }, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            if self._file is None or self._size >= self.max_bytes:
+                self._open_new()
+            self._file.write(line)
+            self._file.flush()
+            self._size += len(line)
+            self.recorded += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def capture_files(directory: Path) -> list[Path]:
+    """Capture files oldest first (names sort by creation time)."""
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f"{FILE_PREFIX}*.ndjson"))
+
+
+_recorder: Optional[EventRecorder] = None
+_recorder_key: Optional[tuple] = None
+
+
+def get_recorder() -> Optional[EventRecorder]:
+    """The active recorder, or None when capture is disabled."""
+    global _recorder, _recorder_key
+    cfg = (get_services_config().get("orchestrator") or {}).get("capture") or {}
+    if not cfg.get("enabled"):
+        if _recorder is not None:
+            _recorder.close()
+            _recorder = _recorder_key = None
+        return None
+    key = (cfg.get("dir") or DEFAULT_DIR, cfg.get("max_file_mb") or DEFAULT_MAX_FILE_MB, cfg.get("max_files") or DEFAULT_MAX_FILES)
+    if _recorder is None or key != _recorder_key:
+        if _recorder is not None:
+            _recorder.close()
+        directory = Path(key[0])
+        _recorder = EventRecorder(
+            directory if directory.is_absolute() else PROJECT_ROOT / directory,
+            int(float(key[1]) * 1024 * 1024),
+            int(key[2]),
+        )
+        _recorder_key = key
+    return _recorder
+
+
+def close_recorder() -> None:
+    if _recorder is not None:
+        _recorder.close()
@@ -92,7 +92,7 @@ async def run_chronicler(
         log_step(run_id, incident_id, step, "Publisher", "publish_docs",
                  "published",
                  f"Published {len(result.get('published', []))} file(s). "
-                 f"Teams notify: {'sent' if notified else 'skipped'}.",
+                 f"Teams notify: {'queued' if notified == 'queued' else 'sent' if notified else 'skipped'}.",
                  "success", ticket_number=t_num)
         step += 1
 
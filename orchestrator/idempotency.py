@@ -0,0 +1,152 @@
+"""
+Idempotency store for event ingestion: event_id / Idempotency-Key -> original run result.
+Bounded LRU in memory with a TTL, persisted append-only to data/idempotency.csv and reloaded at
+startup. Concurrent deliveries of the same key share one pipeline run.
+"""
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from shared.config_loader import DATA_DIR, get_services_config
+
+IDEMPOTENCY_CSV = DATA_DIR / "idempotency.csv"
+FIELDS = ("key", "created_at", "result")
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class IdempotencyStore:
+    def __init__(
+        self,
+        path: Optional[Path] = IDEMPOTENCY_CSV,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._appended = 0
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        cutoff = time.time() - self.ttl_seconds
+        with open(self.path, "r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                try:
+                    created = float(row["created_at"])
+                    result = json.loads(row["result"])
+                except (KeyError, ValueError, TypeError):
+                    continue
+                if created >= cutoff:
+                    self._remember(row["key"], created, result)
+        self._appended = len(self._entries)
+
+    def _remember(self, key: str, created: float, result: dict) -> None:
+        self._entries[key] = (created, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _persist(self, key: str, created: float, result: dict) -> None:
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Compact once the log holds twice the live entries; otherwise append one row.
+        if self._appended >= 2 * self.max_entries:
+            with open(self.path, "w", newline="", encoding="utf-8") as f:
+                w = csv.DictWriter(f, fieldnames=FIELDS)
+                w.writeheader()
+                for k, (c, r) in self._entries.items():
+                    w.writerow({"key": k, "created_at": f"{c:.3f}", "result": json.dumps(r, default=str)})
+            self._appended = len(self._entries)
+            return
+        file_exists = self.path.exists()
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=FIELDS)
+            if not file_exists:
+                w.writeheader()
+            w.writerow({"key": key, "created_at": f"{created:.3f}", "result": json.dumps(result, default=str)})
+        self._appended += 1
+
+    def get(self, key: str) -> Optional[dict]:
+        """Stored result for key, or None if unknown or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created, result = entry
+        if time.time() - created > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        created = time.time()
+        self._remember(key, created, result)
+        self._persist(key, created, result)
+
+    async def run_once(self, key: str, fn: Callable[[], Awaitable[dict]]) -> tuple[dict, bool]:
+        """Return (result, replayed). Runs fn only for the first delivery of key;
+        duplicates arriving while it runs await the same result."""
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached, True
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending), True
+        self.misses += 1
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await fn()
+        except BaseException as e:
+            # Failed runs are not remembered so the upstream retry is processed again.
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self.put(key, result)
+        fut.set_result(result)
+        return result, False
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._entries), "inflight": len(self._inflight), "hits": self.hits, "misses": self.misses}
+
+
+_store: Optional[IdempotencyStore] = None
+
+
+def get_store() -> IdempotencyStore:
+    """Process-wide store configured from services.yaml (orchestrator.idempotency_*)."""
+    global _store
+    if _store is None:
+        cfg = get_services_config().get("orchestrator", {})
+        _store = IdempotencyStore(
+            ttl_seconds=float(cfg.get("idempotency_ttl_seconds", DEFAULT_TTL_SECONDS)),
+            max_entries=int(cfg.get("idempotency_max_entries", DEFAULT_MAX_ENTRIES)),
+        )
+    return _store
+
+
+def resolve_key(idempotency_key: Optional[str], event_id: Optional[str]) -> str:
+    """Idempotency-Key header wins; otherwise a real event_id. '' means not deduplicated."""
+    key = (idempotency_key or "").strip()
+    if key:
+        return key
+    eid = (event_id or "").strip()
+    return eid if eid and eid != "unknown" else ""
@@ -3,17 +3,171 @@ Orchestrator entry point (0.2): FastAPI app, async, single entry for events.
 Phase 3.4: Close incident API.
 Phase 4: Chronicler (doc-gen) triggered on close and via manual endpoint.
 """
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Any, Optional
 
-from orchestrator.router import handle_event
+from orchestrator.router import build_event, handle_event_once
 from orchestrator.webhooks import router as webhooks_router
 
 app = FastAPI(title="SENTRY/ARGUS Orchestrator", version="0.1.0")
 app.include_router(webhooks_router)
 
 
+@app.on_event("startup")
+async def _validate_tables():
+    """Fail fast on misconfigured mapping / maintenance tables instead of on the first ticket."""
+    from agents.monitor.maintenance import load_windows
+    from agents.tickets.ticket_writer import get_mappings
+    get_mappings()
+    load_windows()
+
+
+@app.on_event("startup")
+async def _warm_indexes():
+    from agents.triage.kb_index import get_index
+    from agents.triage.rca_history import get_history_index
+    get_index()
+    get_history_index()
+
+
+@app.on_event("shutdown")
+async def _close_clients():
+    from agents.monitor.anomaly import get_detector
+    from agents.notify.digest import get_digest
+    from integrations import jira, smtp, twilio
+    from orchestrator.capture import close_recorder
+    from shared import llm_client
+    await get_digest().flush_all()
+    await jira.aclose()
+    await smtp.aclose()
+    await twilio.aclose()
+    await llm_client.get_client().aclose()
+    get_detector().snapshot()
+    close_recorder()
+
+
+@app.post("/config/reload")
+async def config_reload():
+    """Drop cached YAML config snapshots (they also refresh on file mtime change)."""
+    from shared.config_loader import reload_config
+    return reload_config()
+
+
+@app.get("/stream/trace")
+async def stream_trace(
+    request: Request,
+    run_id: Optional[str] = None,
+    since: Optional[int] = None,
+    last_event_id: Optional[str] = Header(None),
+):
+    """Server-Sent Events: one `step` event per trace row as log_step writes it, optionally for one run_id.
+    Reconnects resume after Last-Event-ID (or ?since=N) from the recent-row buffer."""
+    from shared.trace_bus import HEARTBEAT_SECONDS, get_bus
+
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    bus = get_bus()
+    sub = bus.subscribe(run_id, since)
+
+    async def events():
+        try:
+            yield "retry: 2000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    seq, row = await asyncio.wait_for(sub.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"id: {seq}\nevent: step\ndata: {json.dumps(row, default=str)}\n\n"
+        finally:
+            bus.unsubscribe(sub)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def _values(param: Optional[str]) -> list[str]:
+    return [v.strip() for v in (param or "").split(",") if v.strip()]
+
+
+@app.get("/incidents")
+def list_incidents(
+    status: Optional[str] = None,
+    severity: Optional[str] = None,
+    service: Optional[str] = None,
+    parent_incident_id: Optional[str] = None,
+    top_level: bool = False,
+    sort: str = "",
+    order: str = "desc",
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    fields: Optional[str] = None,
+):
+    """Page of incidents, newest first unless sort/order say otherwise. Filters take comma-separated values;
+    top_level keeps masters and standalone incidents, plus children whose master the filters exclude.
+    fields adds the computed run_id on request."""
+    from orchestrator.read_store import get_read_store, parse_fields
+
+    filters = {"status": _values(status), "severity": _values(severity), "service": _values(service),
+               "parent_incident_id": _values(parent_incident_id)}
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    try:
+        return get_read_store().list_incidents(filters, cursor, limit, sort, order == "desc", parse_fields(fields),
+                                               top_level)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/incidents/{incident_id}")
+def get_incident(incident_id: str, fields: Optional[str] = None):
+    from orchestrator.read_store import get_read_store, parse_fields
+
+    item = get_read_store().get_incident(incident_id, parse_fields(fields))
+    if item is None:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    return item
+
+
+@app.get("/runs/{run_id}/steps")
+def run_steps(run_id: str, cursor: Optional[str] = None, limit: int = 50, fields: Optional[str] = None):
+    """Trace steps of one pipeline run in logged order."""
+    from orchestrator.read_store import get_read_store, parse_fields
+
+    try:
+        return get_read_store().run_steps(run_id, cursor, limit, parse_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/audit")
+def list_audit(
+    kind: str = "simple",
+    agent_id: Optional[str] = None,
+    action_type: Optional[str] = None,
+    outcome: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    fields: Optional[str] = None,
+):
+    """Page of audit entries (simple or comprehensive log), newest first."""
+    from orchestrator.read_store import get_read_store, parse_fields
+
+    filters = {"agent_id": _values(agent_id), "action_type": _values(action_type),
+               "outcome": _values(outcome), "entity_id": _values(entity_id)}
+    try:
+        return get_read_store().list_audit(kind, filters, cursor, limit, parse_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 class EventIn(BaseModel):
     event_id: Optional[str] = None
     type: str = "simulated"
@@ -21,11 +175,29 @@ class EventIn(BaseModel):
 
 
 @app.post("/events")
-async def post_event(event: EventIn):
-    """Receive events (simulator or external); route via orchestrator."""
-    payload = event.payload or {}
-    body = {"event_id": event.event_id or payload.get("event_id", "unknown"), "type": event.type, **payload}
-    return await handle_event(body)
+async def post_event(event: EventIn, response: Response, idempotency_key: Optional[str] = Header(None)):
+    """Receive events (simulator or external); route via orchestrator.
+    Retries with the same Idempotency-Key header or event_id return the original result."""
+    from orchestrator.capture import get_recorder
+    received_at, t0 = time.time(), time.perf_counter()
+    body = build_event(event.event_id, event.type, event.payload)
+    result, replayed = await handle_event_once(body, idempotency_key)
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    recorder = get_recorder()
+    if recorder is not None:
+        recorder.record(
+            {"event_id": event.event_id, "type": event.type, "payload": event.payload},
+            received_at, (time.perf_counter() - t0) * 1000, result, replayed,
+        )
+    return result
+
+
+def _history_features(incident_id: str) -> dict:
+    """Historical-RCA features of a closing incident, from its own run only."""
+    from agents.triage.rca_history import run_features
+    from orchestrator.read_store import get_read_store
+    return run_features(get_read_store().incident_steps(incident_id))
 
 
 @app.post("/incidents/{incident_id}/close")
@@ -33,6 +205,7 @@ async def close_incident(incident_id: str):
     """Close incident and ticket; mark incident status closed; auto-trigger Chronicler."""
     from agents.monitor.incident_creator import get_incident_row, set_incident_status
     from agents.triage.closer import close_incident_and_ticket
+    from agents.triage.rca_history import get_history_index
     from shared.trace import log_step, get_run_id_for_incident, get_max_step
     from orchestrator.chronicler_pipeline import run_chronicler
 
@@ -73,6 +246,7 @@ async def close_incident(incident_id: str):
                  ticket_number=ticket_number)
 
     set_incident_status(incident_id, "closed")
+    get_history_index().add_closed(incident_id, _history_features(incident_id))
     step += 1
 
     log_step(run_id, incident_id, step, "Pipeline", "close_complete",
@@ -97,6 +271,7 @@ async def cascade_close_incident(incident_id: str):
     from agents.monitor.incident_creator import get_incident_row, set_incident_status
     from agents.monitor.correlator import get_children
     from agents.triage.closer import close_incident_and_ticket
+    from agents.triage.rca_history import get_history_index
     from shared.trace import log_step, get_run_id_for_incident, get_max_step
     from shared import audit
     from orchestrator.chronicler_pipeline import run_chronicler
@@ -154,6 +329,7 @@ async def cascade_close_incident(incident_id: str):
 
         ok = await close_incident_and_ticket(c_id, c_ticket_id, c_ticket_sys, c_ticket_num)
         set_incident_status(c_id, "closed")
+        get_history_index().add_closed(c_id, _history_features(c_id))
 
         if ok:
             children_closed += 1
@@ -185,6 +361,7 @@ async def cascade_close_incident(incident_id: str):
 
     master_ok = await close_incident_and_ticket(incident_id, ticket_id, ticket_system, ticket_number)
     set_incident_status(incident_id, "closed")
+    get_history_index().add_closed(incident_id, _history_features(incident_id))
 
     if master_ok:
         audit.log_comprehensive(
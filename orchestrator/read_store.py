@@ -0,0 +1,375 @@
+"""
+Read API storage (GET /incidents, /incidents/{id}, /runs/{run_id}/steps, /audit).
+
+Incidents, the incident -> run index, the run -> ticket stamps and the audit logs are small next to
+trace.csv; each Table mirrors one of them in memory: rows in file order, a primary-key map and
+per-value position lists for the filterable columns, kept current with shared.csv_tail (appended
+rows are indexed incrementally; a rewrite such as a status change in incidents.csv rebuilds the
+table on the next read). A query starts from the shortest matching position list, walks it in the requested order
+from the cursor and stops after `limit` matches, so a page costs O(limit) rather than a file scan.
+
+Cursors are opaque (the sort key of the last row returned): pages stay stable while rows are
+appended. `fields` projects each item to the named columns.
+
+trace.csv is not mirrored (it is the largest file). A run's steps are found by reading the file in
+chunks of whole records, searching each for ",<run_id>," and parsing only the matching records (plain
+reads, not mmap: a concurrent truncation must not fault the process); the cursor counts the steps
+already returned.
+"""
+from __future__ import annotations
+
+import base64
+import bisect
+import heapq
+import csv
+import io
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from agents.monitor.incident_creator import INCIDENT_RUNS_CSV, INCIDENTS_CSV
+from shared.audit import AUDIT_COMPREHENSIVE_PATH, AUDIT_SIMPLE_PATH
+from shared.csv_tail import CsvTail, _record_end
+from shared.trace import RUN_TICKETS_PATH, TRACE_PATH
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+SCAN_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def encode_cursor(key: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    if not isinstance(key, list) or not key or not isinstance(key[-1], int):
+        raise ValueError("Invalid cursor")
+    return key
+
+
+def parse_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """'a,b,c' -> ['a', 'b', 'c']; empty -> None (all fields)."""
+    names = [f.strip() for f in (fields or "").split(",") if f.strip()]
+    return names or None
+
+
+class Table:
+    def __init__(self, path: Path, key: Optional[str] = None, indexed: tuple[str, ...] = (),
+                 sortable: tuple[str, ...] = ()):
+        self.tail = CsvTail(path)
+        self.key = key
+        self.indexed = indexed
+        self.sortable = sortable
+        self.header: list[str] = []
+        self.rows: list[list[str]] = []
+        self.by_key: dict[str, int] = {}
+        self.index: dict[str, dict[str, list[int]]] = {f: {} for f in indexed}
+        self._sorted: dict[str, list[tuple[str, int]]] = {}
+        self._lock = threading.RLock()
+
+    def _clear(self) -> None:
+        self.header, self.rows, self.by_key = [], [], {}
+        self.index = {f: {} for f in self.indexed}
+
+    def refresh(self) -> None:
+        with self._lock:
+            reset, rows = self.tail.poll()
+            if reset:
+                self._clear()
+            if not rows:
+                if reset:
+                    self._sorted.clear()
+                return
+            self.header = self.tail.header
+            col = {name: i for i, name in enumerate(self.header)}
+            key_i = col.get(self.key)
+            index_cols = [(self.index[f], col[f]) for f in self.indexed if f in col]
+            width = len(self.header)
+            for values in rows:
+                if len(values) != width:
+                    values = (values + [""] * width)[:width]
+                pos = len(self.rows)
+                self.rows.append(values)
+                if key_i is not None:
+                    self.by_key[values[key_i]] = pos
+                for idx, i in index_cols:
+                    idx.setdefault(values[i], []).append(pos)
+            self._sorted.clear()
+
+    def value(self, pos: int, field: str) -> str:
+        try:
+            return self.rows[pos][self.header.index(field)]
+        except ValueError:
+            return ""
+
+    def item(self, pos: int, fields: Optional[list[str]] = None) -> dict:
+        row = dict(zip(self.header, self.rows[pos]))
+        return row if fields is None else {f: row.get(f, "") for f in fields}
+
+    def get(self, key: str, fields: Optional[list[str]] = None) -> Optional[dict]:
+        with self._lock:
+            self.refresh()
+            pos = self.by_key.get(key)
+            return None if pos is None else self.item(pos, fields)
+
+    def _positions(self, filters: dict[str, list[str]]) -> Optional[list[int]]:
+        """Ascending positions matching the most selective indexed filter (None: no filter, all rows)."""
+        best = None
+        for field, values in filters.items():
+            lists = [self.index[field].get(v, []) for v in values]
+            if best is None or sum(map(len, lists)) < sum(map(len, best)):
+                best = lists
+        if best is None:
+            return None
+        return best[0] if len(best) == 1 else list(heapq.merge(*best))
+
+    def _sorted_keys(self, field: str) -> list[tuple[str, int]]:
+        if field not in self._sorted:
+            i = self.header.index(field) if field in self.header else None
+            self._sorted[field] = sorted(((r[i] if i is not None else ""), p) for p, r in enumerate(self.rows))
+        return self._sorted[field]
+
+    def _walk(self, positions: Optional[list[int]], sort: str, descending: bool,
+              after: Optional[list]) -> Iterator[tuple[list, int]]:
+        """(cursor key, position) in order, strictly after the cursor."""
+        if sort:
+            keys = self._sorted_keys(sort)
+            allowed = None if positions is None else set(positions)
+            if descending:
+                start = len(keys) if after is None else bisect.bisect_left(keys, (after[0], after[1]))
+                seq = (keys[j] for j in range(start - 1, -1, -1))
+            else:
+                start = 0 if after is None else bisect.bisect_right(keys, (after[0], after[1]))
+                seq = (keys[j] for j in range(start, len(keys)))
+            for value, pos in seq:
+                if allowed is None or pos in allowed:
+                    yield [value, pos], pos
+            return
+        n = len(self.rows)
+        if descending:
+            stop = n if after is None else after[0]
+            seq = (range(min(stop, n) - 1, -1, -1) if positions is None
+                   else (positions[j] for j in range(bisect.bisect_left(positions, stop) - 1, -1, -1)))
+        else:
+            start = 0 if after is None else after[0] + 1
+            seq = (range(start, n) if positions is None
+                   else (positions[j] for j in range(bisect.bisect_left(positions, start), len(positions))))
+        for pos in seq:
+            yield [pos], pos
+
+    def query(
+        self,
+        filters: Optional[dict[str, list[str]]] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT,
+        sort: str = "",
+        descending: bool = True,
+        fields: Optional[list[str]] = None,
+        extra: Optional[Callable[[int, dict], None]] = None,
+        where: Optional[Callable[[int], bool]] = None,
+    ) -> dict:
+        """One page: {"items": [...], "next_cursor": str | None}. filters: field -> accepted values;
+        where: further test on a row position."""
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+        if sort and sort not in self.sortable:
+            raise ValueError(f"Cannot sort by '{sort}'. Choose from {list(self.sortable)}")
+        filters = {f: v for f, v in (filters or {}).items() if v}
+        unknown = [f for f in filters if f not in self.indexed]
+        if unknown:
+            raise ValueError(f"Cannot filter by {unknown}. Choose from {list(self.indexed)}")
+        after = decode_cursor(cursor) if cursor else None
+        if after is not None and len(after) != (2 if sort else 1):
+            raise ValueError("Cursor does not match the requested sort")
+
+        with self._lock:
+            self.refresh()
+            positions = self._positions(filters)
+            checks = [(self.header.index(f), set(v)) for f, v in filters.items() if f in self.header]
+            items, last = [], None
+            for key, pos in self._walk(positions, sort, descending, after):
+                row = self.rows[pos]
+                if any(row[i] not in accepted for i, accepted in checks) or (where and not where(pos)):
+                    continue
+                if len(items) == limit:
+                    return {"items": items, "next_cursor": encode_cursor(last)}
+                item = self.item(pos, fields)
+                if extra:
+                    extra(pos, item)
+                items.append(item)
+                last = key
+        return {"items": items, "next_cursor": None}
+
+
+def _record(buf: bytes, start: int) -> tuple[list[str], int]:
+    """Parse the record starting at start; (fields, offset after it)."""
+    end = buf.find(b"\n", start)
+    while end >= 0 and buf[start:end].count(b'"') % 2:
+        end = buf.find(b"\n", end + 1)
+    end = len(buf) if end < 0 else end + 1
+    rows = list(csv.reader(io.StringIO(buf[start:end].decode("utf-8", errors="replace"), newline="")))
+    return (rows[0] if rows else []), end
+
+
+def _bodies(f) -> Iterator[bytes]:
+    """The file as consecutive runs of whole records, about SCAN_CHUNK_BYTES each."""
+    carry = b""
+    while True:
+        data = f.read(SCAN_CHUNK_BYTES)
+        if not data:
+            if carry:
+                yield carry
+            return
+        chunk = carry + data
+        end = _record_end(chunk)
+        if end:
+            yield chunk[:end]
+        carry = chunk[end:]
+
+
+def scan_run(path: Path, run_id: str, skip: int, limit: int) -> tuple[list[str], list[list[str]], bool]:
+    """(header, rows, more): rows of run_id in file order after the first `skip`, at most `limit`."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return [], [], False
+    header: list[str] = []
+    rows: list[list[str]] = []
+    with f:
+        if not run_id:
+            return header, rows, False
+        needle = f",{run_id},".encode()
+        for body in _bodies(f):
+            pos = 0
+            if not header:
+                header, pos = _record(body, 0)
+                if "run_id" not in header:
+                    return header, rows, False
+                col = header.index("run_id")
+            while True:
+                hit = body.find(needle, pos)
+                if hit < 0:
+                    break
+                row, end = _record(body, body.rfind(b"\n", 0, hit) + 1)
+                if len(row) != len(header) or row[col] != run_id:
+                    pos = hit + 1  # the id inside another field, not a record of the run
+                    continue
+                pos = end
+                if skip:
+                    skip -= 1
+                elif len(rows) == limit:
+                    return header, rows, True
+                else:
+                    rows.append(row)
+    return header, rows, False
+
+
+class ReadStore:
+    def __init__(self):
+        self.incidents = Table(
+            INCIDENTS_CSV, key="incident_id",
+            indexed=("status", "severity", "service", "parent_incident_id"),
+            sortable=("severity", "service", "summary"),
+        )
+        self.runs = Table(INCIDENT_RUNS_CSV, key="incident_id")
+        self.tickets = Table(RUN_TICKETS_PATH, key="run_id")
+        self.audit = {
+            "simple": Table(AUDIT_SIMPLE_PATH, indexed=("agent_id", "action_type", "outcome", "entity_id")),
+            "comprehensive": Table(AUDIT_COMPREHENSIVE_PATH, indexed=("agent_id", "action_type", "outcome", "entity_id")),
+        }
+
+    def run_for_incident(self, incident_id: str) -> str:
+        """Pipeline run that created the incident ('' if it predates the index)."""
+        pos = self.runs.by_key.get(incident_id)
+        return "" if pos is None else self.runs.value(pos, "run_id")
+
+    def incident_steps(self, incident_id: str) -> list[dict]:
+        """Trace rows of the run that created the incident ([] if it predates the index)."""
+        self.runs.refresh()
+        run_id = self.run_for_incident(incident_id)
+        return self.run_steps(run_id, limit=MAX_LIMIT)["items"] if run_id else []
+
+    def _with_run_id(self, fields: Optional[list[str]]) -> tuple[Optional[list[str]], Optional[Callable]]:
+        """Split the computed run_id field out of a projection."""
+        if fields is not None and "run_id" not in fields:
+            return fields, None
+        self.runs.refresh()
+        table_fields = None if fields is None else [f for f in fields if f != "run_id"]
+
+        def add(pos: int, item: dict) -> None:
+            item["run_id"] = self.run_for_incident(self.incidents.value(pos, "incident_id"))
+        return table_fields, add
+
+    def _shown_alone(self, pos: int, filters: dict[str, list[str]]) -> bool:
+        """Top level under filters: a master, a standalone incident, or a child whose master is filtered out."""
+        parent = self.incidents.value(pos, "parent_incident_id")
+        if parent in ("", "SELF"):
+            return True
+        parent_pos = self.incidents.by_key.get(parent)
+        return parent_pos is None or any(self.incidents.value(parent_pos, f) not in v for f, v in filters.items())
+
+    def list_incidents(self, filters: dict[str, list[str]], cursor: Optional[str] = None, limit: int = DEFAULT_LIMIT,
+                       sort: str = "", descending: bool = True, fields: Optional[list[str]] = None,
+                       top_level: bool = False) -> dict:
+        """Incidents newest first by default (file order); sort by severity/service/summary instead.
+        top_level: masters and standalone incidents, plus children that match the filters while their
+        master does not (they would not appear under it)."""
+        where = None
+        if top_level:
+            filters = {f: v for f, v in filters.items() if v and f != "parent_incident_id"}
+            if filters:
+                where = lambda pos: self._shown_alone(pos, filters)
+            else:
+                filters = {"parent_incident_id": ["", "SELF"]}
+        table_fields, add = self._with_run_id(fields)
+        page = self.incidents.query(filters, cursor, limit, sort, descending, table_fields, add, where)
+        if fields is not None:
+            page["items"] = [{f: item.get(f, "") for f in fields} for item in page["items"]]
+        return page
+
+    def get_incident(self, incident_id: str, fields: Optional[list[str]] = None) -> Optional[dict]:
+        table_fields, add = self._with_run_id(fields)
+        item = self.incidents.get(incident_id, table_fields)
+        if item is None:
+            return None
+        if add:
+            item["run_id"] = self.run_for_incident(incident_id)
+        return item if fields is None else {f: item.get(f, "") for f in fields}
+
+    def run_steps(self, run_id: str, cursor: Optional[str] = None, limit: int = DEFAULT_LIMIT,
+                  fields: Optional[list[str]] = None) -> dict:
+        """Steps of one run in the order they were logged."""
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+        skip = decode_cursor(cursor)[0] if cursor else 0
+        header, rows, more = scan_run(TRACE_PATH, run_id, skip, limit)
+        items = [dict(zip(header, r)) for r in rows]
+        stamp = self.tickets.get(run_id, ["ticket_number"]) if items else None
+        for item in items:
+            if stamp and not item.get("ticket_number"):
+                item["ticket_number"] = stamp["ticket_number"]
+        if fields is not None:
+            items = [{f: item.get(f, "") for f in fields} for item in items]
+        return {"items": items, "next_cursor": encode_cursor([skip + len(rows)]) if more else None}
+
+    def list_audit(self, kind: str, filters: dict[str, list[str]], cursor: Optional[str] = None,
+                   limit: int = DEFAULT_LIMIT, fields: Optional[list[str]] = None) -> dict:
+        """Audit entries newest first."""
+        if kind not in self.audit:
+            raise ValueError(f"Unknown audit log '{kind}'. Choose from {list(self.audit)}")
+        return self.audit[kind].query(filters, cursor, limit, fields=fields)
+
+
+_store: Optional[ReadStore] = None
+
+
+def get_read_store() -> ReadStore:
+    global _store
+    if _store is None:
+        _store = ReadStore()
+    return _store
@@ -22,7 +22,7 @@ async def _run_triage_pipeline(run_id: str, incident, ticket: dict, step: int, t
     """Phase 2.1: RCA -> Recommender -> Enricher. Returns (runbooks, next_step)."""
     ticket_id = ticket.get("ticket_id")
     ticket_system = (ticket.get("ticket_system") or "").strip().lower()
-    from agents.triage.rca import run_rca
+    from agents.triage.rca import run_rca_llm
     from agents.triage.recommender import suggest_runbooks
     from agents.triage.enricher import enrich_ticket
 
@@ -30,7 +30,7 @@ async def _run_triage_pipeline(run_id: str, incident, ticket: dict, step: int, t
     log_step(run_id, incident.incident_id, step, "RCA Agent", "analyse_root_cause",
              "invoke", "Incident created with ticket — run root-cause analysis to identify hypotheses.",
              "started", ticket_number=t_num)
-    hypotheses = run_rca(
+    hypotheses = await run_rca_llm(
         incident.incident_id, incident.service, incident.summary, {}, context=incident.context,
     )
     hyp_summary = "; ".join((h.text if hasattr(h, "text") else str(h))[:80] for h in hypotheses[:3]) if hypotheses else "none"
@@ -46,7 +46,7 @@ async def _run_triage_pipeline(run_id: str, incident, ticket: dict, step: int, t
     runbooks = suggest_runbooks(incident.summary, incident.service)
     rb_names = ", ".join(r.get("name", r.get("path", "?")) for r in runbooks[:3]) if runbooks else "none"
     log_step(run_id, incident.incident_id, step, "Recommender", "suggest_runbooks",
-             f"{len(runbooks)} runbooks found", f"Matched runbooks by keywords in summary/service: {rb_names}",
+             f"{len(runbooks)} runbooks found", f"Ranked knowledge base by BM25 over summary/service: {rb_names}",
              "success", rb_names, ticket_number=t_num)
     step += 1
 
@@ -133,15 +133,15 @@ async def _run_monitor_pipeline(payload: dict) -> dict:
                  f"{ev.service}/{ev.metric}.",
                  "warning", f"old_ticket={old_ticket}")
         audit.log_simple("alert_router", "reopen_detected", old_ticket, "warning")
-        from integrations.teams import is_configured as teams_configured, send_message
-        if teams_configured():
-            try:
-                await send_message(
-                    f"⚠️ **Re-open alert**: Resolved incident **{old_ticket}** may be recurring.\n"
-                    f"New event: {ev.metric}={ev.value} on {ev.service}."
-                )
-            except Exception:
-                pass
+        from agents.notify import digest
+        try:
+            await digest.submit(
+                "reopen", "⚠️ Re-open alert", ev.service, "high",
+                f"Resolved incident {old_ticket} may be recurring. New event: {ev.metric}={ev.value}.",
+                old_ticket,
+            )
+        except Exception:
+            pass
         step += 1
 
     # Incident Creator
@@ -152,7 +152,7 @@ async def _run_monitor_pipeline(payload: dict) -> dict:
     incident = create_incident(
         service=ev.service, summary=summary,
         context={"metric": ev.metric, "value": ev.value, "event_id": ev.event_id},
-        metric=ev.metric, value=ev.value,
+        metric=ev.metric, value=ev.value, run_id=run_id,
     )
     log_step(run_id, incident.incident_id, step, "Incident Creator", "create_incident",
              "created", f"Incident {incident.incident_id} created with severity={incident.severity} for {incident.service}.",
@@ -162,10 +162,11 @@ async def _run_monitor_pipeline(payload: dict) -> dict:
     # Correlator — check for similar open incidents, group under master
     from agents.monitor.correlator import correlate_and_group
     log_step(run_id, incident.incident_id, step, "Correlator", "correlate_incidents",
-             "invoke", "Scanning open incidents for similar service + metric to detect correlated issues.",
+             "invoke", "Querying LSH index of open incidents for similar summaries on the same service.",
              "started")
     correlation = await correlate_and_group(
         incident.incident_id, incident.service, incident.summary, incident.severity,
+        context=incident.context,
     )
     if correlation:
         p_id = correlation.get("parent_incident_id", "")
@@ -188,10 +189,14 @@ async def _run_monitor_pipeline(payload: dict) -> dict:
     log_step(run_id, incident.incident_id, step, "Notifier", "send_notifications",
              "invoke", "Notify configured channels (Teams, email) about new incident.",
              "started")
-    await notify_incident(incident.incident_id, incident.service, incident.summary, incident.severity)
+    channel_results = await notify_incident(incident.incident_id, incident.service, incident.summary, incident.severity)
+    channel_summary = ", ".join(f"{ch}={r['status']}" for ch, r in channel_results.items()) or "no channels"
+    notified = any(r.get("ok") for r in channel_results.values())
+    queued = any(r.get("status") == "queued" for r in channel_results.values())
     log_step(run_id, incident.incident_id, step, "Notifier", "send_notifications",
-             "notified", "Notification dispatched to configured channels.",
-             "success")
+             "notified" if notified else "queued" if queued else "no_channel",
+             f"Notification fanned out concurrently to channels for severity={incident.severity}: {channel_summary}.",
+             "success" if notified or queued else "skipped", channel_summary)
     step += 1
 
     # Ticket Writer
@@ -271,6 +276,25 @@ async def _run_monitor_pipeline(payload: dict) -> dict:
     }
 
 
+def build_event(event_id: str | None, event_type: str, payload: dict | None) -> dict:
+    """Flatten an {event_id, type, payload} envelope into the dict handle_event expects."""
+    payload = payload or {}
+    return {"event_id": event_id or payload.get("event_id", "unknown"), "type": event_type, **payload}
+
+
+async def handle_event_once(event: dict, idempotency_key: str | None = None) -> tuple[dict, bool]:
+    """handle_event deduplicated on Idempotency-Key or event_id. Returns (result, replayed)."""
+    from orchestrator.idempotency import get_store, resolve_key
+
+    key = resolve_key(idempotency_key, event.get("event_id"))
+    if not key:
+        return await handle_event(event), False
+    result, replayed = await get_store().run_once(key, lambda: handle_event(event))
+    if replayed:
+        audit.log_simple("conductor", "duplicate_event", key, "replayed")
+    return result, replayed
+
+
 async def handle_event(event: dict) -> dict:
     """Single entry point: receive event, route by policy, run phase pipeline."""
     event_id = event.get("event_id", "unknown")
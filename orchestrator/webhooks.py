@@ -1,7 +1,7 @@
 """
 Webhook endpoints (A.2, A.3): optional ingest + Teams callback + Phase 3 approval.
 """
-from fastapi import APIRouter, Request, Header, HTTPException
+from fastapi import APIRouter, Request, Response, Header, HTTPException
 from pydantic import BaseModel
 from typing import Optional, Literal
 
@@ -51,10 +51,28 @@ async def approval_webhook(body: ApprovalBody):
 
 
 @router.post("/ingest")
-async def ingest_webhook(request: Request, x_idempotency_key: Optional[str] = Header(None)):
-    """Optional: real-time ingestion. Validate payload; optional idempotency key."""
+async def ingest_webhook(
+    request: Request,
+    response: Response,
+    x_idempotency_key: Optional[str] = Header(None),
+    idempotency_key: Optional[str] = Header(None),
+):
+    """Real-time ingestion: {event_id?, type?, payload} or a flat event. Deduplicated on
+    X-Idempotency-Key / Idempotency-Key, else event_id; repeats return the original result."""
+    from orchestrator.router import build_event, handle_event_once
+
     body = await request.json()
-    return {"status": "received", "idempotency_key": x_idempotency_key}
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Expected a JSON object")
+    if isinstance(body.get("payload"), dict):
+        event = build_event(body.get("event_id"), body.get("type") or "alert", body["payload"])
+    else:
+        event = build_event(body.get("event_id"), body.get("type") or "alert", body)
+    key = x_idempotency_key or idempotency_key
+    result, replayed = await handle_event_once(event, key)
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return {"status": "received", "idempotency_key": key or event.get("event_id"), "replayed": replayed, "result": result}
 
 
 @router.post("/teams/callback")
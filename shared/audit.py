@@ -3,15 +3,14 @@ Audit logging — simple and comprehensive, file-based CSV (AL.1, AL.2, 5.4).
 No PII in payload_summary by default (S.2).
 """
 import csv
-import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-# Default paths relative to project root
-_PROJECT_ROOT = Path(__file__).resolve().parents[1]
-AUDIT_SIMPLE_PATH = _PROJECT_ROOT / "data" / "audit" / "simple.csv"
-AUDIT_COMPREHENSIVE_PATH = _PROJECT_ROOT / "data" / "audit" / "comprehensive.csv"
+from shared.config_loader import DATA_DIR
+
+AUDIT_SIMPLE_PATH = DATA_DIR / "audit" / "simple.csv"
+AUDIT_COMPREHENSIVE_PATH = DATA_DIR / "audit" / "comprehensive.csv"
 
 
 def _ensure_audit_dir():
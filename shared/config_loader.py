@@ -1,5 +1,9 @@
-"""Load YAML config; resolve paths relative to project root. Integration credentials from UI (local file), not .env."""
+"""Load YAML config; resolve paths relative to project root. Integration credentials from UI (local file), not .env.
+Getters return frozen snapshots (read-only dicts with attribute access) cached per file; a file is
+re-parsed only when its mtime changes (checked at most once a second) or on reload_config()."""
 import os
+import threading
+import time
 from pathlib import Path
 from typing import Any, Optional
 
@@ -7,10 +11,65 @@ import yaml
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 CONFIG_DIR = PROJECT_ROOT / "config"
-DATA_DIR = PROJECT_ROOT / "data"
+# SENTRY_DATA_DIR points the orchestrator and UI at another data tree (e.g. simulator/datagen.py output)
+DATA_DIR = Path(os.environ["SENTRY_DATA_DIR"]).resolve() if os.environ.get("SENTRY_DATA_DIR") else PROJECT_ROOT / "data"
 CONFIG_TABLES_DIR = CONFIG_DIR / "tables"
 # UI-configured credentials (gitignored); not using .env for integrations
 LOCAL_INTEGRATIONS_PATH = CONFIG_DIR / "local.integrations.yaml"
+CHECK_INTERVAL_SECONDS = 1.0
+_AGENTS_PATH = CONFIG_DIR / "agents.yaml"
+_SERVICES_PATH = CONFIG_DIR / "services.yaml"
+_INTEGRATIONS_PATH = CONFIG_DIR / "integrations.yaml"
+_RAG_PATH = CONFIG_DIR / "rag.yaml"
+
+
+class FrozenConfig(dict):
+    """Read-only config mapping: cfg["llm"]["enabled"] or cfg.llm.enabled. Copy with thaw() to edit."""
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("config snapshot is read-only; use thaw() for an editable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenConfig, (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenConfig({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain (mutable) dict/list copy of a config snapshot."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+_EMPTY = FrozenConfig()
+_snapshots: dict[Path, tuple[int, float, FrozenConfig]] = {}  # path -> (mtime_ns, checked_at, data)
+_snapshot_lock = threading.Lock()
+_reloads = 0
 
 
 def _load_yaml(path: Path) -> dict:
@@ -23,28 +82,60 @@ def _load_yaml(path: Path) -> dict:
 def _save_yaml(path: Path, data: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(thaw(data), f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    with _snapshot_lock:
+        _snapshots.pop(path, None)
+
+
+def _cached_yaml(path: Path) -> FrozenConfig:
+    """Frozen snapshot of a YAML file, re-parsed only when its mtime changes."""
+    global _reloads
+    now = time.monotonic()
+    snap = _snapshots.get(path)
+    if snap is not None and now - snap[1] < CHECK_INTERVAL_SECONDS:
+        return snap[2]
+    mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    with _snapshot_lock:
+        snap = _snapshots.get(path)
+        if snap is None or snap[0] != mtime_ns:
+            data = _freeze(_load_yaml(path))
+            _reloads += 1
+        else:
+            data = snap[2]
+        _snapshots[path] = (mtime_ns, now, data)
+    return data
+
+
+def reload_config() -> dict:
+    """Drop every cached snapshot; the next getter call re-reads its file."""
+    with _snapshot_lock:
+        _snapshots.clear()
+    return config_stats()
+
+
+def config_stats() -> dict:
+    return {"reloads": _reloads, "cached_files": sorted(p.name for p in _snapshots)}
 
 
-def get_agents_config() -> dict:
-    return _load_yaml(CONFIG_DIR / "agents.yaml")
+def get_agents_config() -> FrozenConfig:
+    return _cached_yaml(_AGENTS_PATH)
 
 
-def get_services_config() -> dict:
-    return _load_yaml(CONFIG_DIR / "services.yaml")
+def get_services_config() -> FrozenConfig:
+    return _cached_yaml(_SERVICES_PATH)
 
 
-def get_integrations_config() -> dict:
-    return _load_yaml(CONFIG_DIR / "integrations.yaml")
+def get_integrations_config() -> FrozenConfig:
+    return _cached_yaml(_INTEGRATIONS_PATH)
 
 
-def get_rag_config() -> dict:
-    return _load_yaml(CONFIG_DIR / "rag.yaml")
+def get_rag_config() -> FrozenConfig:
+    return _cached_yaml(_RAG_PATH)
 
 
-def get_local_integrations() -> dict:
+def get_local_integrations() -> FrozenConfig:
     """Credentials and values configured from UI (stored in gitignored file)."""
-    return _load_yaml(LOCAL_INTEGRATIONS_PATH)
+    return _cached_yaml(LOCAL_INTEGRATIONS_PATH)
 
 
 def save_local_integrations(data: dict) -> None:
@@ -52,9 +143,9 @@ def save_local_integrations(data: dict) -> None:
     _save_yaml(LOCAL_INTEGRATIONS_PATH, data)
 
 
-def get_integration_credentials(integration: str) -> dict:
+def get_integration_credentials(integration: str) -> FrozenConfig:
     """Get credentials for one integration from UI config (local file). Returns dict of field names to values."""
-    return get_local_integrations().get(integration) or {}
+    return get_local_integrations().get(integration) or _EMPTY
 
 
 def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
@@ -0,0 +1,132 @@
+"""
+Incremental reader for append-mostly CSV files (trace.csv, audit logs).
+
+CsvTail remembers the header and the byte offset of the last complete record it returned; each
+poll() reads and parses only the bytes appended since. A record is complete once its terminating
+newline is outside a quoted field, so a row still being written is left for the next poll.
+
+The file counts as rewritten (and is re-read from the start, reset=True) when it is replaced
+(different inode), shrinks below the offset, or the bytes just before the offset no longer match
+what was read there — e.g. set_incident_status() rewriting incidents.csv in place.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import os
+from pathlib import Path
+from typing import Optional
+
+CHECK_BYTES = 256           # bytes before the offset compared on every poll to detect rewrites
+
+
+def _record_end(chunk: bytes) -> int:
+    """Length of the longest prefix of chunk made of whole records (chunk starts at a record boundary)."""
+    end = chunk.rfind(b"\n") + 1
+    while end and chunk.count(b'"', 0, end) % 2:
+        end = chunk.rfind(b"\n", 0, end - 1) + 1
+    return end
+
+
+def _parse(body: bytes) -> list[list[str]]:
+    return [r for r in csv.reader(io.StringIO(body.decode("utf-8"), newline="")) if r]
+
+
+class CsvTail:
+    """
+    Follow one CSV file. start_bytes: on the first read (and after a rewrite) start at the first
+    record inside the last start_bytes of the file instead of parsing all of it.
+    """
+
+    def __init__(self, path: Path, start_bytes: Optional[int] = None):
+        self.path = Path(path)
+        self.start_bytes = start_bytes
+        self.header: list[str] = []
+        self.offset = 0
+        self.resets = 0
+        self._ident: Optional[tuple[int, int]] = None
+        self._check = b""
+
+    def _reset(self) -> None:
+        self.header, self.offset, self._ident, self._check = [], 0, None, b""
+        self.resets += 1
+
+    def _rewritten(self, f, info: os.stat_result) -> bool:
+        if (info.st_dev, info.st_ino) != self._ident or info.st_size < self.offset:
+            return True
+        f.seek(self.offset - len(self._check))
+        return f.read(len(self._check)) != self._check
+
+    def _remember(self, f, offset: int) -> None:
+        self.offset = offset
+        f.seek(max(0, offset - CHECK_BYTES))
+        self._check = f.read(offset - max(0, offset - CHECK_BYTES))
+
+    def _open(self, f, info: os.stat_result) -> bool:
+        """Read the header and position the offset; False if the header is not complete yet."""
+        f.seek(0)
+        head = f.read(min(info.st_size, 64 * 1024))
+        end = _record_end(head[: head.find(b"\n") + 1])
+        if not end:
+            return False
+        self.header = _parse(head[:end])[0]
+        self._ident = (info.st_dev, info.st_ino)
+        offset = end
+        if self.start_bytes is not None and info.st_size - self.start_bytes > end:
+            # Start at the first newline in the window that is not inside a quoted field: from a
+            # record boundary the quotes up to the end of the file pair up, from inside a field they don't.
+            f.seek(info.st_size - self.start_bytes)
+            window = f.read(self.start_bytes)
+            quotes = window.count(b'"')
+            nl = window.find(b"\n")
+            while nl >= 0 and (quotes - window.count(b'"', 0, nl)) % 2:
+                nl = window.find(b"\n", nl + 1)
+            if nl >= 0:
+                offset = info.st_size - self.start_bytes + nl + 1
+        self._remember(f, offset)
+        return True
+
+    def read(self, max_bytes: Optional[int] = None) -> tuple[bool, bytes]:
+        """
+        (reset, body): the whole records appended since the last call, as raw CSV bytes without the
+        header (for callers with a faster parser, e.g. pandas). reset=True means the file was replaced
+        or rewritten: body then starts from the top and anything the caller kept from earlier calls
+        must be dropped. max_bytes bounds one call (call again while data comes back).
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            if self.header:
+                self._reset()
+                return True, b""
+            return False, b""
+        with f:
+            info = os.fstat(f.fileno())
+            reset = False
+            if self.header and self._rewritten(f, info):
+                self._reset()
+                reset = True
+            if not self.header and not self._open(f, info):
+                return reset, b""
+            available = info.st_size - self.offset
+            want = available if max_bytes is None else min(available, max_bytes)
+            end = 0
+            while want > 0:
+                f.seek(self.offset)
+                chunk = f.read(want)
+                end = _record_end(chunk)
+                if end or want >= available:
+                    break
+                want = min(available, want * 2)  # a single record longer than max_bytes
+            if not end:
+                return reset, b""
+            self._remember(f, self.offset + end)
+        return reset, chunk[:end]
+
+    def poll(self, max_bytes: Optional[int] = None) -> tuple[bool, list[list[str]]]:
+        """(reset, rows): as read(), parsed into lists in header order."""
+        reset, body = self.read(max_bytes)
+        return reset, _parse(body) if body else []
+
+    def dicts(self, rows: list[list[str]]) -> list[dict]:
+        return [dict(zip(self.header, r)) for r in rows]
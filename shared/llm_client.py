@@ -1,10 +1,245 @@
 """
-LLM client: extension point for when LLM is provided (config-only until then).
-Swap this for a real client when endpoint/key are available.
+LLM client: cached, concurrency-limited access to a configured endpoint (OpenAI-compatible
+chat completions) or a local stub. Settings: services.yaml llm.
+- Responses are cached on a prompt hash (LRU + TTL).
+- In-flight requests are capped with a semaphore.
+- Identical concurrent prompts are coalesced into one upstream call.
+- Tokens and latency are recorded per call (stats() + comprehensive audit).
+complete() returns None while llm.enabled is false, so callers keep their non-LLM path.
 """
-from typing import Optional
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+import httpx
+
+from shared import audit
+from shared.config_loader import get_env, get_services_config
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_TIMEOUT_SECONDS = 60.0
+DEFAULT_CACHE_TTL_SECONDS = 3600.0
+DEFAULT_CACHE_MAX_ENTRIES = 512
+
+
+@dataclass
+class CallRecord:
+    timestamp: float
+    prompt_hash: str
+    model: str
+    source: str  # "upstream" | "cache" | "coalesced"
+    prompt_tokens: int
+    completion_tokens: int
+    latency_ms: float
+    ok: bool
+    error: str = ""
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text or "") // 4)
+
+
+class LLMClient:
+    def __init__(
+        self,
+        provider: str = "stub",
+        endpoint: str = "",
+        api_key: str = "",
+        model: str = "",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        stub_latency_ms: float = 0.0,
+    ):
+        self.provider = provider
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.model = model
+        self.timeout_seconds = timeout_seconds
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = max(1, cache_max_entries)
+        self.stub_latency_ms = stub_latency_ms
+        self.max_concurrency = max(1, max_concurrency)
+        self._cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # Loop-bound state (semaphore, in-flight futures, HTTP client), rebuilt when the loop changes.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self.records: deque[CallRecord] = deque(maxlen=1000)
+        self.counters = {"upstream": 0, "cache": 0, "coalesced": 0, "errors": 0,
+                         "prompt_tokens": 0, "completion_tokens": 0}
+
+    # ── cache ─────────────────────────────────────────────────────────
+
+    def _key(self, prompt: str, system: str, max_tokens: int) -> str:
+        raw = "\x1f".join((self.provider, self.model, system, str(max_tokens), prompt))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, text = entry
+        if time.monotonic() > expires:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return text
+
+    def _cache_put(self, key: str, text: str) -> None:
+        self._cache[key] = (time.monotonic() + self.cache_ttl_seconds, text)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _record(self, key: str, source: str, prompt_tokens: int = 0, completion_tokens: int = 0,
+                latency_ms: float = 0.0, ok: bool = True, error: str = "") -> None:
+        self.records.append(CallRecord(time.time(), key[:16], self.model, source,
+                                       prompt_tokens, completion_tokens, round(latency_ms, 1), ok, error))
+        self.counters[source] += 1
+        self.counters["prompt_tokens"] += prompt_tokens
+        self.counters["completion_tokens"] += completion_tokens
+        if not ok:
+            self.counters["errors"] += 1
+
+    # ── calls ─────────────────────────────────────────────────────────
+
+    def _bind_loop(self) -> None:
+        """The UI runs each action in its own asyncio.run; objects from a finished loop are unusable."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._inflight = {}
+            self._client = None
+
+    async def complete(self, prompt: str, system: str = "", max_tokens: int = 1024) -> Optional[str]:
+        self._bind_loop()
+        key = self._key(prompt, system, max_tokens)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self._record(key, "cache")
+            return cached
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._record(key, "coalesced")
+            return await asyncio.shield(pending)
+
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            text = await self._call_upstream(key, prompt, system, max_tokens)
+            if text is not None:
+                self._cache_put(key, text)
+            fut.set_result(text)
+            return text
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _call_upstream(self, key: str, prompt: str, system: str, max_tokens: int) -> Optional[str]:
+        async with self._semaphore:
+            start = time.perf_counter()
+            try:
+                if self.provider == "stub":
+                    text, usage = await self._stub(prompt, system)
+                else:
+                    text, usage = await self._openai(prompt, system, max_tokens)
+                ok, error = text is not None, ""
+            except Exception as e:
+                text, usage, ok, error = None, {}, False, str(e)[:200]
+            latency_ms = (time.perf_counter() - start) * 1000
+        p_tok = int(usage.get("prompt_tokens") or _estimate_tokens(system + prompt))
+        c_tok = int(usage.get("completion_tokens") or (_estimate_tokens(text) if text else 0))
+        self._record(key, "upstream", p_tok, c_tok, latency_ms, ok, error)
+        audit.log_comprehensive(
+            "llm", "complete", key[:12], "success" if ok else "failed",
+            duration_ms=int(latency_ms), error_message=error or None,
+            payload_summary=f"provider={self.provider} model={self.model} prompt_tokens={p_tok} completion_tokens={c_tok}",
+        )
+        return text
+
+    async def _stub(self, prompt: str, system: str) -> tuple[str, dict]:
+        """Deterministic local response for wiring and load tests."""
+        if self.stub_latency_ms > 0:
+            await asyncio.sleep(self.stub_latency_ms / 1000.0)
+        first = next((ln.strip() for ln in prompt.splitlines() if ln.strip()), "")
+        return f"[stub] Review recent changes related to: {first[:200]}", {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout_seconds)
+        return self._client
+
+    async def _openai(self, prompt: str, system: str, max_tokens: int) -> tuple[Optional[str], dict]:
+        if not self.endpoint:
+            raise RuntimeError("LLM endpoint not set")
+        url = self.endpoint.rstrip("/")
+        if not url.endswith("/chat/completions"):
+            url += "/chat/completions"
+        messages = ([{"role": "system", "content": system}] if system else []) + [{"role": "user", "content": prompt}]
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        r = await self._get_client().post(
+            url, headers=headers, json={"model": self.model, "messages": messages, "max_tokens": max_tokens},
+        )
+        r.raise_for_status()
+        data = r.json()
+        choices = data.get("choices") or []
+        text = ((choices[0].get("message") or {}).get("content") if choices else None)
+        return text, data.get("usage") or {}
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.counters,
+            "cache_entries": len(self._cache),
+            "inflight": len(self._inflight),
+            "recent": [asdict(r) for r in list(self.records)[-20:]],
+        }
+
+
+_client: Optional[LLMClient] = None
+
+
+def is_enabled() -> bool:
+    return bool(get_services_config().get("llm", {}).get("enabled"))
+
+
+def get_client() -> LLMClient:
+    """Process-wide client from services.yaml llm settings."""
+    global _client
+    if _client is None:
+        cfg = get_services_config().get("llm", {})
+        _client = LLMClient(
+            provider=(cfg.get("provider") or "stub").lower(),
+            endpoint=get_env(cfg.get("endpoint_env", "LLM_ENDPOINT")) or "",
+            api_key=get_env(cfg.get("api_key_env", "LLM_API_KEY")) or "",
+            model=cfg.get("model") or "",
+            max_concurrency=int(cfg.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)),
+            timeout_seconds=float(cfg.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+            cache_ttl_seconds=float(cfg.get("cache_ttl_seconds", DEFAULT_CACHE_TTL_SECONDS)),
+            cache_max_entries=int(cfg.get("cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES)),
+            stub_latency_ms=float(cfg.get("stub_latency_ms", 0)),
+        )
+    return _client
 
 
 async def complete(prompt: str, system: str = "", max_tokens: int = 1024) -> Optional[str]:
-    """No-op until LLM is configured. Returns None or placeholder."""
-    return None
+    """Completion text, or None when the LLM is disabled or the call failed."""
+    if not is_enabled():
+        return None
+    return await get_client().complete(prompt, system=system, max_tokens=max_tokens)
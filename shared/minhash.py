@@ -0,0 +1,99 @@
+"""
+MinHash signatures and banded LSH for near-duplicate text (used by the Correlator).
+Shingles are tokens (shared.text) plus word bigrams; extra features (e.g. metric=cpu_percent) can be
+added. Hashing is numpy multiply-shift over 64-bit token hashes, so a signature is one vectorised op.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Hashable, Iterable, Optional
+
+import numpy as np
+
+from shared.text import tokenize
+
+_MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def shingles(text: str, extra: Iterable[str] = ()) -> set[str]:
+    words = tokenize(text)
+    out = set(words)
+    out.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    out.update(extra)
+    return out
+
+
+def _hash64(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        # Odd multipliers give a universal multiply-shift family on 64-bit words.
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+    def signature(self, features: Iterable[str]) -> np.ndarray:
+        hashes = np.fromiter((_hash64(f) for f in features), dtype=np.uint64)
+        if not hashes.size:
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        with np.errstate(over="ignore"):
+            mixed = (hashes[:, None] * self._a[None, :] + self._b[None, :]) & _MASK64
+        return (mixed >> np.uint64(32)).astype(np.uint32).min(axis=0)
+
+    @staticmethod
+    def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of the underlying shingle sets."""
+        return float(np.count_nonzero(a == b)) / len(a)
+
+
+class LSHIndex:
+    """Banded LSH: keys whose signatures agree on all rows of any band become candidates.
+    With b bands of r rows the match threshold is roughly (1/b) ** (1/r)."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._tables: list[dict[bytes, set]] = [{} for _ in range(bands)]
+        self._sigs: dict[Hashable, np.ndarray] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._sigs
+
+    def __len__(self) -> int:
+        return len(self._sigs)
+
+    def _band_keys(self, sig: np.ndarray) -> list[bytes]:
+        return [sig[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: Hashable, sig: np.ndarray) -> None:
+        self.remove(key)
+        self._sigs[key] = sig
+        for table, bk in zip(self._tables, self._band_keys(sig)):
+            table.setdefault(bk, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        sig = self._sigs.pop(key, None)
+        if sig is None:
+            return
+        for table, bk in zip(self._tables, self._band_keys(sig)):
+            bucket = table.get(bk)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del table[bk]
+
+    def signature_of(self, key: Hashable) -> Optional[np.ndarray]:
+        return self._sigs.get(key)
+
+    def query(self, sig: np.ndarray, threshold: float = 0.0) -> list[tuple[Hashable, float]]:
+        """Candidates sharing a band, verified against the estimated Jaccard threshold, best first."""
+        found: set = set()
+        for table, bk in zip(self._tables, self._band_keys(sig)):
+            found.update(table.get(bk, ()))
+        scored = [(k, MinHasher.jaccard(sig, self._sigs[k])) for k in found]
+        return sorted(((k, s) for k, s in scored if s >= threshold), key=lambda ks: ks[1], reverse=True)
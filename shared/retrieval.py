@@ -0,0 +1,340 @@
+"""
+Local retrieval for RAG over knowledge/ (RAG.1) — no network service.
+Markdown is chunked by heading, embedded with a pluggable CPU-only embedder (hashing or TF-IDF),
+and stored as a memory-mapped float32 matrix (data/rag/vectors.f32) with a chunk-id sidecar.
+Queries are batched cosine top-k in NumPy. Settings: rag.yaml local_retrieval.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Protocol
+
+import numpy as np
+
+from shared.config_loader import DATA_DIR, PROJECT_ROOT, get_rag_config
+from shared.text import tokenize
+
+KNOWLEDGE_DIR = PROJECT_ROOT / "knowledge"
+INDEX_DIR = DATA_DIR / "rag"
+VECTORS_FILE = "vectors.f32"
+CHUNKS_FILE = "chunks.json"
+MANIFEST_FILE = "manifest.json"
+IDF_FILE = "idf.npy"
+DEFAULT_DIM = 512
+DEFAULT_CHUNK_CHARS = 800
+STALE_CHECK_SECONDS = 30.0
+
+
+def get_settings() -> dict:
+    cfg = get_rag_config().get("local_retrieval") or {}
+    return {
+        "enabled": bool(cfg.get("enabled", False)),
+        "embedder": (cfg.get("embedder") or "hashing").lower(),
+        "dim": int(cfg.get("dim", DEFAULT_DIM)),
+        "chunk_chars": int(cfg.get("chunk_chars", DEFAULT_CHUNK_CHARS)),
+        "min_score": float(cfg.get("min_score", 0.15)),
+    }
+
+
+# ── Chunking ──────────────────────────────────────────────────────────
+
+def chunk_markdown(path: Path, max_chars: int = DEFAULT_CHUNK_CHARS) -> list[dict]:
+    """Split a markdown file into heading sections, then into <= max_chars pieces on line breaks.
+    Each chunk's text is prefixed with its title/heading so short sections still embed well."""
+    text = path.read_text(encoding="utf-8", errors="replace")
+    title = path.stem.replace("_", " ")
+    sections: list[tuple[str, list[str]]] = [("", [])]
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            title = stripped[2:].strip()
+        elif stripped.startswith("#"):
+            sections.append((stripped.lstrip("#").strip(), []))
+        elif stripped:
+            sections[-1][1].append(stripped)
+
+    chunks: list[dict] = []
+    for heading, lines in sections:
+        if not lines:
+            continue
+        buf: list[str] = []
+        size = 0
+        for line in lines + [None]:
+            if line is None or (buf and size + len(line) > max_chars):
+                body = "\n".join(buf)
+                chunks.append({
+                    "path": str(path),
+                    "heading": heading or title,
+                    "text": f"{title} — {heading}\n{body}" if heading else f"{title}\n{body}",
+                })
+                buf, size = [], 0
+            if line is not None:
+                buf.append(line)
+                size += len(line) + 1
+    return chunks
+
+
+# ── Embedders ─────────────────────────────────────────────────────────
+
+class Embedder(Protocol):
+    name: str
+    dim: int
+
+    def fit(self, texts: list[str]) -> None: ...
+    def embed(self, texts: list[str]) -> np.ndarray: ...
+    def save(self, directory: Path) -> None: ...
+    def load(self, directory: Path) -> None: ...
+
+
+def _features(text: str) -> Counter:
+    toks = tokenize(text)
+    feats = Counter(toks)
+    feats.update(f"{a} {b}" for a, b in zip(toks, toks[1:]))
+    return feats
+
+
+def _bucket(feature: str, dim: int) -> tuple[int, float]:
+    h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return h % dim, (1.0 if (h >> 63) & 1 else -1.0)
+
+
+class HashingEmbedder:
+    """Signed feature hashing of unigrams + bigrams with sublinear tf; stateless."""
+    name = "hashing"
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = dim
+        self._cache: dict[str, tuple[int, float]] = {}
+
+    def _hash(self, feature: str) -> tuple[int, float]:
+        hit = self._cache.get(feature)
+        if hit is None:
+            hit = self._cache[feature] = _bucket(feature, self.dim)
+        return hit
+
+    def _raw(self, texts: list[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for feat, tf in _features(text).items():
+                j, sign = self._hash(feat)
+                out[i, j] += sign * (1.0 + math.log(tf))
+        return out
+
+    def fit(self, texts: list[str]) -> None:
+        return None
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        return _l2_normalise(self._raw(texts))
+
+    def save(self, directory: Path) -> None:
+        return None
+
+    def load(self, directory: Path) -> None:
+        return None
+
+
+class TfidfEmbedder(HashingEmbedder):
+    """Hashing features re-weighted by per-bucket IDF learned from the corpus."""
+    name = "tfidf"
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        super().__init__(dim)
+        self.idf = np.ones(self.dim, dtype=np.float32)
+
+    def fit(self, texts: list[str]) -> None:
+        df = np.zeros(self.dim, dtype=np.float32)
+        for text in texts:
+            df[list({self._hash(f)[0] for f in _features(text)})] += 1
+        n = max(len(texts), 1)
+        self.idf = (np.log((1 + n) / (1 + df)) + 1.0).astype(np.float32)
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        return _l2_normalise(self._raw(texts) * self.idf)
+
+    def save(self, directory: Path) -> None:
+        np.save(directory / IDF_FILE, self.idf)
+
+    def load(self, directory: Path) -> None:
+        path = directory / IDF_FILE
+        if path.exists():
+            self.idf = np.load(path).astype(np.float32)
+
+
+EMBEDDERS: dict[str, type] = {"hashing": HashingEmbedder, "tfidf": TfidfEmbedder}
+
+
+def make_embedder(name: str, dim: int) -> Embedder:
+    if name not in EMBEDDERS:
+        raise ValueError(f"Unknown embedder '{name}'. Choose from {list(EMBEDDERS)}")
+    return EMBEDDERS[name](dim)
+
+
+def _l2_normalise(m: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (m / norms).astype(np.float32, copy=False)
+
+
+# ── Store ─────────────────────────────────────────────────────────────
+
+def _source_files(root: Path) -> list[Path]:
+    return sorted(p for p in root.rglob("*.md") if p.is_file())
+
+
+def _fingerprint(files: list[Path]) -> dict[str, int]:
+    return {str(p): p.stat().st_mtime_ns for p in files}
+
+
+class VectorStore:
+    def __init__(
+        self,
+        embedder: Embedder,
+        source_dir: Path = KNOWLEDGE_DIR,
+        index_dir: Path = INDEX_DIR,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+    ):
+        self.embedder = embedder
+        self.source_dir = source_dir
+        self.index_dir = index_dir
+        self.chunk_chars = chunk_chars
+        self.vectors: Optional[np.ndarray] = None  # np.memmap, shape (n, dim)
+        self.chunks: list[dict] = []
+        self._sources: dict[str, int] = {}
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def _manifest_matches(self, manifest: dict, sources: dict[str, int]) -> bool:
+        return (
+            manifest.get("embedder") == self.embedder.name
+            and manifest.get("dim") == self.embedder.dim
+            and manifest.get("chunk_chars") == self.chunk_chars
+            and manifest.get("sources") == sources
+        )
+
+    def load_or_build(self) -> None:
+        """Open the on-disk index if it matches the current sources, else rebuild it."""
+        with self._lock:
+            sources = _fingerprint(_source_files(self.source_dir))
+            manifest_path = self.index_dir / MANIFEST_FILE
+            if manifest_path.exists():
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if self._manifest_matches(manifest, sources):
+                    self._open(manifest)
+                    self._sources = sources
+                    self._last_check = time.monotonic()
+                    return
+            self._build(sources)
+            self._last_check = time.monotonic()
+
+    def _open(self, manifest: dict) -> None:
+        count = int(manifest.get("count", 0))
+        self.chunks = json.loads((self.index_dir / CHUNKS_FILE).read_text(encoding="utf-8"))
+        self.embedder.load(self.index_dir)
+        if count:
+            self.vectors = np.memmap(self.index_dir / VECTORS_FILE, dtype=np.float32, mode="r",
+                                     shape=(count, self.embedder.dim))
+        else:
+            self.vectors = np.zeros((0, self.embedder.dim), dtype=np.float32)
+
+    def _build(self, sources: dict[str, int]) -> None:
+        # Release the current mapping first; a mapped file cannot be replaced on Windows.
+        self.vectors = None
+        chunks: list[dict] = []
+        for path in map(Path, sources):
+            chunks.extend(chunk_markdown(path, self.chunk_chars))
+        for i, c in enumerate(chunks):
+            c["id"] = i
+        texts = [c["text"] for c in chunks]
+        self.embedder.fit(texts)
+        matrix = self.embedder.embed(texts) if texts else np.zeros((0, self.embedder.dim), dtype=np.float32)
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_dir / (VECTORS_FILE + ".tmp")
+        if len(chunks):
+            mm = np.memmap(tmp, dtype=np.float32, mode="w+", shape=matrix.shape)
+            mm[:] = matrix
+            mm.flush()
+            del mm
+            os.replace(tmp, self.index_dir / VECTORS_FILE)
+        self.embedder.save(self.index_dir)
+        (self.index_dir / CHUNKS_FILE).write_text(json.dumps(chunks), encoding="utf-8")
+        manifest = {
+            "embedder": self.embedder.name,
+            "dim": self.embedder.dim,
+            "chunk_chars": self.chunk_chars,
+            "count": len(chunks),
+            "sources": sources,
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        (self.index_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+        self._sources = sources
+        self._open(manifest)
+
+    def maybe_refresh(self, interval: float = STALE_CHECK_SECONDS) -> None:
+        """Rebuild when knowledge/ files were added, removed or edited (checked at most every interval)."""
+        if time.monotonic() - self._last_check < interval:
+            return
+        self._last_check = time.monotonic()
+        if _fingerprint(_source_files(self.source_dir)) != self._sources:
+            self.load_or_build()
+
+    def search(self, queries: list[str], k: int = 5, min_score: float = 0.0) -> list[list[dict]]:
+        """Batched cosine top-k. Returns one hit list per query: [{id, path, heading, text, score}]."""
+        if self.vectors is None:
+            self.load_or_build()
+        n = 0 if self.vectors is None else self.vectors.shape[0]
+        if not queries:
+            return []
+        if not n:
+            return [[] for _ in queries]
+        q = self.embedder.embed(queries)
+        scores = q @ np.asarray(self.vectors).T  # (m, n); rows are unit-length so this is cosine
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results: list[list[dict]] = []
+        for row, idx in enumerate(top):
+            order = idx[np.argsort(-scores[row, idx])]
+            hits = []
+            for j in order:
+                s = float(scores[row, j])
+                if s < min_score:
+                    break
+                c = self.chunks[j]
+                hits.append({"id": c["id"], "path": c["path"], "heading": c["heading"],
+                             "text": c["text"], "score": round(s, 4)})
+            results.append(hits)
+        return results
+
+
+_store: Optional[VectorStore] = None
+
+
+def get_store() -> VectorStore:
+    """Process-wide store from rag.yaml local_retrieval settings; opened or built on first use."""
+    global _store
+    if _store is None:
+        s = get_settings()
+        _store = VectorStore(make_embedder(s["embedder"], s["dim"]), chunk_chars=s["chunk_chars"])
+        _store.load_or_build()
+    return _store
+
+
+def is_enabled() -> bool:
+    return get_settings()["enabled"]
+
+
+def retrieve(query: str, k: int = 3) -> list[dict]:
+    """Top-k knowledge chunks for one query, above rag.yaml min_score. [] when disabled."""
+    settings = get_settings()
+    if not settings["enabled"]:
+        return []
+    store = get_store()
+    store.maybe_refresh()
+    return store.search([query], k=k, min_score=settings["min_score"])[0]
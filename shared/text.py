@@ -0,0 +1,26 @@
+"""
+Text normalisation shared by the knowledge index, retrieval and similarity features.
+Tokens are lowercase alphanumerics; hyphen/underscore compounds (app-svc, cpu_percent)
+are kept whole and also split into their parts.
+"""
+import re
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-_][a-z0-9]+)*")
+_SPLIT = re.compile(r"[-_]")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have if in into is it its of on or that the this "
+    "to was were will with e g eg i ie via".split()
+)
+
+
+def tokenize(text: str, keep_stopwords: bool = False) -> list[str]:
+    """Lowercase word tokens; compounds emit the whole token followed by its parts."""
+    out: list[str] = []
+    for tok in _TOKEN.findall((text or "").lower()):
+        if "-" in tok or "_" in tok:
+            out.append(tok)
+            out.extend(p for p in _SPLIT.split(tok) if p and (keep_stopwords or p not in STOPWORDS))
+        elif keep_stopwords or tok not in STOPWORDS:
+            out.append(tok)
+    return out
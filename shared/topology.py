@@ -0,0 +1,108 @@
+"""
+Service topology from config/tables/service_dependencies.csv (service depends_on upstream).
+Adjacency plus precomputed transitive closure, so "does A depend on B" is a set lookup.
+Reloaded when the CSV changes (mtime).
+"""
+from __future__ import annotations
+
+import csv
+import threading
+from typing import Optional
+
+from shared.config_loader import CONFIG_TABLES_DIR
+
+SERVICE_DEPENDENCIES_PATH = CONFIG_TABLES_DIR / "service_dependencies.csv"
+
+
+def _closure(adjacency: dict[str, set[str]]) -> dict[str, frozenset]:
+    """Every node reachable from each node (DFS per node; tolerates cycles)."""
+    out: dict[str, frozenset] = {}
+    for start in adjacency:
+        seen: set[str] = set()
+        stack = list(adjacency[start])
+        while stack:
+            node = stack.pop()
+            if node in seen or node == start:
+                continue
+            seen.add(node)
+            stack.extend(adjacency.get(node, ()))
+        out[start] = frozenset(seen)
+    return out
+
+
+class Topology:
+    def __init__(self, edges: list[tuple[str, str]] = ()):
+        self._build(edges)
+
+    def _build(self, edges) -> None:
+        depends: dict[str, set[str]] = {}
+        dependents: dict[str, set[str]] = {}
+        for svc, upstream in edges:
+            depends.setdefault(svc, set()).add(upstream)
+            depends.setdefault(upstream, set())
+            dependents.setdefault(upstream, set()).add(svc)
+            dependents.setdefault(svc, set())
+        self.depends = depends
+        self._upstream = _closure(depends)
+        self._downstream = _closure(dependents)
+
+    def upstream(self, service: str) -> frozenset:
+        """All services `service` depends on, directly or transitively."""
+        return self._upstream.get(service.lower(), frozenset())
+
+    def downstream(self, service: str) -> frozenset:
+        """All services that depend on `service`, directly or transitively."""
+        return self._downstream.get(service.lower(), frozenset())
+
+    def depends_on(self, service: str, other: str) -> bool:
+        return other.lower() in self.upstream(service)
+
+    def related(self, a: str, b: str) -> bool:
+        """Same service, or one is reachable from the other."""
+        a, b = a.lower(), b.lower()
+        return a == b or b in self.upstream(a) or b in self.downstream(a)
+
+    def related_services(self, service: str) -> frozenset:
+        return self.upstream(service) | self.downstream(service)
+
+
+class _TopologyFile:
+    def __init__(self):
+        self._topology = Topology()
+        self._mtime_ns = -1
+        self._lock = threading.Lock()
+
+    def get(self) -> Topology:
+        mtime_ns = SERVICE_DEPENDENCIES_PATH.stat().st_mtime_ns if SERVICE_DEPENDENCIES_PATH.exists() else 0
+        if mtime_ns != self._mtime_ns:
+            with self._lock:
+                if mtime_ns != self._mtime_ns:
+                    self._topology = Topology(_load_edges())
+                    self._mtime_ns = mtime_ns
+        return self._topology
+
+
+def _load_edges() -> list[tuple[str, str]]:
+    if not SERVICE_DEPENDENCIES_PATH.exists():
+        return []
+    edges = []
+    with open(SERVICE_DEPENDENCIES_PATH, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if (row.get("enabled") or "true").strip().lower() != "true":
+                continue
+            svc = (row.get("service") or "").strip().lower()
+            upstream = (row.get("depends_on") or "").strip().lower()
+            if svc and upstream and svc != upstream:
+                edges.append((svc, upstream))
+    return edges
+
+
+_file: Optional[_TopologyFile] = None
+
+
+def get_topology() -> Topology:
+    """Current topology; re-read when service_dependencies.csv changes."""
+    global _file
+    if _file is None:
+        _file = _TopologyFile()
+    return _file.get()
@@ -1,14 +1,18 @@
 """
 Pipeline trace logger — records each agent step with decision, rationale, and outcome.
 Written to data/trace/trace.csv for real-time UI consumption.
-ticket_number is stamped onto all rows for a run once the ITSM ticket is created.
+trace.csv is append-only: once the ITSM ticket is created, the run's ticket_number is recorded in
+data/trace/run_tickets.csv and readers fill it into the run's earlier rows.
+Each step is also published on the in-process trace bus (shared.trace_bus) for live views.
 """
 import csv
-from pathlib import Path
 from datetime import datetime, timezone
 
-_PROJECT_ROOT = Path(__file__).resolve().parents[1]
-TRACE_PATH = _PROJECT_ROOT / "data" / "trace" / "trace.csv"
+from shared.config_loader import DATA_DIR
+from shared.trace_bus import get_bus
+
+TRACE_PATH = DATA_DIR / "trace" / "trace.csv"
+RUN_TICKETS_PATH = DATA_DIR / "trace" / "run_tickets.csv"
 
 FIELDS = [
     "timestamp",
@@ -62,6 +66,7 @@ def log_step(
         if not file_exists:
             w.writeheader()
         w.writerow(row)
+    get_bus().publish(row)
 
 
 def get_run_id_for_incident(incident_id: str) -> str:
@@ -92,23 +97,14 @@ def get_max_step(run_id: str) -> int:
 
 
 def stamp_ticket_number(run_id: str, ticket_number: str) -> None:
-    """Backfill ticket_number on all rows for the given run_id."""
-    if not TRACE_PATH.exists() or not ticket_number:
+    """Record the ticket number of a run (applies to its rows logged before the ticket existed)."""
+    if not run_id or not ticket_number:
         return
-    rows = []
-    with open(TRACE_PATH, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames or [])
-        if "ticket_number" not in fieldnames:
-            fieldnames.insert(fieldnames.index("step_order") if "step_order" in fieldnames else 3, "ticket_number")
-        for row in reader:
-            if row.get("run_id") == run_id:
-                row["ticket_number"] = ticket_number
-            for k in fieldnames:
-                if k not in row:
-                    row[k] = ""
-            rows.append(row)
-    with open(TRACE_PATH, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        w.writeheader()
-        w.writerows(rows)
+    _ensure_dir()
+    file_exists = RUN_TICKETS_PATH.exists()
+    with open(RUN_TICKETS_PATH, "a", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        if not file_exists:
+            w.writerow(["run_id", "ticket_number"])
+        w.writerow([run_id, ticket_number])
+
@@ -0,0 +1,91 @@
+"""
+In-process broadcast of pipeline trace steps. shared.trace.log_step publishes every row here;
+GET /stream/trace (orchestrator) relays them to clients as Server-Sent Events, optionally for one
+run_id. Each subscriber has a bounded queue (oldest rows dropped if a client falls behind), and the
+last HISTORY rows are kept with sequence numbers so a reconnecting client resumes from Last-Event-ID.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import Optional
+
+HISTORY = 2000
+QUEUE_SIZE = 1000
+HEARTBEAT_SECONDS = 15.0
+
+
+class Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, run_id: Optional[str], queue_size: int):
+        self.loop = loop
+        self.run_id = run_id or None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def wants(self, row: dict) -> bool:
+        return self.run_id is None or row.get("run_id") == self.run_id
+
+    def _put(self, item: tuple[int, dict]) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+
+    def offer(self, item: tuple[int, dict]) -> None:
+        """Thread-safe: hand the row to the subscriber's event loop."""
+        self.loop.call_soon_threadsafe(self._put, item)
+
+    async def get(self) -> tuple[int, dict]:
+        return await self.queue.get()
+
+
+class TraceBus:
+    def __init__(self, history: int = HISTORY, queue_size: int = QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._seq = 0
+        self._recent: deque[tuple[int, dict]] = deque(maxlen=history)
+        self._subs: set[Subscriber] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subs)
+
+    def publish(self, row: dict) -> int:
+        with self._lock:
+            self._seq += 1
+            item = (self._seq, dict(row))
+            self._recent.append(item)
+            subs = [s for s in self._subs if s.wants(row)]
+        for sub in subs:
+            try:
+                sub.offer(item)
+            except RuntimeError:  # subscriber's loop is closed
+                self.unsubscribe(sub)
+        return item[0]
+
+    def subscribe(self, run_id: Optional[str] = None, since: Optional[int] = None) -> Subscriber:
+        """Register the calling event loop. since: replay buffered rows with a higher sequence number."""
+        sub = Subscriber(asyncio.get_running_loop(), run_id, self.queue_size)
+        with self._lock:
+            if since is not None:
+                for item in self._recent:
+                    if item[0] > since and sub.wants(item[1]):
+                        sub._put(item)
+            self._subs.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        with self._lock:
+            self._subs.discard(sub)
+
+
+_bus: Optional[TraceBus] = None
+
+
+def get_bus() -> TraceBus:
+    global _bus
+    if _bus is None:
+        _bus = TraceBus()
+    return _bus
@@ -0,0 +1,291 @@
+"""
+Synthetic history generator (1.6): write a data/ tree (incidents, trace, audit, approvals) at
+production scale for benchmarking the pipeline and UI against large histories.
+
+Rows follow the real writers' schemas and step sequences: each incident has its pipeline run in
+trace.csv, correlated children point at a SELF parent, closed incidents get a close run later in
+time, and approvals reference the suggested runbook. Every file is written in timestamp order: rows
+go through a heap that is flushed up to each new event time (events arrive in time order apart from
+a group's children and close runs, which stay in the heap until their time comes), so files look
+like append-only logs. Output is streamed; memory stays flat at any scale. Roughly 25 trace and 8 audit rows per incident.
+
+    python simulator/datagen.py --incidents 400000 --out data/synthetic     # ~10M trace rows
+    SENTRY_DATA_DIR=data/synthetic uvicorn orchestrator.main:app            # run against it
+    SENTRY_DATA_DIR=data/synthetic streamlit run ui/app.py
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import heapq
+import math
+import random
+import sys
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+# Add project root for imports when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from agents.monitor.incident_creator import _infer_severity
+from shared.trace import FIELDS as TRACE_FIELDS
+from simulator.scenarios import SCENARIOS
+
+INCIDENT_FIELDS = [
+    "incident_id", "severity", "service", "summary", "timestamp", "ticket_id", "ticket_system",
+    "status", "ticket_number", "parent_incident_id", "parent_ticket_number",
+]
+APPROVAL_FIELDS = [
+    "request_id", "incident_id", "action_suggestion", "action_type", "ticket_id", "ticket_system",
+    "status", "created_at", "decided_at",
+]
+AUDIT_SIMPLE_FIELDS = ["timestamp", "agent_id", "action_type", "entity_id", "outcome"]
+AUDIT_COMPREHENSIVE_FIELDS = [
+    "timestamp", "agent_id", "action_type", "entity_id", "outcome", "detail_level",
+    "duration_ms", "error_message", "payload_summary",
+]
+BASE_SERVICES = sorted({s["service"] for s in SCENARIOS.values()})
+VALUE_JITTER = {"up": (0.0, 0.0), "error_rate": (0.05, 0.35), "latency_p99_ms": (1200.0, 5000.0)}
+
+
+def _ts(t: float) -> str:
+    return datetime.fromtimestamp(t, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Generator:
+    def __init__(
+        self,
+        out: Path,
+        incidents: int,
+        days: float = 90.0,
+        services: int = 50,
+        closed_ratio: float = 0.85,
+        child_ratio: float = 0.2,
+        noise_ratio: float = 1.0,
+        jira_ratio: float = 0.2,
+        approval_ratio: float = 0.5,
+        seed: Optional[int] = None,
+    ):
+        self.out = out
+        self.incidents = incidents
+        self.rng = random.Random(seed)
+        self.end = time.time()
+        self.start = self.end - days * 86400
+        self.services = BASE_SERVICES + [f"svc-{i:03d}" for i in range(max(0, services - len(BASE_SERVICES)))]
+        self.closed_ratio = closed_ratio
+        self.child_ratio = child_ratio
+        self.noise_ratio = noise_ratio
+        self.jira_ratio = jira_ratio
+        self.approval_ratio = approval_ratio
+        self.counts = {"incidents": 0, "incident_runs": 0, "run_tickets": 0, "trace": 0, "audit_simple": 0, "audit_comprehensive": 0, "approvals": 0}
+        self._deferred: list[tuple[float, int, str, list]] = []  # (ts, seq, file, row) not yet written
+        self._seq = 0
+        self._inc_number = 10000
+        self._jira_number = 0
+        self._hex = lambda n: f"{self.rng.getrandbits(n * 4):0{n}x}"
+
+    # ── row writers ───────────────────────────────────────────────────
+
+    def _emit(self, name: str, row: list) -> None:
+        self._writers[name].writerow(row)
+        self.counts[name] += 1
+
+    def _defer(self, t: float, name: str, row: list) -> None:
+        self._seq += 1
+        heapq.heappush(self._deferred, (t, self._seq, name, row))
+
+    def _flush_until(self, t: float) -> None:
+        while self._deferred and self._deferred[0][0] <= t:
+            _, _, name, row = heapq.heappop(self._deferred)
+            self._emit(name, row)
+
+    def _trace(self, t, run_id, inc, ticket, step, agent, action, decision, rationale, outcome, detail=""):
+        self._defer(t, "trace", [_ts(t), run_id, inc, ticket, step, agent, action, decision, rationale, outcome, detail])
+
+    def _audit(self, t, agent, action, entity, outcome, duration_ms=None):
+        self._defer(t, "audit_simple", [_ts(t), agent, action, entity, outcome])
+        self._defer(t, "audit_comprehensive",
+                    [_ts(t), agent, action, entity, outcome, "comprehensive", duration_ms or "", "", ""])
+
+    # ── one incident ──────────────────────────────────────────────────
+
+    def _event(self, scenario: dict, service: str) -> tuple[str, float, str]:
+        metric = scenario["metric"]
+        lo, hi = VALUE_JITTER.get(metric, (scenario["value"] - 5, min(scenario["value"] + 5, 100.0)))
+        value = round(self.rng.uniform(lo, hi), 2)
+        summary = scenario["summary"].replace(scenario["service"], service)
+        return metric, value, summary
+
+    def _noise_run(self, t: float) -> None:
+        """A below-threshold event: Collector + Evaluator only."""
+        scenario = self.rng.choice(list(SCENARIOS.values()))
+        service = self.rng.choice(self.services)
+        run_id, evt = f"run_{self._hex(10)}", f"evt_{self._hex(12)}"
+        self._audit(t, "conductor", "received_event", evt, "logged")
+        self._trace(t, run_id, "", "", 1, "Collector", "normalise_event", "normalised",
+                    f"Event {evt} from simulator: {scenario['metric']} on {service}.", "success", evt)
+        self._trace(t, run_id, "", "", 2, "Evaluator", "evaluate_thresholds", "no_alert",
+                    "Below threshold.", "success", f"metric={scenario['metric']} value=0")
+
+    def _incident(self, t: float, parent: Optional[tuple[str, str]], scenario_key: str, service: str,
+                  has_children: bool = False) -> tuple[str, str]:
+        metric, value, summary = self._event(SCENARIOS[scenario_key], service)
+        severity = _infer_severity(metric, value)
+        inc, run_id, evt = f"inc_{self._hex(12)}", f"run_{self._hex(10)}", f"evt_{self._hex(12)}"
+        if self.rng.random() < self.jira_ratio:
+            self._jira_number += 1
+            system, ticket = "jira", f"OPS-{self._jira_number}"
+        else:
+            self._inc_number += 1
+            system, ticket = "servicenow", f"INC{self._inc_number:07d}"
+        ticket_id = self._hex(32)
+        closed = self.rng.random() < self.closed_ratio
+
+        self._audit(t, "conductor", "received_event", evt, "logged")
+        steps = [
+            ("Collector", "normalise_event", "normalised", f"Event {evt} from simulator: {metric}={value} on {service}.", "success", evt, ""),
+            ("Evaluator", "evaluate_thresholds", "alert", f"{metric} {value} breached threshold", "success", f"metric={metric} value={value}", ""),
+            ("Alert Router", "check_dedup_maintenance", "create", "create", "success", "", ""),
+            ("Incident Creator", "create_incident", "created", f"Incident {inc} created with severity={severity} for {service}.", "success", f"severity={severity}", inc),
+        ]
+        if parent:
+            steps.append(("Correlator", "correlate_incidents", "grouped", f"Grouped under parent {parent[0]}.", "success", parent[0], inc))
+        steps += [
+            ("Notifier", "send_notifications", "notified", "Notification dispatched to configured channels.", "success", "", inc),
+            ("Ticket Writer", "create_ticket", "created", f"Ticket {ticket} created in {system}.", "success", f"{system}:{ticket}", inc),
+            ("RCA Agent", "analyse_root_cause", "2 hypotheses", "Generated hypotheses from metric context.", "success", "", inc),
+            ("Recommender", "suggest_runbooks", "1 runbooks found", "Matched runbooks by keywords in summary/service.", "success", scenario_key, inc),
+            ("Enricher", "enrich_ticket", "enriched", "Work notes appended with hypotheses and recommended runbooks.", "success", f"ticket_id={ticket_id}", inc),
+        ]
+        # Rows carry the ticket number from its creation on; earlier rows get it via run_tickets.csv
+        # (shared.trace.stamp_ticket_number).
+        stamped = ""
+        step_t = t
+        for order, (agent, action, decision, rationale, outcome, detail, inc_id) in enumerate(steps, 1):
+            self._trace(step_t, run_id, inc_id, stamped, order, agent, action, "invoke", f"{agent} started.", "started")
+            step_t += self.rng.expovariate(1 / 0.8)
+            if agent == "Ticket Writer":
+                stamped = ticket
+                self._defer(step_t, "run_tickets", [run_id, ticket])
+            self._trace(step_t, run_id, inc_id, stamped, order, agent, action, decision, rationale, outcome, detail)
+        self._trace(step_t, run_id, inc, stamped, len(steps) + 1, "Pipeline", "end", "completed", "Pipeline finished.", "completed")
+        self._audit(t, "sentinel", "incident_created", inc, "success", duration_ms=int((step_t - t) * 1000))
+        self._audit(step_t, "sentinel", "ticket_created", ticket, "success")
+        self._audit(step_t, "triage", "enriched_ticket", ticket, "success")
+
+        if self.rng.random() < self.approval_ratio:
+            decided = step_t + self.rng.expovariate(1 / 600)
+            status = self.rng.choices(["approved", "rejected", "pending"], [6, 1, 1])[0]
+            self._defer(step_t, "approvals", [
+                f"req_{self._hex(12)}", inc, f"Run runbook: {scenario_key} (Match: {scenario_key})", "run_runbook",
+                ticket_id, system, status, _ts(step_t), _ts(decided) if status != "pending" else "",
+            ])
+
+        if closed:
+            close_t = step_t + self.rng.lognormvariate(math.log(3600), 1.0)
+            close_run = f"run_{self._hex(10)}"
+            n = len(steps) + 2
+            self._trace(close_t, close_run, inc, ticket, n, "Closer", "close_incident", "invoke",
+                        f"Manual close requested for {ticket}.", "started")
+            self._trace(close_t + 5, close_run, inc, ticket, n + 1, "Closer", "close_incident", "closed",
+                        f"Ticket {ticket} resolved, SLA stopped, and closed on {system}.", "success", f"{system}:{ticket}")
+            self._trace(close_t + 5, close_run, inc, ticket, n + 2, "Pipeline", "close_complete", "completed",
+                        f"Incident {ticket} marked closed locally.", "completed")
+            self._audit(close_t + 5, "triage", "incident_closed", ticket, "success")
+
+        parent_id, parent_ticket = parent if parent else (("SELF", ticket) if has_children else ("", ""))
+        self._defer(t, "incidents", [inc, severity, service, summary, _ts(t), ticket_id, system,
+                                     "closed" if closed else "open", ticket, parent_id, parent_ticket])
+        self._defer(t, "incident_runs", [inc, run_id])
+        return inc, ticket
+
+    # ── driver ────────────────────────────────────────────────────────
+
+    def run(self) -> dict:
+        files = {
+            "incidents": ("incidents/incidents.csv", INCIDENT_FIELDS),
+            "incident_runs": ("incidents/incident_runs.csv", ["incident_id", "run_id"]),
+            "run_tickets": ("trace/run_tickets.csv", ["run_id", "ticket_number"]),
+            "trace": ("trace/trace.csv", TRACE_FIELDS),
+            "audit_simple": ("audit/simple.csv", AUDIT_SIMPLE_FIELDS),
+            "audit_comprehensive": ("audit/comprehensive.csv", AUDIT_COMPREHENSIVE_FIELDS),
+            "approvals": ("approvals.csv", APPROVAL_FIELDS),
+        }
+        with ExitStack() as stack:
+            self._writers = {}
+            for name, (rel, fields) in files.items():
+                path = self.out / rel
+                path.parent.mkdir(parents=True, exist_ok=True)
+                w = csv.writer(stack.enter_context(open(path, "w", newline="", encoding="utf-8")))
+                w.writerow(fields)
+                self._writers[name] = w
+
+            # Incident groups (parent + correlated children) arrive as a Poisson process over the window.
+            span = self.end - self.start
+            made = 0
+            t = self.start
+            mean_group = 1 / (1 - self.child_ratio) if self.child_ratio < 1 else 1
+            gap = span / max(1, self.incidents / mean_group)
+            while made < self.incidents:
+                prev_t, t = t, t + self.rng.expovariate(1 / gap)
+                # Later events never start before these times, so everything up to them can be written.
+                for noise_t in sorted(self.rng.uniform(prev_t, t) for _ in range(self._poisson(self.noise_ratio))):
+                    self._flush_until(noise_t)
+                    self._noise_run(noise_t)
+                self._flush_until(t)
+                scenario = self.rng.choice(list(SCENARIOS))
+                service = self.rng.choice(self.services)
+                children = 0
+                while made + 1 + children < self.incidents and self.rng.random() < self.child_ratio:
+                    children += 1
+                inc, ticket = self._incident(t, None, scenario, service, has_children=children > 0)
+                made += 1
+                child_t = t
+                for _ in range(children):
+                    child_t += self.rng.expovariate(1 / 60)
+                    self._incident(child_t, (inc, ticket), scenario, service)
+                    made += 1
+            self._flush_until(math.inf)
+        return self.counts
+
+    def _poisson(self, lam: float) -> int:
+        """Knuth's method; lam is small (noise events per incident)."""
+        threshold, k, p = math.exp(-lam), 0, 1.0
+        while True:
+            p *= self.rng.random()
+            if p <= threshold:
+                return k
+            k += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic large history (incidents, trace, audit, approvals)")
+    parser.add_argument("--out", type=Path, default=Path("data/synthetic"), help="Output data directory")
+    parser.add_argument("--incidents", type=int, default=10000, help="Number of incidents (~25 trace rows each)")
+    parser.add_argument("--days", type=float, default=90.0, help="History length ending now")
+    parser.add_argument("--services", type=int, default=50, help="Distinct services")
+    parser.add_argument("--closed-ratio", type=float, default=0.85, help="Fraction of incidents closed")
+    parser.add_argument("--child-ratio", type=float, default=0.2, help="Chance each incident is followed by a correlated child")
+    parser.add_argument("--noise-ratio", type=float, default=1.0, help="Mean below-threshold runs per incident")
+    parser.add_argument("--jira-ratio", type=float, default=0.2, help="Fraction of tickets in Jira (rest ServiceNow)")
+    parser.add_argument("--approval-ratio", type=float, default=0.5, help="Fraction of incidents with an approval request")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for reproducible output")
+    args = parser.parse_args()
+    if args.incidents < 1 or not 0 <= args.child_ratio < 1:
+        parser.error("--incidents must be >= 1 and --child-ratio in [0, 1)")
+
+    started = time.perf_counter()
+    counts = Generator(
+        args.out, args.incidents, days=args.days, services=args.services, closed_ratio=args.closed_ratio,
+        child_ratio=args.child_ratio, noise_ratio=args.noise_ratio, jira_ratio=args.jira_ratio,
+        approval_ratio=args.approval_ratio, seed=args.seed,
+    ).run()
+    print(", ".join(f"{k}={v}" for k, v in counts.items()), f"in {time.perf_counter() - started:.1f}s -> {args.out}")
+    print(f"Use it with: SENTRY_DATA_DIR={args.out} uvicorn orchestrator.main:app")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+"""
+Fake ITSM server: in-memory ServiceNow / Jira / Teams stand-in for load and latency testing.
+Implements only the endpoints called by integrations/servicenow.py, jira.py and teams.py.
+Latency, error rate and 429 injection are configurable per system (default, servicenow, jira, teams).
+
+Run from project root:
+    python simulator/fake_itsm.py --port 8100 --latency lognormal:40:0.5 --error-rate 0.01 --rate-429 0.02
+    uvicorn simulator.fake_itsm:app --port 8100        # profile from FAKE_ITSM_* env vars
+
+Then point Configuration → Integrations at it:
+    ServiceNow instance URL = http://127.0.0.1:8100
+    Jira base URL           = http://127.0.0.1:8100
+    Teams webhook URL       = http://127.0.0.1:8100/teams/webhook
+
+Admin: GET/PUT /_fake/config, GET /_fake/stats, GET /_fake/tickets, POST /_fake/reset.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import uuid
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+# Add project root for imports when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+SYSTEMS = ("servicenow", "jira", "teams")
+
+JIRA_TRANSITIONS = [
+    {"id": "11", "name": "To Do", "to": {"name": "To Do"}},
+    {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
+    {"id": "31", "name": "Done", "to": {"name": "Done"}},
+]
+
+FAKE_USER = "argus.bot"
+FAKE_GROUPS = ("Hardware Support", "Application Support", "Network Operations")
+
+
+@dataclass
+class FaultProfile:
+    """Injected behaviour for one system. latency spec: none | fixed:MS | uniform:LO:HI | normal:MEAN:SD | lognormal:MEDIAN_MS:SIGMA."""
+    latency: str = "none"
+    error_rate: float = 0.0
+    rate_429: float = 0.0
+    retry_after_seconds: int = 1
+
+
+def parse_latency(spec: str) -> tuple[str, list[float]]:
+    """Parse a latency spec into (distribution, params). Raises ValueError on bad input."""
+    parts = (spec or "none").strip().lower().split(":")
+    kind, params = parts[0], [float(p) for p in parts[1:]]
+    expected = {"none": 0, "fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+    if kind not in expected:
+        raise ValueError(f"Unknown latency distribution '{kind}'. Choose from {list(expected)}")
+    if len(params) != expected[kind]:
+        raise ValueError(f"Latency '{kind}' takes {expected[kind]} parameter(s), got {len(params)}")
+    return kind, params
+
+
+def sample_latency_ms(spec: str, rng: random.Random) -> float:
+    kind, p = parse_latency(spec)
+    if kind == "fixed":
+        return p[0]
+    if kind == "uniform":
+        return rng.uniform(p[0], p[1])
+    if kind == "normal":
+        return max(0.0, rng.gauss(p[0], p[1]))
+    if kind == "lognormal":
+        return rng.lognormvariate(math.log(max(p[0], 0.001)), p[1])
+    return 0.0
+
+
+def _profile_from_env(prefix: str = "FAKE_ITSM") -> FaultProfile:
+    return FaultProfile(
+        latency=os.environ.get(f"{prefix}_LATENCY", "none"),
+        error_rate=float(os.environ.get(f"{prefix}_ERROR_RATE", "0") or 0),
+        rate_429=float(os.environ.get(f"{prefix}_429_RATE", "0") or 0),
+        retry_after_seconds=int(os.environ.get(f"{prefix}_RETRY_AFTER", "1") or 1),
+    )
+
+
+class FakeState:
+    """In-memory ticket store + fault profiles + counters."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        self.profiles: dict[str, FaultProfile] = {"default": _profile_from_env()}
+        self.reset()
+
+    def reset(self) -> None:
+        self.user_sys_id = uuid.uuid4().hex
+        self.groups = {name: uuid.uuid4().hex for name in FAKE_GROUPS}
+        self.incidents: dict[str, dict] = {}
+        self.slas: dict[str, dict] = {}
+        self.issues: dict[str, dict] = {}
+        self.teams_messages: deque = deque(maxlen=1000)
+        self.inc_seq = 0
+        self.issue_seq: dict[str, int] = defaultdict(int)
+        self.requests: dict[str, int] = defaultdict(int)
+        self.statuses: dict[str, int] = defaultdict(int)
+        self.injected: dict[str, int] = defaultdict(int)
+
+    def profile(self, system: str) -> FaultProfile:
+        return self.profiles.get(system) or self.profiles["default"]
+
+
+state = FakeState(seed=int(os.environ["FAKE_ITSM_SEED"]) if os.environ.get("FAKE_ITSM_SEED") else None)
+
+app = FastAPI(title="Fake ITSM (ServiceNow / Jira / Teams)", version="0.1.0")
+
+
+def _system_for_path(path: str) -> str:
+    if path.startswith("/api/now"):
+        return "servicenow"
+    if path.startswith("/rest/api"):
+        return "jira"
+    if path.startswith("/teams"):
+        return "teams"
+    return ""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@app.middleware("http")
+async def inject_faults(request: Request, call_next):
+    """Apply latency, 429 and error injection to ITSM paths; admin paths are never faulted."""
+    system = _system_for_path(request.url.path)
+    if not system:
+        return await call_next(request)
+    prof = state.profile(system)
+    state.requests[system] += 1
+    delay = sample_latency_ms(prof.latency, state.rng)
+    if delay > 0:
+        await asyncio.sleep(delay / 1000.0)
+    roll = state.rng.random()
+    if roll < prof.rate_429:
+        state.injected[f"{system}:429"] += 1
+        state.statuses[f"{system}:429"] += 1
+        return JSONResponse(
+            {"error": "Too Many Requests (injected)"},
+            status_code=429,
+            headers={"Retry-After": str(prof.retry_after_seconds)},
+        )
+    if roll < prof.rate_429 + prof.error_rate:
+        state.injected[f"{system}:500"] += 1
+        state.statuses[f"{system}:500"] += 1
+        return JSONResponse({"error": "Internal Server Error (injected)"}, status_code=500)
+    response = await call_next(request)
+    state.statuses[f"{system}:{response.status_code}"] += 1
+    return response
+
+
+def _parse_sysparm_query(q: str) -> dict[str, str]:
+    """'a=1^b=2' -> {'a': '1', 'b': '2'}. Only equality terms are supported."""
+    out = {}
+    for term in (q or "").split("^"):
+        if "=" in term:
+            k, v = term.split("=", 1)
+            out[k.strip()] = v.strip()
+    return out
+
+
+def _limit(request: Request, default: int = 200) -> int:
+    try:
+        return int(request.query_params.get("sysparm_limit", default))
+    except ValueError:
+        return default
+
+
+# ── ServiceNow ────────────────────────────────────────────────────────
+
+@app.get("/api/now/table/sys_user")
+async def snow_sys_user(request: Request):
+    # Any configured username resolves to the single fake user, so no user setup is needed.
+    q = _parse_sysparm_query(request.query_params.get("sysparm_query", ""))
+    user = q.get("user_name")
+    return {"result": [{"sys_id": state.user_sys_id, "user_name": user or FAKE_USER}][:_limit(request)]}
+
+
+@app.get("/api/now/table/sys_user_group")
+async def snow_groups(request: Request):
+    q = _parse_sysparm_query(request.query_params.get("sysparm_query", ""))
+    rows = [{"sys_id": sid, "name": name} for name, sid in state.groups.items()]
+    if "name" in q:
+        rows = [r for r in rows if r["name"] == q["name"]]
+    return {"result": rows[:_limit(request)]}
+
+
+@app.post("/api/now/table/incident", status_code=201)
+async def snow_create_incident(request: Request):
+    body = await request.json()
+    state.inc_seq += 1
+    sys_id = uuid.uuid4().hex
+    rec = {
+        **body,
+        "sys_id": sys_id,
+        "number": f"INC{state.inc_seq:07d}",
+        "state": "1",
+        "work_notes": [],
+        "sys_created_on": _now(),
+    }
+    state.incidents[sys_id] = rec
+    sla_id = uuid.uuid4().hex
+    state.slas[sla_id] = {"sys_id": sla_id, "task": sys_id, "active": "true"}
+    return {"result": {k: v for k, v in rec.items() if k != "work_notes"}}
+
+
+@app.patch("/api/now/table/incident/{sys_id}")
+async def snow_update_incident(sys_id: str, request: Request):
+    rec = state.incidents.get(sys_id)
+    if not rec:
+        raise HTTPException(status_code=404, detail="Record not found")
+    body = await request.json()
+    notes = body.pop("work_notes", None)
+    if notes:
+        rec["work_notes"].append({"at": _now(), "text": notes})
+    if body.get("state") in ("6", "7") and not (body.get("close_code") or rec.get("close_code")):
+        raise HTTPException(status_code=400, detail="close_code is mandatory when resolving")
+    rec.update(body)
+    return {"result": {k: v for k, v in rec.items() if k != "work_notes"}}
+
+
+@app.get("/api/now/table/task_sla")
+async def snow_task_sla(request: Request):
+    q = _parse_sysparm_query(request.query_params.get("sysparm_query", ""))
+    rows = [
+        {"sys_id": s["sys_id"]}
+        for s in state.slas.values()
+        if s["task"] == q.get("task") and s["active"] == q.get("active", s["active"])
+    ]
+    return {"result": rows[:_limit(request)]}
+
+
+@app.patch("/api/now/table/task_sla/{sla_id}")
+async def snow_update_sla(sla_id: str, request: Request):
+    rec = state.slas.get(sla_id)
+    if not rec:
+        raise HTTPException(status_code=404, detail="Record not found")
+    rec.update(await request.json())
+    return {"result": rec}
+
+
+# ── Jira ──────────────────────────────────────────────────────────────
+
+def _issue_or_404(key: str) -> dict:
+    issue = state.issues.get(key)
+    if not issue:
+        raise HTTPException(status_code=404, detail={"errorMessages": ["Issue does not exist"]})
+    return issue
+
+
+@app.get("/rest/api/3/myself")
+async def jira_myself():
+    return {"accountId": state.user_sys_id, "emailAddress": f"{FAKE_USER}@example.com", "active": True}
+
+
+@app.post("/rest/api/3/issue", status_code=201)
+async def jira_create_issue(request: Request):
+    body = await request.json()
+    fields = body.get("fields") or {}
+    project = ((fields.get("project") or {}).get("key") or "").strip()
+    if not project:
+        return JSONResponse({"errorMessages": [], "errors": {"project": "project is required"}}, status_code=400)
+    state.issue_seq[project] += 1
+    key = f"{project}-{state.issue_seq[project]}"
+    issue_id = str(10000 + len(state.issues))
+    state.issues[key] = {
+        "id": issue_id,
+        "key": key,
+        "fields": fields,
+        "status": "To Do",
+        "comments": [],
+        "created": _now(),
+    }
+    return {"id": issue_id, "key": key, "self": f"/rest/api/3/issue/{issue_id}"}
+
+
+@app.post("/rest/api/3/issue/{key}/comment", status_code=201)
+async def jira_add_comment(key: str, request: Request):
+    issue = _issue_or_404(key)
+    body = await request.json()
+    comment_id = str(len(issue["comments"]) + 1)
+    issue["comments"].append({"id": comment_id, "body": body.get("body"), "created": _now()})
+    return {"id": comment_id, "created": issue["comments"][-1]["created"]}
+
+
+@app.get("/rest/api/3/issue/{key}")
+async def jira_get_issue(key: str, expand: str = ""):
+    issue = _issue_or_404(key)
+    out = {"id": issue["id"], "key": key, "fields": {"issuetype": issue["fields"].get("issuetype") or {"name": "Task"}}}
+    if "transitions" in expand.split(","):
+        out["transitions"] = JIRA_TRANSITIONS
+    return out
+
+
+@app.get("/rest/api/3/issue/{key}/transitions")
+async def jira_list_transitions(key: str):
+    _issue_or_404(key)
+    return {"transitions": JIRA_TRANSITIONS}
+
+
+@app.post("/rest/api/3/issue/{key}/transitions", status_code=204)
+async def jira_do_transition(key: str, request: Request):
+    issue = _issue_or_404(key)
+    body = await request.json()
+    tid = str((body.get("transition") or {}).get("id") or "")
+    match = next((t for t in JIRA_TRANSITIONS if t["id"] == tid), None)
+    if not match:
+        return JSONResponse({"errorMessages": [f"Transition id '{tid}' is not valid for this issue."]}, status_code=400)
+    issue["status"] = match["to"]["name"]
+    return PlainTextResponse("", status_code=204)
+
+
+# ── Teams ─────────────────────────────────────────────────────────────
+
+@app.post("/teams/webhook")
+@app.post("/teams/webhook/{channel:path}")
+async def teams_webhook(request: Request, channel: str = ""):
+    payload = await request.json()
+    state.teams_messages.append({"at": _now(), "channel": channel, "payload": payload})
+    # Teams incoming webhooks answer 200 with body "1".
+    return PlainTextResponse("1")
+
+
+# ── Admin ─────────────────────────────────────────────────────────────
+
+@app.get("/_fake/config")
+async def get_config():
+    return {name: asdict(p) for name, p in state.profiles.items()}
+
+
+@app.put("/_fake/config")
+async def put_config(body: dict[str, dict[str, Any]]):
+    """Replace profiles, e.g. {"default": {"latency": "fixed:20"}, "servicenow": {"rate_429": 0.05}}."""
+    new_profiles = dict(state.profiles)
+    for name, values in body.items():
+        if name != "default" and name not in SYSTEMS:
+            raise HTTPException(status_code=400, detail=f"Unknown system '{name}'")
+        prof = FaultProfile(**{**asdict(state.profile(name)), **values})
+        try:
+            parse_latency(prof.latency)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        new_profiles[name] = prof
+    state.profiles = new_profiles
+    return await get_config()
+
+
+@app.get("/_fake/stats")
+async def get_stats():
+    return {
+        "requests": dict(state.requests),
+        "statuses": dict(state.statuses),
+        "injected": dict(state.injected),
+        "store": {
+            "servicenow_incidents": len(state.incidents),
+            "jira_issues": len(state.issues),
+            "teams_messages": len(state.teams_messages),
+        },
+    }
+
+
+@app.get("/_fake/tickets")
+async def get_tickets(limit: int = 50):
+    incs = list(state.incidents.values())[-limit:]
+    issues = list(state.issues.values())[-limit:]
+    return {"servicenow": incs, "jira": issues, "teams": list(state.teams_messages)[-limit:]}
+
+
+@app.post("/_fake/reset")
+async def reset():
+    state.reset()
+    return {"status": "reset"}
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake ServiceNow/Jira/Teams server for load and latency testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", default=None, help="none | fixed:MS | uniform:LO:HI | normal:MEAN:SD | lognormal:MEDIAN_MS:SIGMA")
+    parser.add_argument("--error-rate", type=float, default=None, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--rate-429", type=float, default=None, help="Fraction of requests answered with HTTP 429")
+    parser.add_argument("--retry-after", type=int, default=None, help="Retry-After seconds on injected 429s")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for reproducible fault injection")
+    args = parser.parse_args()
+
+    prof = state.profiles["default"]
+    if args.latency is not None:
+        parse_latency(args.latency)
+        prof.latency = args.latency
+    if args.error_rate is not None:
+        prof.error_rate = args.error_rate
+    if args.rate_429 is not None:
+        prof.rate_429 = args.rate_429
+    if args.retry_after is not None:
+        prof.retry_after_seconds = args.retry_after
+    if args.seed is not None:
+        state.rng.seed(args.seed)
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Load generator (1.6): drive POST /events at a target rate with a weighted scenario mix.
+Open-loop schedule (constant or Poisson arrivals) over one keep-alive client; at most `concurrency`
+requests are in flight, and time spent waiting for a free slot is reported as schedule lag.
+The report (JSON) has p50/p95/p99 latency, a latency histogram, throughput and an error breakdown,
+overall and per scenario, so runs from different releases can be diffed.
+
+    python simulator/run.py --load --rate 50 --arrival poisson --duration 60 --concurrency 32 \
+        --mix high_cpu=3,service_down=1 --out data/loadtest/report.json
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import httpx
+
+from simulator.scenarios import SCENARIOS, emit_event
+
+ARRIVALS = ("constant", "poisson")
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# (offset from start in seconds, label for per-label stats, request body)
+Send = tuple[float, str, dict]
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """'high_cpu=3,service_down=1' -> weights. A bare name has weight 1. Raises ValueError on bad input."""
+    mix: dict[str, float] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name}. Choose from {list(SCENARIOS)}")
+        w = float(weight) if weight else 1.0
+        if w < 0:
+            raise ValueError(f"Weight for '{name}' must be >= 0")
+        mix[name] = w
+    if not mix or not any(mix.values()):
+        raise ValueError("Scenario mix needs at least one positive weight")
+    return mix
+
+
+@dataclass
+class LoadProfile:
+    rate: float = 10.0                 # target events per second
+    arrival: str = "constant"          # constant | poisson
+    duration_seconds: float = 30.0
+    concurrency: int = 20
+    mix: dict[str, float] = field(default_factory=lambda: {k: 1.0 for k in SCENARIOS})
+    timeout_seconds: float = 10.0
+    seed: Optional[int] = None
+
+    def validate(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be > 0")
+        if self.arrival not in ARRIVALS:
+            raise ValueError(f"arrival must be one of {ARRIVALS}")
+        if self.duration_seconds <= 0 or self.concurrency < 1:
+            raise ValueError("duration must be > 0 and concurrency >= 1")
+
+
+def event_body(ev: dict) -> dict:
+    """Request body the orchestrator expects for a simulator event."""
+    return {"event_id": ev["event_id"], "type": "simulated", "payload": ev}
+
+
+def profile_schedule(profile: LoadProfile) -> Iterator[Send]:
+    """Arrival offsets for the profile; events are built lazily so timestamps are current."""
+    rng = random.Random(profile.seed)
+    names = list(profile.mix)
+    weights = [profile.mix[n] for n in names]
+    offset, i = 0.0, 0
+    while True:
+        if profile.arrival == "poisson":
+            offset += rng.expovariate(profile.rate)
+        else:
+            offset = i / profile.rate
+            i += 1
+        if offset >= profile.duration_seconds:
+            return
+        name = rng.choices(names, weights)[0]
+        yield offset, name, event_body(emit_event(name))
+
+
+def percentile(sorted_samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not sorted_samples:
+        return 0.0
+    k = max(0, math.ceil(q / 100.0 * len(sorted_samples)) - 1)
+    return sorted_samples[k]
+
+
+def latency_summary(samples: list[float]) -> dict:
+    s = sorted(samples)
+    return {
+        "count": len(s),
+        "mean": round(sum(s) / len(s), 3) if s else 0.0,
+        "p50": round(percentile(s, 50), 3),
+        "p95": round(percentile(s, 95), 3),
+        "p99": round(percentile(s, 99), 3),
+        "max": round(s[-1], 3) if s else 0.0,
+    }
+
+
+def histogram(samples: Iterable[float]) -> dict[str, int]:
+    counts = Counter()
+    for v in samples:
+        for b in HISTOGRAM_BOUNDS_MS:
+            if v <= b:
+                counts[f"<={b}"] += 1
+                break
+        else:
+            counts[f">{HISTOGRAM_BOUNDS_MS[-1]}"] += 1
+    keys = [f"<={b}" for b in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+    return {k: counts[k] for k in keys}
+
+
+class Recorder:
+    """Collects per-request outcomes; summary() builds the report."""
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.lags: list[float] = []
+        self.errors: Counter = Counter()
+        self.by_label: dict[str, list[float]] = defaultdict(list)
+        self.errors_by_label: dict[str, Counter] = defaultdict(Counter)
+        self.ok = 0
+
+    def record(self, label: str, latency_ms: float, lag_ms: float, error: Optional[str]) -> None:
+        self.latencies.append(latency_ms)
+        self.lags.append(lag_ms)
+        self.by_label[label].append(latency_ms)
+        if error:
+            self.errors[error] += 1
+            self.errors_by_label[label][error] += 1
+        else:
+            self.ok += 1
+
+    def summary(self, elapsed_seconds: float) -> dict:
+        n = len(self.latencies)
+        elapsed = max(elapsed_seconds, 1e-9)
+        return {
+            "requests": n,
+            "ok": self.ok,
+            "error_count": n - self.ok,
+            "errors": dict(self.errors.most_common()),
+            "elapsed_seconds": round(elapsed_seconds, 3),
+            "throughput_rps": round(n / elapsed, 3),
+            "ok_rps": round(self.ok / elapsed, 3),
+            "latency_ms": latency_summary(self.latencies),
+            "schedule_lag_ms": latency_summary(self.lags),
+            "histogram_ms": histogram(self.latencies),
+            "by_scenario": {
+                label: {**latency_summary(samples), "errors": dict(self.errors_by_label[label])}
+                for label, samples in sorted(self.by_label.items())
+            },
+        }
+
+
+def _error_key(exc: Exception) -> str:
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    return type(exc).__name__
+
+
+async def run_schedule(
+    schedule: Iterable[Send],
+    base_url: str,
+    concurrency: int = 20,
+    timeout_seconds: float = 10.0,
+    path: str = "/events",
+) -> dict:
+    """POST each body at its offset (bounded by concurrency). Returns Recorder.summary()."""
+    rec = Recorder()
+    slots = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    pending: set[asyncio.Task] = set()
+
+    async def send(client: httpx.AsyncClient, due: float, label: str, body: dict) -> None:
+        lag_ms = max(0.0, (loop.time() - due) * 1000)
+        t0 = time.perf_counter()
+        error = None
+        try:
+            r = await client.post(path, json=body)
+            if r.status_code >= 400:
+                error = f"http_{r.status_code}"
+        except httpx.HTTPError as e:
+            error = _error_key(e)
+        finally:
+            slots.release()
+        rec.record(label, (time.perf_counter() - t0) * 1000, lag_ms, error)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout_seconds, limits=limits) as client:
+        start = loop.time()
+        for offset, label, body in schedule:
+            due = start + offset
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()  # all slots busy: the schedule slips and the wait shows up as lag
+            task = asyncio.create_task(send(client, due, label, body))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+        elapsed = loop.time() - start
+    return rec.summary(elapsed)
+
+
+async def run_load(profile: LoadProfile, base_url: str, label: str = "") -> dict:
+    """Run one load test and return the JSON-ready report."""
+    profile.validate()
+    started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    result = await run_schedule(profile_schedule(profile), base_url, profile.concurrency, profile.timeout_seconds)
+    return {"label": label, "started_at": started, "base_url": base_url, "profile": asdict(profile), **result}
+
+
+def write_report(report: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def format_report(report: dict) -> str:
+    lat, lag = report["latency_ms"], report["schedule_lag_ms"]
+    lines = [
+        f"requests={report['requests']} ok={report['ok']} errors={report['error_count']} "
+        f"elapsed={report['elapsed_seconds']}s throughput={report['throughput_rps']}/s",
+        f"latency ms: p50={lat['p50']} p95={lat['p95']} p99={lat['p99']} max={lat['max']}",
+        f"schedule lag ms: p50={lag['p50']} p99={lag['p99']}",
+    ]
+    if report["errors"]:
+        lines.append("errors: " + ", ".join(f"{k}={v}" for k, v in report["errors"].items()))
+    for name, s in report["by_scenario"].items():
+        lines.append(f"  {name}: n={s['count']} p50={s['p50']} p95={s['p95']} p99={s['p99']} errors={sum(s['errors'].values())}")
+    return "\n".join(lines)
@@ -0,0 +1,120 @@
+"""
+Replay (1.6): stream an orchestrator event capture (orchestrator/capture.py, data/capture/*.ndjson)
+back to POST /events at the original timing, N times faster, or as fast as concurrency allows
+(speed 0). The report puts the replay next to the baseline recorded in the capture: throughput over
+the capture span and the recorded server-side processing time per event.
+
+    python simulator/run.py --replay data/capture --speed 10 --concurrency 32 --out data/loadtest/replay.json
+
+Event ids are rewritten by default so the idempotency store does not short-circuit a second replay;
+--keep-ids sends the captured ids unchanged.
+"""
+from __future__ import annotations
+
+import json
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterator
+
+from simulator.loadgen import Send, latency_summary, run_schedule
+
+CAPTURE_GLOB = "events-*.ndjson"
+
+
+def read_capture(path: Path) -> list[dict]:
+    """Records from one capture file or every capture file in a directory, in arrival order."""
+    files = sorted(path.glob(CAPTURE_GLOB)) if path.is_dir() else [path]
+    records = []
+    for f in files:
+        with open(f, "r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # a torn last line from a crash
+                if isinstance(rec.get("body"), dict):
+                    records.append(rec)
+    records.sort(key=lambda r: r.get("received_at", 0.0))
+    if not records:
+        raise ValueError(f"No captured events in {path}")
+    return records
+
+
+def _fresh_ids(body: dict) -> dict:
+    new_id = f"evt_{uuid.uuid4().hex[:12]}"
+    payload = dict(body.get("payload") or {})
+    if "event_id" in payload:
+        payload["event_id"] = new_id
+    return {**body, "event_id": new_id, "payload": payload}
+
+
+def replay_schedule(records: list[dict], speed: float = 1.0, keep_ids: bool = False) -> Iterator[Send]:
+    """Offsets relative to the first captured event, divided by speed (speed <= 0: all due at once)."""
+    t0 = records[0].get("received_at", 0.0)
+    for rec in records:
+        offset = (rec.get("received_at", t0) - t0) / speed if speed > 0 else 0.0
+        body = rec["body"] if keep_ids else _fresh_ids(rec["body"])
+        yield offset, rec.get("decision") or "event", body
+
+
+def baseline(records: list[dict]) -> dict:
+    """What the capturing orchestrator saw: arrival throughput and its processing time per event."""
+    span = records[-1].get("received_at", 0.0) - records[0].get("received_at", 0.0)
+    by_label: dict[str, list[float]] = defaultdict(list)
+    for rec in records:
+        by_label[rec.get("decision") or "event"].append(float(rec.get("duration_ms") or 0.0))
+    return {
+        "requests": len(records),
+        "span_seconds": round(span, 3),
+        "throughput_rps": round(len(records) / span, 3) if span > 0 else None,
+        "latency_ms": latency_summary([d for ds in by_label.values() for d in ds]),
+        "by_decision": {k: latency_summary(v) for k, v in sorted(by_label.items())},
+    }
+
+
+def _delta(new: float, old: float) -> dict:
+    return {"baseline": old, "replay": new, "change_pct": round((new - old) / old * 100, 1) if old else None}
+
+
+async def run_replay(
+    path: Path,
+    base_url: str,
+    speed: float = 1.0,
+    concurrency: int = 20,
+    timeout_seconds: float = 10.0,
+    keep_ids: bool = False,
+    label: str = "",
+) -> dict:
+    records = read_capture(path)
+    base = baseline(records)
+    result = await run_schedule(replay_schedule(records, speed, keep_ids), base_url, concurrency, timeout_seconds)
+    comparison = {q: _delta(result["latency_ms"][q], base["latency_ms"][q]) for q in ("p50", "p95", "p99")}
+    if base["throughput_rps"]:
+        # At speed N the capture's arrival rate is scaled by N; compare like with like.
+        expected = round(base["throughput_rps"] * speed, 3) if speed > 0 else None
+        comparison["throughput_rps"] = _delta(result["throughput_rps"], expected) if expected else {
+            "baseline": base["throughput_rps"], "replay": result["throughput_rps"], "change_pct": None}
+    return {
+        "label": label,
+        "capture": str(path),
+        "base_url": base_url,
+        "speed": speed,
+        "concurrency": concurrency,
+        "keep_ids": keep_ids,
+        "baseline": base,
+        **result,
+        "comparison": comparison,
+    }
+
+
+def format_comparison(report: dict) -> str:
+    lines = [f"baseline: {report['baseline']['requests']} events over {report['baseline']['span_seconds']}s"]
+    for name, d in report["comparison"].items():
+        change = f"{d['change_pct']:+}%" if d["change_pct"] is not None else "n/a"
+        lines.append(f"  {name}: baseline={d['baseline']} replay={d['replay']} ({change})")
+    lines.append("(latency: baseline is server-side processing time, replay is client round trip)")
+    return "\n".join(lines)
@@ -1,5 +1,8 @@
 """
 Standalone simulator (1.6): CLI to emit one or more events. Can be run manually or from Streamlit.
+--load runs a timed load test against the orchestrator (see simulator/loadgen.py).
+--replay streams an orchestrator event capture back (see simulator/replay.py).
+--timeseries generates per-service metric streams (see simulator/timeseries.py).
 """
 import argparse
 import asyncio
@@ -11,6 +14,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import httpx
 from simulator.scenarios import emit_event, list_scenarios
+from simulator.loadgen import LoadProfile, format_report, parse_mix, run_load, run_schedule, write_report
+from simulator.replay import format_comparison, run_replay
+from simulator import timeseries
 
 ORCHESTRATOR_URL = "http://127.0.0.1:8000"  # override with env if needed
 
@@ -45,12 +51,94 @@ def main():
     parser.add_argument("--api", action="store_true", help="POST to orchestrator (default: local only)")
     parser.add_argument("--list", action="store_true", help="List available scenarios")
     parser.add_argument("--base-url", default=ORCHESTRATOR_URL, help="Orchestrator base URL when using --api")
+    load = parser.add_argument_group("load test (--load)")
+    load.add_argument("--load", action="store_true", help="Run a timed load test against the orchestrator")
+    load.add_argument("--rate", type=float, default=10.0, help="Target events per second")
+    load.add_argument("--arrival", choices=["constant", "poisson"], default="constant", help="Inter-arrival distribution")
+    load.add_argument("--duration", type=float, default=30.0, help="Test duration in seconds")
+    load.add_argument("--concurrency", type=int, default=20, help="Max requests in flight")
+    load.add_argument("--mix", default="", help="Weighted scenarios, e.g. high_cpu=3,service_down=1 (default: all equally)")
+    load.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    load.add_argument("--seed", type=int, default=None, help="RNG seed for arrivals and scenario choice")
+    load.add_argument("--label", default="", help="Label stored in the report (e.g. release tag)")
+    load.add_argument("--out", type=Path, default=None, help="Write the JSON report to this path")
+    replay = parser.add_argument_group("replay (--replay); also uses --concurrency, --timeout, --label, --out")
+    replay.add_argument("--replay", type=Path, default=None, help="Capture file or directory (data/capture) to replay")
+    replay.add_argument("--speed", type=float, default=None,
+                        help="Time multiplier: 1 = original timing, 10 = 10x faster, 0 = as fast as possible "
+                             "(default: 1 for --replay, 0 for --timeseries)")
+    replay.add_argument("--keep-ids", action="store_true", help="Send captured event ids unchanged (default: fresh ids)")
+    ts = parser.add_argument_group("time series (--timeseries); also uses --speed, --concurrency, --timeout, --seed, --out")
+    ts.add_argument("--timeseries", action="store_true", help="Generate metric time series and stream them")
+    ts.add_argument("--services", type=int, default=10, help="Number of services")
+    ts.add_argument("--metrics", default="", help=f"Comma-separated metrics (default: {','.join(timeseries.PROFILES)})")
+    ts.add_argument("--steps", type=int, default=1440, help="Samples per series")
+    ts.add_argument("--interval", type=float, default=60.0, help="Simulated seconds between samples")
+    ts.add_argument("--incidents-per-day", type=float, default=1.0, help="Mean incident episodes per series per simulated day")
+    ts.add_argument("--spike-prob", type=float, default=0.002, help="Chance of a one-sample spike per sample")
+    ts.add_argument("--to-file", type=Path, default=None, help="Write NDJSON (replayable) instead of POSTing")
     args = parser.parse_args()
 
     if args.list:
         print("Scenarios:", ", ".join(list_scenarios()))
         return
 
+    if args.timeseries:
+        try:
+            batch = timeseries.generate(
+                timeseries.service_names(args.services),
+                [m.strip() for m in args.metrics.split(",") if m.strip()] or None,
+                steps=args.steps, interval_seconds=args.interval, incidents_per_day=args.incidents_per_day,
+                spike_prob=args.spike_prob, seed=args.seed,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        n_series, n_steps = batch.values.shape
+        print(f"Generated {n_series} series x {n_steps} steps ({int(batch.incident.sum())} incident samples)")
+        if args.to_file:
+            written = timeseries.write_ndjson(batch, args.to_file)
+            print(f"Wrote {written} events to {args.to_file}")
+            return
+        speed = args.speed if args.speed is not None else 0.0
+        report = asyncio.run(run_schedule(timeseries.stream_schedule(batch, speed), args.base_url, args.concurrency, args.timeout))
+        print(format_report(report))
+        if args.out:
+            write_report(report, args.out)
+            print(f"Report written to {args.out}")
+        return
+
+    if args.replay:
+        try:
+            report = asyncio.run(run_replay(
+                args.replay, args.base_url, speed=args.speed if args.speed is not None else 1.0, concurrency=args.concurrency,
+                timeout_seconds=args.timeout, keep_ids=args.keep_ids, label=args.label,
+            ))
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        print(format_report(report))
+        print(format_comparison(report))
+        if args.out:
+            write_report(report, args.out)
+            print(f"Report written to {args.out}")
+        return
+
+    if args.load:
+        try:
+            mix = parse_mix(args.mix or args.scenario or ",".join(list_scenarios()))
+            profile = LoadProfile(
+                rate=args.rate, arrival=args.arrival, duration_seconds=args.duration,
+                concurrency=args.concurrency, mix=mix, timeout_seconds=args.timeout, seed=args.seed,
+            )
+            profile.validate()
+        except ValueError as e:
+            parser.error(str(e))
+        report = asyncio.run(run_load(profile, args.base_url, args.label))
+        print(format_report(report))
+        if args.out:
+            write_report(report, args.out)
+            print(f"Report written to {args.out}")
+        return
+
     if not args.scenario:
         parser.error("scenario required (or use --list)")
         return
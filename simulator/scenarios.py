@@ -46,23 +46,26 @@ SCENARIOS = {
 }
 
 
+def make_event(service: str, metric: str, value: float, unit: str, summary: str, timestamp: str = "") -> dict:
+    """Normalized event dict; timestamp defaults to now (UTC)."""
+    return {
+        "event_id": f"evt_{uuid.uuid4().hex[:12]}",
+        "source": "simulator",
+        "metric": metric,
+        "value": value,
+        "unit": unit,
+        "service": service,
+        "timestamp": timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "extra": {"summary": summary},
+    }
+
+
 def emit_event(scenario_key: str) -> dict:
     """Emit one event for the given scenario. Returns normalized event dict."""
     if scenario_key not in SCENARIOS:
         raise ValueError(f"Unknown scenario: {scenario_key}. Choose from {list(SCENARIOS)}")
     s = SCENARIOS[scenario_key]
-    event_id = f"evt_{uuid.uuid4().hex[:12]}"
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    return {
-        "event_id": event_id,
-        "source": "simulator",
-        "metric": s["metric"],
-        "value": s["value"],
-        "unit": s["unit"],
-        "service": s["service"],
-        "timestamp": ts,
-        "extra": {"summary": s["summary"]},
-    }
+    return make_event(s["service"], s["metric"], s["value"], s["unit"], s["summary"])
 
 
 def list_scenarios() -> list[str]:
@@ -0,0 +1,161 @@
+"""
+Time-series scenarios (1.6): per-service metric streams for exercising sustained rules, dedupe and
+anomaly detection, instead of the single fixed value emit_event() sends.
+
+Each (service, metric) series = baseline + diurnal cycle + Gaussian noise, plus incident episodes
+(ramp up to the metric's failure level, hold, recover) and one-sample spikes. The whole
+(series x steps) matrix is built with NumPy in one pass; episodes are scattered in with
+np.maximum.at. Events carry simulated timestamps (start + step * interval) so time-based rules see
+the intended spacing even when the stream is sent faster than real time.
+
+    python simulator/run.py --timeseries --services 200 --steps 1440 --interval 60 --speed 0     # to orchestrator
+    python simulator/run.py --timeseries --services 2000 --steps 1440 --to-file data/loadtest/day.ndjson
+    python simulator/run.py --replay data/loadtest/day.ndjson --speed 60                         # stream the file later
+
+Files use the capture record format (orchestrator/capture.py), so --replay can send them.
+"""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from simulator.loadgen import Send, event_body
+from simulator.scenarios import SCENARIOS, make_event
+
+
+@dataclass(frozen=True)
+class MetricProfile:
+    unit: str
+    baseline: float
+    noise: float        # Gaussian sd
+    diurnal: float      # amplitude of the daily cycle
+    failure: float      # level reached at the peak of an incident episode
+    floor: float
+    ceiling: float
+    label: str
+
+
+PROFILES: dict[str, MetricProfile] = {
+    "cpu_percent": MetricProfile("percent", 45.0, 4.0, 15.0, 96.0, 0.0, 100.0, "High CPU"),
+    "memory_percent": MetricProfile("percent", 60.0, 1.5, 5.0, 94.0, 0.0, 100.0, "High memory"),
+    "error_rate": MetricProfile("ratio", 0.01, 0.003, 0.005, 0.15, 0.0, 1.0, "Error rate spike"),
+    "latency_p99_ms": MetricProfile("ms", 300.0, 40.0, 80.0, 2500.0, 0.0, float("inf"), "P99 latency spike"),
+    "up": MetricProfile("bool", 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, "Service down"),
+}
+BASE_SERVICES = sorted({s["service"] for s in SCENARIOS.values()})
+
+
+@dataclass
+class SeriesBatch:
+    keys: list[tuple[str, str]]     # (service, metric) per row
+    values: np.ndarray              # (series, steps) float64
+    incident: np.ndarray            # (series, steps) bool: inside an episode or a spike
+    start: float                    # epoch seconds of step 0
+    interval: float
+
+    def timestamp(self, step: int) -> str:
+        return datetime.fromtimestamp(self.start + step * self.interval, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def service_names(n: int) -> list[str]:
+    extra = max(0, n - len(BASE_SERVICES))
+    return (BASE_SERVICES + [f"svc-{i:03d}" for i in range(extra)])[:n]
+
+
+def generate(
+    services: list[str],
+    metrics: Optional[list[str]] = None,
+    steps: int = 1440,
+    interval_seconds: float = 60.0,
+    start: Optional[float] = None,
+    incidents_per_day: float = 1.0,
+    spike_prob: float = 0.002,
+    seed: Optional[int] = None,
+) -> SeriesBatch:
+    """Build every series for services x metrics over `steps` samples."""
+    metrics = list(metrics or PROFILES)
+    unknown = [m for m in metrics if m not in PROFILES]
+    if unknown:
+        raise ValueError(f"Unknown metric(s) {unknown}. Choose from {list(PROFILES)}")
+    rng = np.random.default_rng(seed)
+    start = time.time() - steps * interval_seconds if start is None else start
+    keys = [(svc, m) for svc in services for m in metrics]
+    n = len(keys)
+    prof = [PROFILES[m] for _, m in keys]
+    col = lambda attr: np.array([getattr(p, attr) for p in prof])[:, None]
+
+    # Baseline, diurnal cycle (phase shared per service) and noise
+    t = start + np.arange(steps) * interval_seconds
+    svc_phase = rng.uniform(0, 2 * np.pi, len(services))
+    phase = np.repeat(svc_phase, len(metrics))[:, None]
+    baseline = col("baseline") * rng.uniform(0.85, 1.15, (n, 1))
+    values = baseline + col("diurnal") * np.sin(2 * np.pi * t[None, :] / 86400.0 + phase)
+    values += rng.standard_normal((n, steps)) * col("noise")
+
+    # Incident episodes: envelope 0 -> 1 (ramp) -> 1 (hold) -> 0 (recovery)
+    envelope = np.zeros((n, steps))
+    expected = incidents_per_day * steps * interval_seconds / 86400.0
+    counts = rng.poisson(expected, n)
+    total = int(counts.sum())
+    if total:
+        rows = np.repeat(np.arange(n), counts)
+        ramp = rng.integers(1, 15, total)
+        hold = rng.integers(2, 30, total)
+        recover = rng.integers(1, 20, total)
+        length = ramp + hold + recover
+        begin = rng.integers(0, steps, total)
+        offsets = np.arange(length.sum()) - np.repeat(np.cumsum(length) - length, length)  # 0..len-1 per episode
+        r, h, c = (np.repeat(a, length) for a in (ramp, hold, recover))
+        shape = np.where(offsets < r, (offsets + 1) / r,
+                         np.where(offsets < r + h, 1.0, 1.0 - (offsets - r - h + 1) / (c + 1)))
+        cols = np.repeat(begin, length) + offsets
+        keep = cols < steps
+        np.maximum.at(envelope, (np.repeat(rows, length)[keep], cols[keep]), shape[keep])
+    failure = col("failure") + rng.standard_normal((n, steps)) * col("noise")
+    values = (1 - envelope) * values + envelope * failure
+
+    # One-sample spikes toward the failure level
+    spikes = rng.random((n, steps)) < spike_prob
+    values = np.where(spikes, col("failure") + (col("failure") - baseline) * rng.uniform(0.0, 0.3, (n, steps)), values)
+
+    values = np.clip(values, col("floor"), col("ceiling"))
+    is_up = np.array([m == "up" for _, m in keys])
+    values[is_up] = (values[is_up] >= 0.5).astype(float)
+    return SeriesBatch(keys, values, (envelope >= 0.5) | spikes, start, interval_seconds)
+
+
+def iter_events(batch: SeriesBatch) -> Iterator[tuple[int, dict]]:
+    """(step, event) in time order, every series per step."""
+    labels = [f"{PROFILES[m].label} on {svc}" for svc, m in batch.keys]
+    units = [PROFILES[m].unit for _, m in batch.keys]
+    rounded = np.round(batch.values, 4).tolist()
+    for step in range(batch.values.shape[1]):
+        ts = batch.timestamp(step)
+        for i, (svc, metric) in enumerate(batch.keys):
+            yield step, make_event(svc, metric, rounded[i][step], units[i], labels[i], ts)
+
+
+def stream_schedule(batch: SeriesBatch, speed: float = 0.0) -> Iterator[Send]:
+    """Schedule for loadgen.run_schedule: step spacing / speed apart (speed <= 0: as fast as possible)."""
+    for step, ev in iter_events(batch):
+        offset = step * batch.interval / speed if speed > 0 else 0.0
+        yield offset, ev["metric"], event_body(ev)
+
+
+def write_ndjson(batch: SeriesBatch, path: Path) -> int:
+    """Write events as capture records (replayable with run.py --replay). Returns events written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for step, ev in iter_events(batch):
+            rec = {"received_at": batch.start + step * batch.interval, "duration_ms": 0, "decision": ev["metric"],
+                   "replayed": False, "body": event_body(ev)}
+            f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+            written += 1
+    return written
@@ -0,0 +1,149 @@
+"""
+Cached read access to the data/ CSVs for the Streamlit pages.
+
+Incidents and audit loaders stat their file and read it through st.cache_data keyed on
+(path, mtime, size), so a rerun with unchanged files returns the cached frame without touching the
+file contents; any write changes the key and the next call re-reads. trace.csv only grows between
+ticket stamps, so it is followed instead: one TailFrame per process (st.cache_resource) parses just
+the rows appended since the last call (shared.csv_tail) and re-reads only when the file is rewritten.
+
+Every column is read as str ("" for empty), missing optional columns are added with their
+defaults, and timestamps are parsed once here: incidents/audit replace `timestamp` with datetimes,
+trace keeps the raw `timestamp` string (shown as-is in the pipeline views) and adds the parsed
+`_ts`; its empty ticket_number cells are filled from run_tickets.csv (fill_ticket_numbers). Callers
+get their own copy and may add or replace columns.
+"""
+from __future__ import annotations
+
+import io
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+from shared.config_loader import DATA_DIR
+from shared.csv_tail import CsvTail
+from shared.trace import FIELDS as TRACE_FIELDS, RUN_TICKETS_PATH, TRACE_PATH
+
+INCIDENTS_PATH = DATA_DIR / "incidents" / "incidents.csv"
+AUDIT_PATHS = {
+    "simple": DATA_DIR / "audit" / "simple.csv",
+    "comprehensive": DATA_DIR / "audit" / "comprehensive.csv",
+}
+
+# Columns added by later phases; older files may not have them.
+INCIDENT_DEFAULTS = {
+    "severity": "", "service": "", "summary": "", "ticket_id": "", "ticket_system": "",
+    "status": "open", "ticket_number": "", "parent_incident_id": "", "parent_ticket_number": "",
+}
+TRACE_DEFAULTS = {f: "" for f in TRACE_FIELDS}
+
+CACHE_ENTRIES = 16
+TAIL_READ_BYTES = 64 * 1024 * 1024
+
+
+def file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size), or None if the file does not exist."""
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, errors="coerce", utc=True, format="ISO8601")
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def _read(path: str, signature: tuple[int, int], defaults: tuple[tuple[str, str], ...], parse_ts: str) -> pd.DataFrame:
+    # signature is unused in the body; it is part of the cache key so a changed file misses.
+    try:
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    except (pd.errors.EmptyDataError, pd.errors.ParserError):
+        return pd.DataFrame(columns=[k for k, _ in defaults])
+    for col, value in defaults:
+        if col not in df.columns:
+            df[col] = value
+    if parse_ts and "timestamp" in df.columns:
+        df[parse_ts] = parse_timestamps(df["timestamp"])
+    return df
+
+
+def load_csv(path: Path, defaults: Optional[dict] = None, parse_ts: str = "timestamp") -> pd.DataFrame:
+    """Cached read of any data CSV. parse_ts: column that receives the parsed timestamp ("" to skip)."""
+    sig = file_signature(path)
+    if sig is None:
+        return pd.DataFrame()
+    return _read(str(path), sig, tuple((defaults or {}).items()), parse_ts)
+
+
+def load_incidents() -> pd.DataFrame:
+    return load_csv(INCIDENTS_PATH, INCIDENT_DEFAULTS)
+
+
+def load_audit(kind: str = "simple") -> pd.DataFrame:
+    if kind not in AUDIT_PATHS:
+        raise ValueError(f"Unknown audit log '{kind}'. Choose from {list(AUDIT_PATHS)}")
+    return load_csv(AUDIT_PATHS[kind])
+
+
+class TailFrame:
+    """DataFrame kept current from a CsvTail; each frame() call parses only rows appended since the last."""
+
+    def __init__(self, path: Path, defaults: dict, parse_ts: str = "_ts"):
+        self.tail = CsvTail(path)
+        self.defaults = defaults
+        self.parse_ts = parse_ts
+        self._frame = self._empty()
+        self._lock = threading.Lock()
+
+    def _empty(self) -> pd.DataFrame:
+        return pd.DataFrame(columns=list(self.defaults) + [self.parse_ts])
+
+    def _to_frame(self, body: bytes) -> pd.DataFrame:
+        df = pd.read_csv(io.BytesIO(body), header=None, names=self.tail.header, dtype=str,
+                         keep_default_na=False, index_col=False)
+        for col, value in self.defaults.items():
+            if col not in df.columns:
+                df[col] = value
+        df[self.parse_ts] = parse_timestamps(df["timestamp"]) if "timestamp" in df.columns else pd.NaT
+        return df
+
+    def frame(self) -> pd.DataFrame:
+        with self._lock:
+            parts = []
+            while True:
+                reset, body = self.tail.read(TAIL_READ_BYTES)
+                if reset:
+                    self._frame, parts = self._empty(), []
+                if not body:
+                    break
+                parts.append(self._to_frame(body))
+            if parts:
+                self._frame = pd.concat(parts if self._frame.empty else [self._frame, *parts], ignore_index=True)
+            return self._frame.copy(deep=False)
+
+
+def fill_ticket_numbers(df: pd.DataFrame) -> pd.DataFrame:
+    """Give rows logged before their run's ticket existed the ticket number stamped later."""
+    tickets = load_csv(RUN_TICKETS_PATH, parse_ts="")
+    if df.empty or tickets.empty:
+        return df
+    stamped = df["run_id"].map(dict(zip(tickets["run_id"], tickets["ticket_number"])))
+    missing = (df["ticket_number"] == "") & stamped.notna()
+    if missing.any():
+        df = df.copy(deep=False)
+        df["ticket_number"] = df["ticket_number"].mask(missing, stamped)
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def _trace_frame(path: str) -> TailFrame:
+    return TailFrame(Path(path), TRACE_DEFAULTS)
+
+
+def load_trace() -> pd.DataFrame:
+    return fill_ticket_numbers(_trace_frame(str(TRACE_PATH)).frame())
@@ -0,0 +1,133 @@
+"""
+Live trace feed for the Streamlit pages. One background connection per UI process to the
+orchestrator's GET /stream/trace (Server-Sent Events), shared by every browser session through
+st.cache_resource. Seeded once from the last few MB of trace.csv, then updated by pushed rows and by
+rows appended to trace.csv (followed with CsvTail): steps logged inside the UI process itself, e.g.
+5_Simulate without the API, never reach the orchestrator's stream. Rows seen on both paths are kept once.
+Pages block in wait_for_change() instead of sleeping and re-reading the file; while the
+orchestrator is unreachable `connected` is False and pages fall back to reading trace.csv.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import httpx
+import pandas as pd
+import streamlit as st
+
+from shared.config_loader import get_env
+from shared.csv_tail import CsvTail
+from shared.trace import FIELDS, TRACE_PATH
+from ui.components.data import fill_ticket_numbers, parse_timestamps
+
+MAX_ROWS = 5000
+SEED_BYTES = 4 * 1024 * 1024
+RECONNECT_MAX_SECONDS = 30.0
+TAIL_POLL_SECONDS = 1.0
+
+
+def orchestrator_url() -> str:
+    return (get_env("ORCHESTRATOR_BASE_URL") or "http://127.0.0.1:8000").rstrip("/")
+
+
+def _key(row: dict) -> tuple:
+    return tuple(str(row.get(k, "")) for k in ("timestamp", "run_id", "step_order", "agent", "outcome", "decision"))
+
+
+class TraceStream:
+    def __init__(self, base_url: str, max_rows: int = MAX_ROWS):
+        self.base_url = base_url
+        self.connected = False
+        self.version = 0
+        self._rows: deque[dict] = deque(maxlen=max_rows)
+        self._keys: set[tuple] = set()
+        self._cond = threading.Condition()
+        self._tail = CsvTail(TRACE_PATH, start_bytes=SEED_BYTES)
+        self._add_rows(self._tail.dicts(self._tail.poll()[1])[-max_rows:])
+        threading.Thread(target=self._run, name="trace-stream", daemon=True).start()
+        threading.Thread(target=self._follow, name="trace-tail", daemon=True).start()
+
+    def _add_rows(self, rows: list[dict], replace: bool = False) -> None:
+        """Append rows not held yet (replace: start over from rows); wakes waiting pages if anything changed."""
+        with self._cond:
+            added = 0
+            if replace:
+                self._rows.clear()
+                self._keys.clear()
+                added = 1
+            for row in rows:
+                row = {k: "" if row.get(k) is None else str(row.get(k)) for k in FIELDS}
+                key = _key(row)
+                if key in self._keys:
+                    continue
+                if len(self._rows) == self._rows.maxlen:
+                    self._keys.discard(_key(self._rows[0]))
+                self._rows.append(row)
+                self._keys.add(key)
+                added += 1
+            if added:
+                self.version += 1
+                self._cond.notify_all()
+
+    def _set_connected(self, value: bool) -> None:
+        with self._cond:
+            if self.connected != value:
+                self.connected = value
+                self.version += 1
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            try:
+                # Replay the server's recent buffer on every (re)connect; rows already held are skipped.
+                timeout = httpx.Timeout(5.0, read=60.0)
+                with httpx.stream("GET", f"{self.base_url}/stream/trace", params={"since": 0}, timeout=timeout) as r:
+                    r.raise_for_status()
+                    self._set_connected(True)
+                    backoff = 1.0
+                    data: list[str] = []
+                    for line in r.iter_lines():
+                        if line.startswith("data:"):
+                            data.append(line[5:].strip())
+                        elif not line and data:
+                            self._add_rows([json.loads("\n".join(data))])
+                            data = []
+            except (httpx.HTTPError, ValueError):
+                pass
+            self._set_connected(False)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+
+    def _follow(self) -> None:
+        while True:
+            time.sleep(TAIL_POLL_SECONDS)
+            try:
+                reset, rows = self._tail.poll()
+            except (OSError, UnicodeDecodeError):
+                continue
+            # Every logged step is in the file, so after a rewrite the re-read window replaces what is held.
+            if rows or reset:
+                self._add_rows(self._tail.dicts(rows)[-self._rows.maxlen:], replace=reset)
+
+    def frame(self) -> pd.DataFrame:
+        with self._cond:
+            rows = list(self._rows)
+        df = pd.DataFrame(rows, columns=FIELDS).fillna("")
+        df["_ts"] = parse_timestamps(df["timestamp"])
+        return fill_ticket_numbers(df)
+
+    def wait_for_change(self, version: int, timeout: float) -> int:
+        """Block until a row is pushed (or the connection state changes) after `version`, or timeout."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+@st.cache_resource(show_spinner=False)
+def get_trace_stream(base_url: Optional[str] = None) -> TraceStream:
+    return TraceStream(base_url or orchestrator_url())
@@ -8,35 +8,15 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
 import streamlit as st
-import pandas as pd
-from shared.config_loader import DATA_DIR
-from shared.trace import TRACE_PATH
+from ui.components.data import load_audit, load_incidents, load_trace
 
 st.title("Overview")
 st.caption("Dashboard — key metrics, incident status, and recent pipeline activity.")
 
-incidents_path = DATA_DIR / "incidents" / "incidents.csv"
-audit_path = DATA_DIR / "audit" / "simple.csv"
-
 # ── Load data ─────────────────────────────────────────────────────────
-df_inc = pd.DataFrame()
-if incidents_path.exists():
-    df_inc = pd.read_csv(incidents_path, dtype=str).fillna("")
-    if "timestamp" in df_inc.columns:
-        df_inc["timestamp"] = pd.to_datetime(df_inc["timestamp"], errors="coerce")
-    for col in ("status", "severity", "ticket_number", "ticket_system"):
-        if col not in df_inc.columns:
-            df_inc[col] = "open" if col == "status" else ""
-
-df_audit = pd.DataFrame()
-if audit_path.exists():
-    df_audit = pd.read_csv(audit_path, dtype=str).fillna("")
-    if "timestamp" in df_audit.columns:
-        df_audit["timestamp"] = pd.to_datetime(df_audit["timestamp"], errors="coerce")
-
-df_trace = pd.DataFrame()
-if TRACE_PATH.exists():
-    df_trace = pd.read_csv(TRACE_PATH, dtype=str).fillna("")
+df_inc = load_incidents()
+df_audit = load_audit("simple")
+df_trace = load_trace()
 
 # ── KPI Metrics ───────────────────────────────────────────────────────
 st.markdown("### Key Metrics")
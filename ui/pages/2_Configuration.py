@@ -11,7 +11,7 @@ sys.path.insert(0, str(ROOT))
 import asyncio
 import streamlit as st
 import yaml
-from shared.config_loader import CONFIG_DIR, get_env, get_services_config, get_integrations_config
+from shared.config_loader import CONFIG_DIR, get_env
 
 # Local integration credentials (UI-configured); fallback if loader was cached before these existed
 try:
@@ -80,7 +80,7 @@ with tab1:
             st.info("No agents in config.")
     else:
         with st.form("agents_form"):
-            new_agents = {}
+            new_agents = dict(agents_data)
             for agent_name, agent_cfg in agents_data.items():
                 if not isinstance(agent_cfg, dict):
                     continue
@@ -89,10 +89,11 @@ with tab1:
                     enabled = st.checkbox("Enabled", value=bool(agent_cfg.get("enabled", True)), key=f"agents_{agent_name}_enabled")
                     timeout_seconds = st.number_input("Timeout (seconds)", min_value=1, value=int(agent_cfg.get("timeout_seconds", 30)), key=f"agents_{agent_name}_timeout")
                     description = st.text_input("Description", value=str(agent_cfg.get("description", "")), key=f"agents_{agent_name}_description")
-                new_agents[agent_name] = {"identity": identity, "enabled": enabled, "timeout_seconds": timeout_seconds, "description": description}
+                # Keep agent-specific keys (rca_mode, correlation_*, anomaly, ...) the form does not edit.
+                new_agents[agent_name] = {**agent_cfg, "identity": identity, "enabled": enabled, "timeout_seconds": timeout_seconds, "description": description}
 
             if st.form_submit_button("Save to agents.yaml"):
-                save_yaml(agents_path, {"agents": new_agents})
+                save_yaml(agents_path, {**data, "agents": new_agents})
                 st.success("Saved agents.yaml")
                 st.rerun()
 
@@ -209,7 +210,7 @@ with tab3:
     else:
         with st.form("integrations_form"):
             new_int = {}
-            new_local = dict(local_creds)
+            new_local = {k: dict(v) if isinstance(v, dict) else v for k, v in local_creds.items()}
             for name, cfg in (data or {}).items():
                 if not isinstance(cfg, dict):
                     continue
@@ -18,6 +18,7 @@ TABLES = {
     "severity_priority": "severity_priority.csv",
     "maintenance_windows": "maintenance_windows.csv",
     "services": "services.csv",
+    "service_dependencies": "service_dependencies.csv",
     "category_mapping": "category_mapping.csv",
     "assignment_routing": "assignment_routing.csv",
 }
@@ -1,5 +1,5 @@
 """
-Tickets hub: list incidents (from local CSV); per-ticket workflow button + close action.
+Tickets hub: list incidents (paged from the orchestrator read API); per-ticket workflow button + close action.
 Master tickets are visually tagged; child tickets are indented under their parent.
 Closing a master ticket cascades to all children.
 """
@@ -11,32 +11,53 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
 import streamlit as st
-import pandas as pd
 import requests
-from shared.config_loader import DATA_DIR, get_integration_credentials, get_env
-from shared.trace import TRACE_PATH
+import pandas as pd
+from shared.config_loader import get_integration_credentials, get_env
 
 st.title("Tickets")
 st.caption("Incidents and ITSM tickets. Master tickets show linked children. Click **View Workflow** to see the full pipeline trace.")
 
-incidents_path = DATA_DIR / "incidents" / "incidents.csv"
-if not incidents_path.exists():
-    st.info("No incidents yet. Use **Simulate issues** to create some.")
-    st.stop()
+ORCH_URL = (get_env("ORCHESTRATOR_BASE_URL")
+            or os.environ.get("ORCHESTRATOR_BASE_URL")
+            or "http://127.0.0.1:8000").rstrip("/")
 
-df = pd.read_csv(incidents_path, dtype=str).fillna("")
-if df.empty:
-    st.info("No incidents yet.")
-    st.stop()
+SEV_COLORS = {
+    "critical": "#e74c3c", "high": "#e67e22", "medium": "#f1c40f", "low": "#2ecc71",
+}
+CARD_FIELDS = ("incident_id,ticket_number,ticket_id,ticket_system,severity,service,summary,status,"
+               "timestamp,parent_incident_id,parent_ticket_number,run_id")
+PAGE_SIZES = [25, 50, 100]
+MAX_CHILDREN = 500
+_SORTS = {
+    "timestamp (newest first)": ("", "desc"),
+    "timestamp (oldest first)": ("", "asc"),
+    "severity": ("severity", "asc"),
+    "service": ("service", "asc"),
+    "summary": ("summary", "asc"),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _local_store():
+    from orchestrator.read_store import ReadStore
+    return ReadStore()
 
-if "timestamp" in df.columns:
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-    df = df.sort_values("timestamp", ascending=False)
 
-for col in ("ticket_id", "ticket_system", "ticket_number", "status",
-            "parent_incident_id", "parent_ticket_number"):
-    if col not in df.columns:
-        df[col] = "open" if col == "status" else ""
+def _incidents(severity: str = "", parent_incident_id: str = "", top_level: bool = False,
+               sort: str = "", order: str = "desc", cursor: str = "", limit: int = 50) -> dict:
+    """One page from GET /incidents; served in-process from the same store if the orchestrator is down."""
+    params = {"severity": severity, "parent_incident_id": parent_incident_id, "top_level": top_level,
+              "sort": sort, "order": order, "cursor": cursor, "limit": limit, "fields": CARD_FIELDS}
+    try:
+        r = requests.get(f"{ORCH_URL}/incidents", params={k: v for k, v in params.items() if v}, timeout=10)
+        r.raise_for_status()
+        return r.json()
+    except requests.RequestException:
+        filters = {"severity": [severity] if severity else [],
+                   "parent_incident_id": [parent_incident_id] if parent_incident_id else []}
+        return _local_store().list_incidents(filters, cursor or None, limit, sort, order == "desc",
+                                             CARD_FIELDS.split(","), top_level)
 
 
 def _ticket_url(row):
@@ -55,49 +76,31 @@ def _ticket_url(row):
     return None
 
 
-df["ticket_link"] = df.apply(_ticket_url, axis=1)
-
-_trace_map: dict[str, str] = {}
-if TRACE_PATH.exists():
-    try:
-        tdf = pd.read_csv(TRACE_PATH, dtype=str, usecols=["run_id", "incident_id"]).fillna("")
-        for _, trow in tdf.drop_duplicates("incident_id").iterrows():
-            iid = trow["incident_id"]
-            if iid:
-                _trace_map[iid] = trow["run_id"]
-    except Exception:
-        pass
-
 # ── Filters ───────────────────────────────────────────────────────────
-col_s, col_f = st.columns([2, 1])
+col_s, col_f, col_n = st.columns([2, 1, 1])
 with col_s:
-    sort_option = st.selectbox("Sort by", [
-        "timestamp (newest first)", "timestamp (oldest first)",
-        "severity", "service", "summary",
-    ])
+    sort_option = st.selectbox("Sort by", list(_SORTS))
 with col_f:
-    sev_options = sorted(df["severity"].dropna().unique().tolist())
-    status_filter = st.selectbox("Filter severity", ["All"] + sev_options)
-
-if sort_option == "timestamp (oldest first)" and "timestamp" in df.columns:
-    df = df.sort_values("timestamp", ascending=True)
-elif sort_option == "severity" and "severity" in df.columns:
-    df = df.sort_values("severity", ascending=True)
-elif sort_option == "service" and "service" in df.columns:
-    df = df.sort_values("service", ascending=True)
-elif sort_option == "summary" and "summary" in df.columns:
-    df = df.sort_values("summary", ascending=True)
-
-if status_filter != "All":
-    df = df[df["severity"] == status_filter]
-
-SEV_COLORS = {
-    "critical": "#e74c3c", "high": "#e67e22", "medium": "#f1c40f", "low": "#2ecc71",
-}
-
-ORCH_URL = (get_env("ORCHESTRATOR_BASE_URL")
-            or os.environ.get("ORCHESTRATOR_BASE_URL")
-            or "http://127.0.0.1:8000").rstrip("/")
+    status_filter = st.selectbox("Filter severity", ["All"] + list(SEV_COLORS))
+with col_n:
+    page_size = st.selectbox("Per page", PAGE_SIZES, index=0)
+
+sort_field, sort_order = _SORTS[sort_option]
+severity = "" if status_filter == "All" else status_filter
+
+# Cursor stack for back/forward paging; any filter change starts again at page 1.
+view_key = (sort_option, status_filter, page_size)
+if st.session_state.get("tk_view") != view_key:
+    st.session_state["tk_view"] = view_key
+    st.session_state["tk_cursors"] = [""]
+cursors = st.session_state["tk_cursors"]
+
+page = _incidents(severity=severity, top_level=True, sort=sort_field, order=sort_order,
+                  cursor=cursors[-1], limit=page_size)
+if not page["items"] and len(cursors) == 1:
+    st.info("No incidents yet. Use **Simulate issues** to create some." if not severity
+            else f"No {severity} incidents.")
+    st.stop()
 
 
 def _render_ticket_card(row, indent: bool = False, key_prefix: str = ""):
@@ -110,7 +113,7 @@ def _render_ticket_card(row, indent: bool = False, key_prefix: str = ""):
     summary = row.get("summary", "")
     status = (row.get("status", "open") or "open").lower()
     ts = row.get("timestamp", "")
-    link = row.get("ticket_link") or ""
+    link = _ticket_url(row) or ""
     display_id = t_num or inc_id
     is_master = (row.get("parent_incident_id", "") or "").strip() == "SELF"
 
@@ -149,7 +152,7 @@ def _render_ticket_card(row, indent: bool = False, key_prefix: str = ""):
     )
 
     btn_cols = st.columns([1, 1, 1, 3])
-    run_id = _trace_map.get(inc_id, "")
+    run_id = row.get("run_id", "")
 
     with btn_cols[0]:
         if run_id:
@@ -195,32 +198,35 @@ def _render_ticket_card(row, indent: bool = False, key_prefix: str = ""):
 # ── Build ordered display list ────────────────────────────────────────
 st.markdown("---")
 
-masters = df[df["parent_incident_id"] == "SELF"]
-children_df = df[(df["parent_incident_id"] != "") & (df["parent_incident_id"] != "SELF")]
-standalone = df[(df["parent_incident_id"] == "") | (~df["parent_incident_id"].isin(["SELF"]) &
-               ~df["incident_id"].isin(children_df["incident_id"]))]
-standalone = standalone[standalone["parent_incident_id"] != "SELF"]
-standalone = standalone[~standalone["incident_id"].isin(children_df["incident_id"])]
-
-rendered_ids = set()
-
-for _, m_row in masters.iterrows():
-    _render_ticket_card(m_row, indent=False, key_prefix="m_")
-    rendered_ids.add(m_row["incident_id"])
-
-    m_id = m_row["incident_id"]
-    kids = children_df[children_df["parent_incident_id"] == m_id]
-    for _, c_row in kids.iterrows():
-        _render_ticket_card(c_row, indent=True, key_prefix="c_")
-        rendered_ids.add(c_row["incident_id"])
-
-    st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
-
-remaining = df[~df["incident_id"].isin(rendered_ids)]
-for _, row in remaining.iterrows():
-    _render_ticket_card(row, indent=False, key_prefix="s_")
-
-# ── Full table (collapsible) ─────────────────────────────────────────
-with st.expander("Raw incidents table"):
-    show_cols = [c for c in df.columns if c != "ticket_link"]
-    st.dataframe(df[show_cols], use_container_width=True, hide_index=True)
+shown = []
+for row in page["items"]:
+    is_master = row.get("parent_incident_id") == "SELF"
+    _render_ticket_card(row, indent=False, key_prefix="m_" if is_master else "s_")
+    shown.append(row)
+    if row.get("parent_incident_id") not in ("", "SELF"):
+        # A child listed on its own: its master does not match the severity filter.
+        st.caption(f"Child of {row.get('parent_ticket_number') or row.get('parent_incident_id')} "
+                   "(master has a different severity)")
+    if is_master:
+        kids = _incidents(severity=severity, parent_incident_id=row["incident_id"], limit=MAX_CHILDREN)["items"]
+        for c_row in kids:
+            _render_ticket_card(c_row, indent=True, key_prefix="c_")
+        shown.extend(kids)
+        st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
+
+# ── Paging ────────────────────────────────────────────────────────────
+p_prev, p_info, p_next = st.columns([1, 2, 1])
+with p_prev:
+    if len(cursors) > 1 and st.button("◀ Previous", key="tk_prev"):
+        cursors.pop()
+        st.rerun()
+with p_info:
+    st.caption(f"Page {len(cursors)} · {len(page['items'])} top-level tickets")
+with p_next:
+    if page["next_cursor"] and st.button("Next ▶", key="tk_next"):
+        cursors.append(page["next_cursor"])
+        st.rerun()
+
+# ── Page table (collapsible) ─────────────────────────────────────────
+with st.expander("Raw incidents table (this page)"):
+    st.dataframe(pd.DataFrame(shown), use_container_width=True, hide_index=True)
@@ -10,14 +10,13 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
 import streamlit as st
-import pandas as pd
-from shared.config_loader import DATA_DIR
 from shared.trace import TRACE_PATH
+from ui.components.data import AUDIT_PATHS, load_audit, load_trace
 
 st.title("Logs")
 st.caption("Simple audit trail and comprehensive pipeline trace.")
 
-SIMPLE_PATH = DATA_DIR / "audit" / "simple.csv"
+SIMPLE_PATH = AUDIT_PATHS["simple"]
 
 # ── CSS ───────────────────────────────────────────────────────────────
 st.markdown("""<style>
@@ -63,12 +62,11 @@ with tab_simple:
     if not SIMPLE_PATH.exists():
         st.info("No simple audit log yet. Run a simulation first.")
     else:
-        df_s = pd.read_csv(SIMPLE_PATH, dtype=str).fillna("")
+        df_s = load_audit("simple")
         if df_s.empty:
             st.info("Audit log is empty.")
         else:
             if "timestamp" in df_s.columns:
-                df_s["timestamp"] = pd.to_datetime(df_s["timestamp"], errors="coerce")
                 df_s = df_s.sort_values("timestamp", ascending=False)
 
             fc1, fc2, fc3, fc4 = st.columns(4)
@@ -115,15 +113,11 @@ with tab_comp:
     if not TRACE_PATH.exists():
         st.info("No pipeline trace yet. Run a simulation first.")
     else:
-        df_t = pd.read_csv(TRACE_PATH, dtype=str).fillna("")
+        df_t = load_trace()
         if df_t.empty:
             st.info("Trace is empty.")
         else:
-            if "ticket_number" not in df_t.columns:
-                df_t["ticket_number"] = ""
-            if "timestamp" in df_t.columns:
-                df_t["timestamp"] = pd.to_datetime(df_t["timestamp"], errors="coerce")
-                df_t = df_t.sort_values("timestamp", ascending=False)
+            df_t = df_t.sort_values("_ts", ascending=False)
 
             # Skip "started" rows — they're just invoke markers
             df_t = df_t[df_t["outcome"] != "started"]
@@ -149,8 +143,8 @@ with tab_comp:
             if t_ticket != "All":
                 df_t = df_t[df_t["ticket_number"] == t_ticket]
 
-            if t_sort == "Oldest first" and "timestamp" in df_t.columns:
-                df_t = df_t.sort_values("timestamp", ascending=True)
+            if t_sort == "Oldest first":
+                df_t = df_t.sort_values("_ts", ascending=True)
             elif t_sort == "Agent":
                 df_t = df_t.sort_values("agent")
             elif t_sort == "Outcome":
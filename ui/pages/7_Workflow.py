@@ -1,6 +1,8 @@
 """
 Workflow — real-time pipeline trace for a single ticket / incident.
 Split layout: left = compact flow nodes, right = expanded detail for selected step.
+Auto-refresh redraws as soon as the trace stream reports a new step (polling every interval while it
+is down); each redraw reads only the rows appended to trace.csv since the last (load_trace).
 """
 import sys
 import time
@@ -11,7 +13,8 @@ sys.path.insert(0, str(ROOT))
 
 import streamlit as st
 import pandas as pd
-from shared.trace import TRACE_PATH
+from ui.components.data import load_trace
+from ui.components.trace_stream import get_trace_stream
 
 # ── CSS ───────────────────────────────────────────────────────────────
 st.markdown("""<style>
@@ -52,12 +55,6 @@ st.markdown("""<style>
 </style>""", unsafe_allow_html=True)
 
 
-def _load() -> pd.DataFrame:
-    if not TRACE_PATH.exists():
-        return pd.DataFrame()
-    return pd.read_csv(TRACE_PATH, dtype=str).fillna("")
-
-
 ICONS = {
     "Collector": "📥", "Evaluator": "📊", "Alert Router": "🚦",
     "Incident Creator": "🆕", "Notifier": "📢", "Ticket Writer": "🎫",
@@ -92,7 +89,9 @@ def _c(o: str) -> str:
 params = st.query_params
 ticket_param = params.get("ticket", "")
 
-df_all = _load()
+stream = get_trace_stream()
+stream_version = stream.version
+df_all = load_trace().drop(columns="_ts", errors="ignore")
 if df_all.empty:
     st.info("No pipeline traces yet. Run a simulation to generate trace data.")
     st.stop()
@@ -260,5 +259,9 @@ if not ticket_param:
     _RM = {"Off": 0, "3 s": 3, "5 s": 5, "10 s": 10}
     iv = _RM.get(refresh_sec, 0)
     if iv > 0:
-        time.sleep(iv)
+        # With the stream up, redraw as soon as a step arrives (at least every 30 s); otherwise poll.
+        if stream.connected:
+            stream.wait_for_change(stream_version, timeout=30)
+        else:
+            time.sleep(iv)
         st.rerun()
@@ -9,29 +9,14 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
 import streamlit as st
-import pandas as pd
-from shared.config_loader import DATA_DIR
-from shared.trace import TRACE_PATH
+from ui.components.data import load_incidents, load_trace
 
 st.title("Insights & Dependency Graphs")
 st.caption("Visual analytics: ticket relationships, category breakdowns, severity trends, and agent activity.")
 
-incidents_path = DATA_DIR / "incidents" / "incidents.csv"
-
 # ── Load data ─────────────────────────────────────────────────────────
-df = pd.DataFrame()
-if incidents_path.exists():
-    df = pd.read_csv(incidents_path, dtype=str).fillna("")
-    if "timestamp" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-    for col in ("status", "severity", "parent_incident_id", "parent_ticket_number",
-                "ticket_number", "service", "summary"):
-        if col not in df.columns:
-            df[col] = ""
-
-df_trace = pd.DataFrame()
-if TRACE_PATH.exists():
-    df_trace = pd.read_csv(TRACE_PATH, dtype=str).fillna("")
+df = load_incidents()
+df_trace = load_trace()
 
 if df.empty:
     st.info("No incidents yet. Run some simulations first.")
@@ -1,6 +1,8 @@
 """
 Live Pipeline — real-time view of the orchestrator processing events.
-Always-on polling: detects new pipeline runs as soon as they appear.
+Steps are pushed from the orchestrator (GET /stream/trace) or appear in trace.csv (runs started in
+this process, e.g. Simulate without the API); the page redraws when a new step arrives.
+Falls back to polling trace.csv while the orchestrator is unreachable.
 Nodes materialise progressively as each agent makes decisions; the active step pulses.
 """
 import sys
@@ -14,6 +16,8 @@ sys.path.insert(0, str(ROOT))
 import streamlit as st
 import pandas as pd
 from shared.trace import TRACE_PATH
+from ui.components.data import load_trace
+from ui.components.trace_stream import get_trace_stream
 
 # ═══════════════════════════════════════════════════════════════════════
 # CSS
@@ -160,6 +164,7 @@ EXPECTED_AGENTS = [
 
 _RATES = {"1s": 1, "2s": 2, "3s": 3, "5s": 5}
 REFRESH_DEFAULT = "2s"
+STREAM_IDLE_RERUN_SECONDS = 30
 
 
 def _outcome_class(outcome: str) -> str:
@@ -192,13 +197,14 @@ def _badge_class(outcome: str) -> str:
     return "bg-default"
 
 
+stream = get_trace_stream()
+stream_version = stream.version
+
+
 def _load() -> pd.DataFrame:
-    if not TRACE_PATH.exists():
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(TRACE_PATH, dtype=str).fillna("")
-    except Exception:
-        return pd.DataFrame()
+    if stream.connected:
+        return stream.frame()
+    return load_trace()
 
 
 def _file_mtime() -> float:
@@ -235,19 +241,30 @@ st.caption("Always-on monitoring. Automatically detects new events and shows age
 
 ctrl1, ctrl2, ctrl3 = st.columns([2, 1, 2])
 with ctrl1:
-    refresh_rate = st.selectbox("Polling interval", list(_RATES.keys()),
+    refresh_rate = st.selectbox("Fallback polling interval", list(_RATES.keys()),
                                 index=list(_RATES.keys()).index(REFRESH_DEFAULT), key="lp_rf")
 with ctrl2:
     st.markdown("<div style='height:28px;'></div>", unsafe_allow_html=True)
     following_latest = st.session_state["lp_pinned_run"] is None
+    source = "pushed" if stream.connected else "polling trace.csv"
     if following_latest:
-        st.markdown('<span><span class="live-dot"></span> <b>LIVE</b> — auto-following latest</span>',
+        st.markdown(f'<span><span class="live-dot"></span> <b>LIVE</b> — auto-following latest ({source})</span>',
                     unsafe_allow_html=True)
     else:
         st.markdown(
             f'<span><span class="pin-dot"></span> <b>PINNED</b> — {st.session_state["lp_pinned_run"][:20]}</span>',
             unsafe_allow_html=True)
 
+
+
+def _wait_and_rerun() -> None:
+    if stream.connected:
+        stream.wait_for_change(stream_version, timeout=STREAM_IDLE_RERUN_SECONDS)
+    else:
+        time.sleep(_RATES.get(refresh_rate, 2))
+    st.rerun()
+
+
 # ── Load data ─────────────────────────────────────────────────────────
 df_all = _load()
 
@@ -259,11 +276,9 @@ if df_all.empty:
         '<p>Trigger a simulation or send an event to the orchestrator.<br>'
         'This page will automatically show the pipeline when it starts.</p>'
         '</div>', unsafe_allow_html=True)
-    time.sleep(_RATES.get(refresh_rate, 2))
-    st.rerun()
+    _wait_and_rerun()
 
 # ── Build recent runs list ────────────────────────────────────────────
-df_all["_ts"] = pd.to_datetime(df_all["timestamp"], errors="coerce") if "timestamp" in df_all.columns else pd.NaT
 run_latest = df_all.groupby("run_id")["_ts"].max().sort_values(ascending=False).head(20)
 
 latest_run_id = run_latest.index[0] if len(run_latest) > 0 else ""
@@ -325,8 +340,7 @@ if run_df.empty:
         '<h3>📡 Listening for events...</h3>'
         '<p>No active pipeline. Trigger a simulation — nodes will appear here automatically.</p>'
         '</div>', unsafe_allow_html=True)
-    time.sleep(_RATES.get(refresh_rate, 2))
-    st.rerun()
+    _wait_and_rerun()
 
 # Build step map
 steps_map: dict[int, dict] = {}
@@ -486,8 +500,6 @@ with st.expander("Raw trace data"):
     st.dataframe(run_df[show_cols], use_container_width=True, hide_index=True)
 
 # ═══════════════════════════════════════════════════════════════════════
-# ALWAYS poll — this is the key: never stop refreshing
+# ALWAYS refresh — block until the next pushed step (or poll the file when offline)
 # ═══════════════════════════════════════════════════════════════════════
-iv = _RATES.get(refresh_rate, 2)
-time.sleep(iv)
-st.rerun()
+_wait_and_rerun()